@@ -3,8 +3,16 @@
 
 """slurmq - Slurm GPU quota monitoring and management."""
 
-from importlib.metadata import version
 
+def __getattr__(name: str) -> str:
+    """Resolve __version__/VERSION on first access.
 
-__version__ = version("slurmq")
-VERSION = __version__
+    importlib.metadata is slow to import and only `slurmq --version` needs it.
+    """
+    if name in ("__version__", "VERSION"):
+        from importlib.metadata import version  # noqa: PLC0415 - deferred for CLI startup time
+
+        value = globals()["__version__"] = globals()["VERSION"] = version("slurmq")
+        return value
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
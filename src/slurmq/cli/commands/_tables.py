@@ -0,0 +1,64 @@
+# Copyright (c) 2025 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Shared rich table rendering for per-user quota usage (monitor and report)."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from slurmq.core.models import QuotaStatus
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from rich.table import Column, Table
+
+# (user, used GPU-hours, remaining GPU-hours, usage fraction, status, active jobs cell)
+UsageRow = tuple[str, float, float, float, QuotaStatus, str]
+
+# (style, icon) for each quota status
+STATUS_RENDER: dict[QuotaStatus, tuple[str, str]] = {
+    QuotaStatus.OK: ("green", "ok"),
+    QuotaStatus.WARNING: ("yellow", "!"),
+    QuotaStatus.EXCEEDED: ("red", "x"),
+}
+
+
+def usage_columns(active_label: str) -> list[Column]:
+    """Column schema for a usage table, reusable across build_usage_table calls."""
+    from rich.table import Column
+
+    return [
+        Column("User", style="cyan"),
+        Column("Used (GPU-hrs)", justify="right"),
+        Column("Remaining", justify="right"),
+        Column("Usage %", justify="right"),
+        Column("Status", justify="center"),
+        Column(active_label, justify="right"),
+    ]
+
+
+def build_usage_table(rows: Iterable[UsageRow], title: str, columns: list[Column]) -> Table:
+    """Build a usage table from row tuples.
+
+    Each table gets empty copies of the columns, since rich stores cells on the columns.
+    """
+    from rich.table import Table
+
+    table = Table(*(column.copy() for column in columns), title=title)
+
+    add_row = table.add_row
+    for user, used, remaining, usage, status, active in rows:
+        style, icon = STATUS_RENDER[status]
+        add_row(
+            user,
+            f"{used:.1f}",
+            f"[{style}]{remaining:.1f}[/{style}]",
+            f"[{style}]{usage * 100:.0f}%[/{style}]",
+            f"[{style}]{icon}[/{style}]",
+            active,
+        )
+
+    return table
@@ -8,6 +8,7 @@ from __future__ import annotations
 import json
 import os
 import subprocess
+import sys
 from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
@@ -99,7 +100,7 @@ def check(
         cluster = cli_ctx.cluster
     except ValueError as e:
         if cli_ctx.json_output:
-            console.print(json.dumps({"error": str(e)}))
+            sys.stdout.write(json.dumps({"error": str(e)}) + "\n")
         else:
             console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1) from None
@@ -114,11 +115,16 @@ def check(
     # Fetch jobs from SLURM (with CLI overrides)
     try:
         records = fetch_user_jobs(
-            target_user, cluster, qos_override=qos, account_override=account, partition_override=partition
+            target_user,
+            cluster,
+            qos_override=qos,
+            account_override=account,
+            partition_override=partition,
+            use_cache=True,
         )
     except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
         if cli_ctx.json_output:
-            console.print(json.dumps({"error": str(e)}))
+            sys.stdout.write(json.dumps({"error": str(e)}) + "\n")
         else:
             console.print(f"[red]Error fetching Slurm data:[/red] {e}")
         raise typer.Exit(1) from None
@@ -152,7 +158,7 @@ def _report_to_dict(report: UsageReport) -> dict:
 
 def _output_json(report: UsageReport) -> None:
     """Output report as JSON."""
-    console.print(json.dumps(_report_to_dict(report), indent=2))
+    sys.stdout.write(json.dumps(_report_to_dict(report), indent=2) + "\n")
 
 
 def _output_yaml(report: UsageReport) -> None:
@@ -7,17 +7,14 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+import re
 import sys
-import tomllib
 from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Confirm, IntPrompt, Prompt
-import tomli_w
 import typer
 
-from slurmq.core.config import ClusterConfig, SlurmqConfig, get_config_path, validate_config
+from slurmq.core.config import ClusterConfig, SlurmqConfig, get_config_path, load_toml, save_toml, validate_config
 
 
 if TYPE_CHECKING:
@@ -28,6 +25,12 @@ console = Console()
 # Type alias for TOML-compatible config values
 ConfigValue = str | int | float | bool
 
+# Common literal forms recognised by _parse_value without a try/except
+_BOOL_TRUE = frozenset({"true", "yes", "on"})
+_BOOL_FALSE = frozenset({"false", "no", "off"})
+_INT_RE = re.compile(r"[+-]?\d+")
+_FLOAT_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
 
 def register_config_commands(app: typer.Typer) -> None:
     """Register config commands with the CLI app."""
@@ -42,6 +45,8 @@ def register_config_commands(app: typer.Typer) -> None:
 
 def show(ctx: typer.Context) -> None:
     """Show current configuration."""
+    from rich.panel import Panel
+
     config: SlurmqConfig = ctx.obj.config
 
     lines = [
@@ -82,6 +87,8 @@ def path() -> None:
 
 def init() -> None:
     """Initialize configuration interactively."""
+    from rich.prompt import Confirm, IntPrompt, Prompt
+
     config_path = get_config_path()
 
     # Check if config exists
@@ -136,17 +143,15 @@ def set_value(
         console.print("Run [bold]slurmq config init[/bold] first.")
         raise typer.Exit(1)
 
-    # Load existing config as dict
-    with config_path.open("rb") as f:
-        data = tomllib.load(f)
+    # Load existing config as dict (reuses the parse if the file is unchanged)
+    data = load_toml(config_path)
 
     # Parse the key path and set value
     keys = key.split(".")
     _set_nested(data, keys, _parse_value(value))
 
     # Save updated config
-    with config_path.open("wb") as f:
-        tomli_w.dump(data, f)
+    save_toml(config_path, data)
 
     console.print(f"[green]ok:[/green] Set {key} = {value}")
 
@@ -160,26 +165,31 @@ def _set_nested(data: dict[str, Any], keys: list[str], value: ConfigValue) -> No
 
 def _parse_value(value: str) -> ConfigValue:
     """Parse a string value to appropriate type."""
-    # Try int
+    lowered = value.lower()
+    if lowered in _BOOL_TRUE:
+        return True
+    if lowered in _BOOL_FALSE:
+        return False
+    number = _parse_number(value)
+    return value if number is None else number
+
+
+def _parse_number(value: str) -> int | float | None:
+    """Parse value as int() would, else as float() would, else return None."""
+    if _INT_RE.fullmatch(value):
+        return int(value)
+    if _FLOAT_RE.fullmatch(value):
+        return float(value)
+
+    # Other forms int()/float() accept: "1_000", " 5", "inf", "nan", ...
     try:
         return int(value)
     except ValueError:
         pass
-
-    # Try float
     try:
         return float(value)
     except ValueError:
-        pass
-
-    # Try bool
-    if value.lower() in ("true", "yes", "on"):
-        return True
-    if value.lower() in ("false", "no", "off"):
-        return False
-
-    # Return as string
-    return value
+        return None
 
 
 def validate(
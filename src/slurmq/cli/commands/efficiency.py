@@ -8,6 +8,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 import json
 import subprocess
+import sys
 from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
@@ -43,7 +44,7 @@ TIME_PARTS_HMS = 3
 TIME_PARTS_MS = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class JobEfficiency:
     """Efficiency metrics for a SLURM job."""
 
@@ -149,12 +150,17 @@ def _fetch_job_efficiency(job_id: str) -> JobEfficiency | None:
     except subprocess.CalledProcessError:
         return None
 
-    lines = result.stdout.strip().split("\n")
-    if not lines or not lines[0]:
-        return None
+    # First line is the job allocation
+    return parse_efficiency_line(result.stdout.strip().split("\n", 1)[0])
+
 
-    # Parse first line (job allocation)
-    fields = lines[0].split("|")
+def parse_efficiency_line(line: str) -> JobEfficiency | None:
+    """Parse one line of _fetch_job_efficiency's sacct output.
+
+    Returns:
+        The job's efficiency metrics, or None if the line is empty or truncated
+    """
+    fields = line.split("|")
     if len(fields) < SACCT_MIN_FIELDS:
         return None
 
@@ -251,7 +257,7 @@ def efficiency(ctx: typer.Context, job_id: str = typer.Argument(..., help="Job I
     eff = _fetch_job_efficiency(job_id)
     if eff is None:
         if cli_ctx.json_output:
-            console.print(json.dumps({"error": f"Job {job_id} not found"}))
+            sys.stdout.write(json.dumps({"error": f"Job {job_id} not found"}) + "\n")
         else:
             console.print(f"[red]Error:[/red] Job {job_id} not found")
         raise typer.Exit(1)
@@ -288,7 +294,7 @@ def _eff_to_dict(eff: JobEfficiency) -> dict[str, Any]:
 
 def _output_json(eff: JobEfficiency) -> None:
     """Output efficiency as JSON."""
-    console.print(json.dumps(_eff_to_dict(eff), indent=2))
+    sys.stdout.write(json.dumps(_eff_to_dict(eff), indent=2) + "\n")
 
 
 def _output_yaml(eff: JobEfficiency) -> None:
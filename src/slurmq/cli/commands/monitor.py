@@ -5,22 +5,31 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import defaultdict
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import Enum
+from itertools import accumulate, pairwise
 import json
+from operator import attrgetter
 import subprocess
+import sys
 import time
 from typing import TYPE_CHECKING
 
 from rich.console import Console
-from rich.table import Table
 import typer
 
+from slurmq.cli.commands._tables import build_usage_table, usage_columns
 from slurmq.core.models import JobRecord, QuotaStatus
-from slurmq.core.quota import QuotaChecker, cancel_job, fetch_user_jobs
+from slurmq.core.quota import QuotaChecker, cancel_jobs, fetch_user_jobs
 
 
 if TYPE_CHECKING:
+    from rich.console import Group, RenderableType
+    from rich.table import Column, Table
+
     from slurmq.cli.main import CLIContext
     from slurmq.core.config import ClusterConfig, EnforcementConfig
 
@@ -53,7 +62,7 @@ def register_monitor_commands(app: typer.Typer) -> None:
     app.command("monitor")(monitor)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserStatus:
     """Status of a single user."""
 
@@ -77,38 +86,42 @@ def _find_exceeded_timestamp(records: list[JobRecord], quota_limit: float) -> fl
     if not records:
         return None
 
-    # Sort by start time
-    sorted_records = sorted(records, key=lambda r: r.start_time)
+    # Sort by start time, skipping the sort when sacct already returned them in order
+    if all(a.start_time <= b.start_time for a, b in pairwise(records)):
+        sorted_records = records
+    else:
+        sorted_records = sorted(records, key=attrgetter("start_time"))
 
-    cumulative = 0.0
-    for record in sorted_records:
-        cumulative += record.gpu_hours
-        if cumulative > quota_limit:
-            # Convert datetime to Unix timestamp
-            return record.start_time.timestamp()
+    # Running totals are non-decreasing, so the first total above the quota can be bisected
+    cumulative = list(accumulate(record.gpu_hours for record in sorted_records))
+    index = bisect_right(cumulative, quota_limit)
+    if index == len(sorted_records):
+        return None
 
-    return None
+    # Convert datetime to Unix timestamp
+    return sorted_records[index].start_time.timestamp()
 
 
 def get_all_user_statuses(
     records: list[JobRecord], checker: QuotaChecker, *, grace_period_hours: int = 24
 ) -> list[UserStatus]:
     """Get status for all users with active jobs."""
-    # Group by user
-    users: dict[str, list[JobRecord]] = {}
+    # Group by user, collecting active jobs in the same pass
+    users: defaultdict[str, list[JobRecord]] = defaultdict(list)
+    active_by_user: defaultdict[str, list[JobRecord]] = defaultdict(list)
     for record in records:
-        users.setdefault(record.user, []).append(record)
+        users[record.user].append(record)
+        if record.is_running:
+            active_by_user[record.user].append(record)
 
     results = []
     now = time.time()
+    window_now = datetime.now(tz=UTC)  # one rolling-window cutoff for every user this cycle
 
-    for user, user_records in users.items():
-        report = checker.generate_report(user, user_records)
-
-        # Check if user has active jobs
-        active = [record for record in user_records if record.is_running]
-        if not active:
-            continue
+    # Users without active jobs are never reported, so skip their quota math entirely
+    for user, active in active_by_user.items():
+        user_records = users[user]
+        report = checker.generate_report(user, user_records, now=window_now)
 
         # Check grace period for exceeded users
         exceeded_at = None
@@ -145,9 +158,15 @@ def check_enforcement(
 ) -> list[tuple[str, int, EnforcementAction]]:
     """Check which jobs should be cancelled and return actions taken.
 
-    Returns list of (user, job_id, action) tuples.
+    Returns list of (user, job_id, action) tuples. Jobs to cancel are collected
+    and cancelled together with a single scancel call.
     """
     actions: list[tuple[str, int, EnforcementAction]] = []
+    to_cancel: list[int] = []
+
+    # str.startswith accepts a tuple of prefixes (an empty tuple never matches)
+    exempt_users = frozenset(enforcement.exempt_users)
+    exempt_prefixes = tuple(enforcement.exempt_job_prefixes)
 
     for status in statuses:
         if status.status != QuotaStatus.EXCEEDED:
@@ -157,28 +176,25 @@ def check_enforcement(
             actions.extend((status.user, job.job_id, EnforcementAction.GRACE_PERIOD) for job in status.active_jobs)
             continue
 
-        if status.user in enforcement.exempt_users:
+        if status.user in exempt_users:
             actions.extend((status.user, job.job_id, EnforcementAction.EXEMPT_USER) for job in status.active_jobs)
             continue
 
         for job in status.active_jobs:
-            exempt = any(job.name.startswith(prefix) for prefix in enforcement.exempt_job_prefixes)
-            if exempt:
+            if job.name.startswith(exempt_prefixes):
                 actions.append((status.user, job.job_id, EnforcementAction.EXEMPT_PREFIX))
                 continue
 
             if dry_run:
                 actions.append((status.user, job.job_id, EnforcementAction.WOULD_CANCEL))
             else:
-                _cancel_job(job.job_id)
+                to_cancel.append(job.job_id)
                 actions.append((status.user, job.job_id, EnforcementAction.CANCELLED))
 
-    return actions
-
+    if to_cancel:
+        cancel_jobs(to_cancel, quiet=True)  # quiet=True handles race conditions
 
-def _cancel_job(job_id: int) -> None:
-    """Cancel a Slurm job."""
-    cancel_job(job_id, quiet=True)  # quiet=True handles race conditions
+    return actions
 
 
 def monitor(
@@ -210,7 +226,8 @@ def monitor(
 def _run_once(cli_ctx: CLIContext, cluster: ClusterConfig, *, enforce: bool) -> None:
     """Run monitor once and exit."""
     try:
-        records = fetch_user_jobs("ALL", cluster, all_users=True)
+        # Pipe-delimited output: much cheaper than --json for every user's jobs, and max_rss isn't needed here
+        records = fetch_user_jobs("ALL", cluster, all_users=True, use_cache=True, parsable=True)
     except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
         console.print(f"[red]Error fetching Slurm data:[/red] {e}")
         raise typer.Exit(1) from None
@@ -264,79 +281,97 @@ def _output_json(statuses: list[UserStatus]) -> None:
             for status in statuses
         ]
     }
-    console.print(json.dumps(data, indent=2))
+    # Bypass rich: markup parsing, highlighting and wrapping are wasted (and risky) on raw JSON
+    sys.stdout.write(json.dumps(data, indent=2) + "\n")
+
+
+def _build_table(statuses: list[UserStatus], cluster_name: str, columns: list[Column] | None = None) -> Table:
+    """Build the rich status table (pass columns from usage_columns() to reuse them across calls)."""
+    rows = (
+        (
+            status.user,
+            status.used_gpu_hours,
+            status.remaining_gpu_hours,
+            status.usage_percentage,
+            status.status,
+            str(len(status.active_jobs)),
+        )
+        for status in statuses
+    )
+    return build_usage_table(rows, f"Active Users: {cluster_name}", columns or usage_columns("Active Jobs"))
 
 
 def _output_table(statuses: list[UserStatus], cluster_name: str) -> None:
     """Output status as rich table."""
-    table = Table(title=f"Active Users: {cluster_name}")
-
-    table.add_column("User", style="cyan")
-    table.add_column("Used (GPU-hrs)", justify="right")
-    table.add_column("Remaining", justify="right")
-    table.add_column("Usage %", justify="right")
-    table.add_column("Status", justify="center")
-    table.add_column("Active Jobs", justify="right")
-
-    status_styles = {QuotaStatus.OK: "green", QuotaStatus.WARNING: "yellow", QuotaStatus.EXCEEDED: "red"}
-    status_icons = {"ok": "ok", "warning": "!", "exceeded": "x"}
-
-    for user_status in statuses:
-        style = status_styles[user_status.status]
-        icon = status_icons[user_status.status.value]
-
-        table.add_row(
-            user_status.user,
-            f"{user_status.used_gpu_hours:.1f}",
-            f"[{style}]{user_status.remaining_gpu_hours:.1f}[/{style}]",
-            f"[{style}]{user_status.usage_percentage * 100:.0f}%[/{style}]",
-            f"[{style}]{icon}[/{style}]",
-            str(len(user_status.active_jobs)),
-        )
-
-    console.print(table)
+    console.print(_build_table(statuses, cluster_name))
 
     if not statuses:
         console.print("[dim]No users with active jobs.[/dim]")
 
 
+def _render_dashboard(
+    header: str,
+    statuses: list[UserStatus],
+    cluster_name: str,
+    columns: list[Column],
+    actions: list[tuple[str, int, EnforcementAction]],
+) -> Group:
+    """Build one TUI frame: header, status table, timestamp and enforcement actions."""
+    from rich.console import Group
+
+    parts: list[RenderableType] = [header, _build_table(statuses, cluster_name, columns)]
+    if not statuses:
+        parts.append("[dim]No users with active jobs.[/dim]")
+    parts.append(f"\n[dim]Last updated: {time.strftime('%H:%M:%S')}[/dim]")
+
+    if actions:
+        parts.append("\n[bold]Enforcement:[/bold]")
+        parts.extend(f"  {action}: job {job_id} ({user})" for user, job_id, action in actions[:5])  # Show first 5
+
+    return Group(*parts)
+
+
 def _run_tui(cli_ctx: CLIContext, cluster: ClusterConfig, *, enforce: bool, interval: int) -> None:
-    """Run the interactive TUI monitor."""
-    console.print(f"[bold]Monitoring {cluster.name}[/bold] (refresh every {interval}s, Ctrl+C to exit)\n")
+    """Run the interactive TUI monitor.
+
+    Frames are drawn with rich.live.Live, which repaints the previous frame in place
+    instead of clearing the whole terminal on every refresh.
+    """
+    from rich.live import Live
+
+    header = f"[bold]Monitoring {cluster.name}[/bold] (refresh every {interval}s, Ctrl+C to exit)\n"
+
+    # Cluster and thresholds are fixed for the session, so build these once
+    checker = QuotaChecker(
+        cluster,
+        warning_threshold=cli_ctx.config.monitoring.warning_threshold,
+        critical_threshold=cli_ctx.config.monitoring.critical_threshold,
+    )
+    grace_period = cli_ctx.config.enforcement.grace_period_hours
+    columns = usage_columns("Active Jobs")
 
     try:
-        while True:
-            # Fetch and display
-            try:
-                records = fetch_user_jobs("ALL", cluster, all_users=True)
-                checker = QuotaChecker(
-                    cluster,
-                    warning_threshold=cli_ctx.config.monitoring.warning_threshold,
-                    critical_threshold=cli_ctx.config.monitoring.critical_threshold,
-                )
-                grace_period = cli_ctx.config.enforcement.grace_period_hours
-                statuses = get_all_user_statuses(records, checker, grace_period_hours=grace_period)
-
-                # Clear and redraw
-                console.clear()
-                console.print(f"[bold]Monitoring {cluster.name}[/bold] (refresh every {interval}s, Ctrl+C to exit)\n")
-                _output_table(statuses, cluster.name)
-                console.print(f"\n[dim]Last updated: {time.strftime('%H:%M:%S')}[/dim]")
-
-                # Enforcement check
-                if enforce and cli_ctx.config.enforcement.enabled:
-                    dry_run = cli_ctx.config.enforcement.dry_run
-                    actions = check_enforcement(statuses, cli_ctx.config.enforcement, dry_run=dry_run)
-                    if actions:
-                        console.print("\n[bold]Enforcement:[/bold]")
-                        for user, job_id, action in actions[:5]:  # Show first 5
-                            console.print(f"  {action}: job {job_id} ({user})")
-
-            except (subprocess.CalledProcessError, json.JSONDecodeError, OSError) as e:
-                # Transient errors - continue monitoring
-                console.print(f"[red]Error:[/red] {e}")
-
-            time.sleep(interval)
+        # Only redraw when new data arrives; the frame is static between polls
+        with Live(f"{header}[dim]Fetching Slurm data...[/dim]", console=console, auto_refresh=False) as live:
+            while True:
+                # Fetch and display
+                try:
+                    records = fetch_user_jobs("ALL", cluster, all_users=True, parsable=True)
+                    statuses = get_all_user_statuses(records, checker, grace_period_hours=grace_period)
+
+                    # Enforcement check
+                    actions: list[tuple[str, int, EnforcementAction]] = []
+                    if enforce and cli_ctx.config.enforcement.enabled:
+                        dry_run = cli_ctx.config.enforcement.dry_run
+                        actions = check_enforcement(statuses, cli_ctx.config.enforcement, dry_run=dry_run)
+
+                    live.update(_render_dashboard(header, statuses, cluster.name, columns, actions), refresh=True)
+
+                except (subprocess.CalledProcessError, json.JSONDecodeError, OSError) as e:
+                    # Transient errors - continue monitoring
+                    console.print(f"[red]Error:[/red] {e}")
+
+                time.sleep(interval)
 
     except KeyboardInterrupt:
         console.print("\n[dim]Stopped.[/dim]")
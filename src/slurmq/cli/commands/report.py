@@ -5,34 +5,46 @@
 
 from __future__ import annotations
 
-import csv
+from collections import Counter
 from dataclasses import dataclass
-import io
 import json
 from pathlib import Path
 import subprocess
-from typing import TYPE_CHECKING
+import sys
+from typing import TYPE_CHECKING, Any, TextIO
 
 from rich.console import Console
-from rich.table import Table
 import typer
 
-from slurmq.core.models import JobRecord, QuotaStatus
+from slurmq.cli.commands._tables import build_usage_table, usage_columns
 from slurmq.core.quota import QuotaChecker, fetch_user_jobs
 
 
 if TYPE_CHECKING:
     from slurmq.cli.main import CLIContext
+    from slurmq.core.models import JobRecord, QuotaStatus
 
 console = Console()
 
+# CSV column order (matches the row tuples written by _write_csv)
+CSV_FIELDNAMES = (
+    "user",
+    "used_gpu_hours",
+    "quota_limit",
+    "remaining_gpu_hours",
+    "usage_percentage",
+    "status",
+    "active_jobs",
+    "total_jobs",
+)
+
 
 def register_report_commands(app: typer.Typer) -> None:
     """Register report commands with the CLI app."""
     app.command("report")(report)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserUsage:
     """Usage summary for a single user."""
 
@@ -46,27 +58,29 @@ class UserUsage:
     total_jobs: int
 
 
-def aggregate_by_user(records: list[JobRecord], checker: QuotaChecker) -> list[UserUsage]:
-    """Aggregate job records by user."""
-    users: dict[str, list[JobRecord]] = {}
-    for record in records:
-        users.setdefault(record.user, []).append(record)
-
-    results = []
-    for user, user_records in users.items():
-        report = checker.generate_report(user, user_records)
-        results.append(
-            UserUsage(
-                user=user,
-                used_gpu_hours=report.used_gpu_hours,
-                quota_limit=report.quota_limit,
-                remaining_gpu_hours=report.remaining_gpu_hours,
-                usage_percentage=report.usage_percentage,
-                status=report.status,
-                active_jobs=len(report.active_jobs),
-                total_jobs=len(user_records),
-            )
+def aggregate_by_user(records: list[JobRecord], checker: QuotaChecker, qos: str | None = None) -> list[UserUsage]:
+    """Aggregate job records by user.
+
+    Each user's figures come from QuotaChecker.generate_reports, so the rolling-window
+    and QoS rules are the checker's. qos is the QoS to report on (the cluster's first if None).
+    """
+    if not records:
+        return []
+
+    total_jobs = Counter(record.user for record in records)
+    results = [
+        UserUsage(
+            user=user,
+            used_gpu_hours=report.used_gpu_hours,
+            quota_limit=report.quota_limit,
+            remaining_gpu_hours=report.remaining_gpu_hours,
+            usage_percentage=report.usage_percentage,
+            status=report.status,
+            active_jobs=len(report.active_jobs),
+            total_jobs=total_jobs[user],
         )
+        for user, report in checker.generate_reports(records, qos=qos).items()
+    ]
 
     # Sort by usage descending
     results.sort(key=lambda u: u.used_gpu_hours, reverse=True)
@@ -94,10 +108,17 @@ def report(
         console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1) from None
 
-    # Fetch all users' jobs (with CLI overrides)
+    # Fetch all users' jobs (with CLI overrides), as pipe-delimited output: no column here needs --json's step data
     try:
         records = fetch_user_jobs(
-            "ALL", cluster, all_users=True, qos_override=qos, account_override=account, partition_override=partition
+            "ALL",
+            cluster,
+            all_users=True,
+            qos_override=qos,
+            account_override=account,
+            partition_override=partition,
+            use_cache=True,
+            parsable=True,
         )
     except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
         console.print(f"[red]Error fetching Slurm data:[/red] {e}")
@@ -114,28 +135,34 @@ def report(
         warning_threshold=cli_ctx.config.monitoring.warning_threshold,
         critical_threshold=cli_ctx.config.monitoring.critical_threshold,
     )
-    user_usages = aggregate_by_user(records, checker)
+    try:
+        user_usages = aggregate_by_user(records, checker, target_qos)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from None
 
     # Generate output
-    if output_format == "json":
-        content = _format_json(user_usages, cluster.name, target_qos)
-    elif output_format == "csv":
-        content = _format_csv(user_usages)
-    else:
+    if output_format not in ("json", "csv"):
         _output_rich(user_usages, cluster.name, target_qos)
         return
 
-    # Write to file or stdout
+    # Stream straight into the file rather than building the whole report in memory first
     if output:
-        Path(output).write_text(content)
+        with Path(output).open("w", newline="") as fp:
+            if output_format == "json":
+                _write_json(user_usages, cluster.name, target_qos, fp)
+            else:
+                _write_csv(user_usages, fp)
         console.print(f"Report written to {output}")
+    elif output_format == "json":
+        sys.stdout.write(_format_json(user_usages, cluster.name, target_qos) + "\n")
     else:
-        console.print(content)
+        console.print(_format_csv(user_usages))
 
 
-def _format_json(usages: list[UserUsage], cluster_name: str, qos: str | None) -> str:
-    """Format report as JSON."""
-    data = {
+def _usages_to_dict(usages: list[UserUsage], cluster_name: str, qos: str | None) -> dict[str, Any]:
+    """Convert report to dict for JSON output."""
+    return {
         "cluster": cluster_name,
         "qos": qos,
         "users": [
@@ -152,67 +179,62 @@ def _format_json(usages: list[UserUsage], cluster_name: str, qos: str | None) ->
             for usage in usages
         ],
     }
-    return json.dumps(data, indent=2)
+
+
+def _format_json(usages: list[UserUsage], cluster_name: str, qos: str | None) -> str:
+    """Format report as JSON."""
+    return json.dumps(_usages_to_dict(usages, cluster_name, qos), indent=2)
+
+
+def _write_json(usages: list[UserUsage], cluster_name: str, qos: str | None, fp: TextIO) -> None:
+    """Write report as JSON to an open file."""
+    json.dump(_usages_to_dict(usages, cluster_name, qos), fp, indent=2)
 
 
 def _format_csv(usages: list[UserUsage]) -> str:
     """Format report as CSV."""
-    output = io.StringIO()
-    writer = csv.DictWriter(
-        output,
-        fieldnames=[
-            "user",
-            "used_gpu_hours",
-            "quota_limit",
-            "remaining_gpu_hours",
-            "usage_percentage",
-            "status",
-            "active_jobs",
-            "total_jobs",
-        ],
-    )
-    writer.writeheader()
-    for usage in usages:
-        writer.writerow(
-            {
-                "user": usage.user,
-                "used_gpu_hours": round(usage.used_gpu_hours, 2),
-                "quota_limit": usage.quota_limit,
-                "remaining_gpu_hours": round(usage.remaining_gpu_hours, 2),
-                "usage_percentage": round(usage.usage_percentage * 100, 1),
-                "status": usage.status.value,
-                "active_jobs": usage.active_jobs,
-                "total_jobs": usage.total_jobs,
-            }
-        )
-    return output.getvalue()
+    import io
 
+    output = io.StringIO(newline="")
+    _write_csv(usages, output)
+    return output.getvalue()
 
-def _output_rich(usages: list[UserUsage], cluster_name: str, qos: str | None) -> None:
-    """Output report with rich table."""
-    table = Table(title=f"GPU Usage Report: {cluster_name}" + (f" ({qos})" if qos else ""))
 
-    table.add_column("User", style="cyan")
-    table.add_column("Used (GPU-hrs)", justify="right")
-    table.add_column("Remaining", justify="right")
-    table.add_column("Usage %", justify="right")
-    table.add_column("Status", justify="center")
-    table.add_column("Active", justify="right")
+def _write_csv(usages: list[UserUsage], fp: TextIO) -> None:
+    """Write report as CSV to an open file (opened with newline="")."""
+    import csv
 
-    status_styles = {QuotaStatus.OK: "green", QuotaStatus.WARNING: "yellow", QuotaStatus.EXCEEDED: "red"}
+    writer = csv.writer(fp)
+    writer.writerow(CSV_FIELDNAMES)
+    writer.writerows(
+        (
+            usage.user,
+            round(usage.used_gpu_hours, 2),
+            usage.quota_limit,
+            round(usage.remaining_gpu_hours, 2),
+            round(usage.usage_percentage * 100, 1),
+            usage.status.value,
+            usage.active_jobs,
+            usage.total_jobs,
+        )
+        for usage in usages
+    )
 
-    for usage in usages:
-        style = status_styles[usage.status]
-        status_icon = {"ok": "ok", "warning": "!", "exceeded": "x"}[usage.status.value]
 
-        table.add_row(
+def _output_rich(usages: list[UserUsage], cluster_name: str, qos: str | None) -> None:
+    """Output report with rich table."""
+    rows = (
+        (
             usage.user,
-            f"{usage.used_gpu_hours:.1f}",
-            f"[{style}]{usage.remaining_gpu_hours:.1f}[/{style}]",
-            f"[{style}]{usage.usage_percentage * 100:.0f}%[/{style}]",
-            f"[{style}]{status_icon}[/{style}]",
+            usage.used_gpu_hours,
+            usage.remaining_gpu_hours,
+            usage.usage_percentage,
+            usage.status,
             str(usage.active_jobs) if usage.active_jobs > 0 else "-",
         )
+        for usage in usages
+    )
+    title = f"GPU Usage Report: {cluster_name}" + (f" ({qos})" if qos else "")
 
-    console.print(table)
+    console.print(build_usage_table(rows, title, usage_columns("Active")))
     console.print(f"\n[dim]Total users: {len(usages)}[/dim]")
@@ -5,20 +5,31 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+import hashlib
 import json
-from statistics import median
+import math
+import os
+import re
 import subprocess
 import sys
+import time
 from typing import TYPE_CHECKING
 
 from rich.console import Console
-from rich.table import Table
 import typer
 
+from slurmq.core.config import get_cache_dir
+
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
+    from rich.table import Table
+
     from slurmq.cli.main import CLIContext
     from slurmq.core.config import ClusterConfig
 
@@ -31,8 +42,21 @@ MIN_WAIT_SECONDS = 600  # 10 minutes
 LONG_WAIT_HOURS = 6
 MAX_DAYS_FOR_WEEKLY = 6
 
+# sacct fields read by parse_jobs, in order
+SACCT_FORMAT = "JobID,Partition,QoS,AllocTRES,Submit,Start,ElapsedRaw"
+SACCT_FIELD_COUNT = 7
+# Fixed sacct flags, built once; the date range and filters are appended per call
+_SACCT_BASE_ARGS = ("sacct", "-X", "--allusers", "--noheader", "-P", f"--format={SACCT_FORMAT}")
+# How long cached sacct output stays valid: ranges that may still change vs. settled history
+SACCT_CACHE_TTL_SECONDS = 60
+SACCT_CACHE_TTL_HISTORICAL_SECONDS = 24 * 3600
+# Environment that changes what sacct returns for the same command line, so it is part of the cache key
+_SACCT_CACHE_KEY_ENV = ("SLURM_CLUSTERS", "SLURM_CONF", "USER")
 
-@dataclass
+_GPU_TRES_RE = re.compile(r"(?:^|,)gres/gpu=(\d+)")
+
+
+@dataclass(slots=True)
 class JobStats:
     """Parsed job statistics from sacct."""
 
@@ -43,10 +67,13 @@ class JobStats:
     start_time: int
     partition: str
     qos: str
-    group: str = ""  # Aggregation group (partition or QoS name)
 
 
-@dataclass
+# Jobs per partition/QoS name as (all, small, large)
+SizeGroups = dict[str, tuple[list[JobStats], list[JobStats], list[JobStats]]]
+
+
+@dataclass(slots=True)
 class PartitionStats:
     """Statistics for a single partition/QoS."""
 
@@ -58,7 +85,7 @@ class PartitionStats:
     long_wait_pct: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PeriodStats:
     """Stats for a time period, with optional comparison."""
 
@@ -67,58 +94,131 @@ class PeriodStats:
 
 
 def fetch_partition_data(
-    partition: str | None, qos: str | None, start_date: str, end_date: str, account: str | None = None
+    partitions: list[str] | None,
+    qos: list[str] | None,
+    start_date: str,
+    end_date: str,
+    account: str | None = None,
+    *,
+    use_cache: bool = True,
 ) -> list[JobStats]:
-    """Fetch job data from sacct for a partition/QoS."""
-    cmd = [
-        "sacct",
-        "-X",  # Allocations only
-        "-S",
-        start_date,
-        "-E",
-        end_date,
-        "--allusers",
-        "--json",
-    ]
+    """Fetch job data from sacct for one or more partitions/QoS in a single call.
 
-    if partition:
-        cmd.append(f"--partition={partition}")
+    Output is cached on disk per sacct command line (see _run_sacct_cached).
+    """
+    # Allocations only (-X), parsable output (-P, much cheaper for slurmdbd than --json)
+    cmd = [*_SACCT_BASE_ARGS, "-S", start_date, "-E", end_date]
+
+    if partitions:
+        cmd.append(f"--partition={','.join(partitions)}")
     if qos:
-        cmd.append(f"--qos={qos}")
+        cmd.append(f"--qos={','.join(qos)}")
     if account:
         cmd.append(f"--account={account}")
 
+    ttl = _sacct_cache_ttl(end_date) if use_cache else None
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)  # noqa: S603 - sacct args from config
-        data = json.loads(result.stdout)
-        return parse_jobs(data)
-    except (subprocess.CalledProcessError, json.JSONDecodeError):
+        output = _run_sacct_cached(cmd, ttl)
+    except subprocess.CalledProcessError:
         return []
+    return parse_jobs(output)
+
 
+def _sacct_cache_ttl(end_date: str) -> int:
+    """Pick the cache TTL for a range: long once it ended before yesterday, short otherwise."""
+    end = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=UTC).date()
+    settled = end < datetime.now(tz=UTC).date() - timedelta(days=1)
+    return SACCT_CACHE_TTL_HISTORICAL_SECONDS if settled else SACCT_CACHE_TTL_SECONDS
 
-def parse_jobs(data: dict) -> list[JobStats]:
-    """Parse sacct JSON output into job records."""
+
+@lru_cache(maxsize=1)
+def _sacct_env() -> dict[str, str]:
+    """Environment for stats' sacct calls, built once per process.
+
+    Submit/Start print as epoch seconds, and the C locale keeps sacct from doing
+    any locale-aware formatting. The rest of the environment (SLURM_CONF,
+    SLURM_CLUSTERS, PATH, ...) is kept, since sacct and munge depend on it.
+    """
+    return {**os.environ, "SLURM_TIME_FORMAT": "%s", "LC_ALL": "C"}
+
+
+def _run_sacct_cached(cmd: list[str], ttl: int | None) -> str:
+    """Run sacct and return stdout, reusing output cached within the last ttl seconds.
+
+    A ttl of None bypasses the cache. Cache read/write failures fall back to running sacct.
+    Entries are keyed on the command line plus the cluster/user environment, and writing
+    one deletes any entry older than the longest TTL.
+    """
+    env = _sacct_env()
+    key = "\0".join([*cmd, *(env.get(name, "") for name in _SACCT_CACHE_KEY_ENV)])
+    cache_dir = get_cache_dir() / "sacct"
+    path = cache_dir / f"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}.txt"
+    if ttl is not None:
+        try:
+            if time.time() - path.stat().st_mtime < ttl:
+                return path.read_text()
+        except OSError:
+            pass
+
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True, env=env)  # noqa: S603 - sacct args from config
+
+    if ttl is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            _prune_sacct_cache(cache_dir)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(result.stdout)
+            tmp_path.replace(path)
+        except OSError:
+            pass
+    return result.stdout
+
+
+def _prune_sacct_cache(cache_dir: Path) -> None:
+    """Delete cached sacct output too old to be served under any TTL."""
+    cutoff = time.time() - SACCT_CACHE_TTL_HISTORICAL_SECONDS
+    for entry in cache_dir.iterdir():
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except OSError:
+            pass
+
+
+def _parse_epoch(value: str) -> int:
+    """Parse an epoch timestamp field ("Unknown"/"None" for unset times)."""
+    return int(value) if value.isdigit() else 0
+
+
+def parse_jobs(output: str) -> list[JobStats]:
+    """Parse sacct parsable output (SACCT_FORMAT fields) into job records."""
     jobs = []
-    for job in data.get("jobs", []):
-        n_gpus = 0
-        for alloc in job.get("tres", {}).get("allocated", []):
-            if alloc.get("type") == "gres" and alloc.get("name") == "gpu":
-                n_gpus += int(alloc.get("count", 0))
+    # One shared str per distinct partition/QoS name instead of a fresh copy per job
+    names: dict[str, str] = {}
+    for line in output.splitlines():
+        fields = line.split("|")
+        if len(fields) < SACCT_FIELD_COUNT:
+            continue
+        _job_id, partition, qos, alloc_tres, submit, start, elapsed_raw = fields[:SACCT_FIELD_COUNT]
 
-        start_time = job.get("time", {}).get("start", 0)
-        submit_time = job.get("time", {}).get("submission", 0)
-        elapsed = job.get("time", {}).get("elapsed", 0)
+        gpu_match = _GPU_TRES_RE.search(alloc_tres)
+        n_gpus = int(gpu_match.group(1)) if gpu_match else 0
+        elapsed = int(elapsed_raw) if elapsed_raw.isdigit() else 0
 
         # Skip jobs with no GPUs or very short runtime (< 10min)
         if n_gpus == 0 or elapsed < MIN_WAIT_SECONDS:
             continue
 
+        start_time = _parse_epoch(start)
+        submit_time = _parse_epoch(submit)
         wait_time = start_time - submit_time if start_time and submit_time else 0
 
         # Skip jobs with unreasonable wait times (> 31 days)
         if wait_time > 3600 * 24 * 31:
             continue
 
+        partition = partition or "unknown"
+        qos = qos or "unknown"
         jobs.append(
             JobStats(
                 n_gpus=n_gpus,
@@ -126,14 +226,42 @@ def parse_jobs(data: dict) -> list[JobStats]:
                 gpu_hours=(n_gpus * elapsed) / 3600,
                 wait_hours=wait_time / 3600,
                 start_time=start_time,
-                partition=job.get("partition", "unknown"),
-                qos=job.get("qos", "unknown"),
+                partition=names.setdefault(partition, partition),
+                qos=names.setdefault(qos, qos),
             )
         )
 
     return jobs
 
 
+def _select(values: list[float], k: int) -> float:
+    """Return the k-th smallest value (0-based) by quickselect, in expected O(n)."""
+    while True:
+        pivot = values[len(values) // 2]
+        lower = [value for value in values if value < pivot]
+        if k < len(lower):
+            values = lower
+            continue
+        equal_count = sum(1 for value in values if value == pivot)
+        if k < len(lower) + equal_count:
+            return pivot
+        k -= len(lower) + equal_count
+        values = [value for value in values if value > pivot]
+
+
+def _median(values: list[float]) -> float:
+    """Median of a non-empty list without fully sorting it."""
+    mid = len(values) // 2
+    upper = _select(values, mid)
+    if len(values) % 2:
+        return upper
+
+    # The lower middle value is upper itself, unless fewer than mid values lie below it
+    below = [value for value in values if value < upper]
+    lower = upper if len(below) < mid else max(below)
+    return (lower + upper) / 2
+
+
 def calculate_partition_stats(jobs: list[JobStats], name: str) -> PartitionStats:
     """Calculate statistics for a set of jobs."""
     if not jobs:
@@ -144,13 +272,12 @@ def calculate_partition_stats(jobs: list[JobStats], name: str) -> PartitionStats
     job_count = len(jobs)
     gpu_hours = sum(job.gpu_hours for job in jobs)
 
-    # Calculate median wait time
     wait_times = [job.wait_hours for job in jobs]
-    median_wait = median(wait_times) if wait_times else 0.0
+    median_wait = _median(wait_times)
 
     # Long wait jobs (> 6 hours)
-    long_wait_count = sum(1 for job in jobs if job.wait_hours > LONG_WAIT_HOURS)
-    long_wait_pct = (long_wait_count / job_count * 100) if job_count > 0 else 0
+    long_wait_count = sum(1 for wait in wait_times if wait > LONG_WAIT_HOURS)
+    long_wait_pct = long_wait_count / job_count * 100
 
     return PartitionStats(
         name=name,
@@ -162,6 +289,18 @@ def calculate_partition_stats(jobs: list[JobStats], name: str) -> PartitionStats
     )
 
 
+def split_by_size(groups: dict[str, list[JobStats]], threshold: float) -> SizeGroups:
+    """Split each partition/QoS group by GPU-hours into (all, small, large)."""
+    result: SizeGroups = {}
+    for name, jobs in groups.items():
+        small: list[JobStats] = []
+        large: list[JobStats] = []
+        for job in jobs:
+            (small if job.gpu_hours <= threshold else large).append(job)
+        result[name] = (jobs, small, large)
+    return result
+
+
 def format_time_human(hours: float) -> str:
     """Format hours to human-readable (e.g., '1h15', '15min', '< 1min')."""
     if hours == 0:
@@ -188,11 +327,17 @@ def format_pct_change(current: float, previous: float) -> str:
     if previous == 0:
         return ""
     pct = ((current - previous) / previous) * 100
-    if abs(pct) == float("inf"):
+    if not math.isfinite(pct):
         return ""
-    sign = "+" if pct >= 0 else ""
-    color = "green" if pct >= 0 else "red"
-    return f" [{color}]({sign}{pct:.0f}%)[/{color}]"
+    return _pct_change_tag(round(pct), negative=pct < 0)
+
+
+@lru_cache(maxsize=512)
+def _pct_change_tag(rounded_pct: int, *, negative: bool) -> str:
+    """Markup for a whole-number percentage change; few distinct values recur across rows."""
+    if negative:
+        return f" [red](-{abs(rounded_pct)}%)[/red]"
+    return f" [green](+{rounded_pct}%)[/green]"
 
 
 _PARTITION_OPTION: list[str] | None = typer.Option(None, "--partition", "-p", help="Filter by partition(s)")
@@ -222,19 +367,31 @@ def _resolve_partitions(
 
 
 def _fetch_jobs_for_period(
-    partitions: list[tuple[str | None, str | None]], start: str, end: str, account: str | None, *, verbose: bool
-) -> list[JobStats]:
-    """Fetch job data for all partitions in a date range."""
-    jobs: list[JobStats] = []
-    for part, q in partitions:
-        name = part or q or "unknown"
-        if verbose:
-            console.print(f"[dim]  -> {name}[/dim]")
-        partition_jobs = fetch_partition_data(part, q, start, end, account)
-        for job in partition_jobs:
-            job.group = name
-        jobs.extend(partition_jobs)
-    return jobs
+    partitions: list[tuple[str | None, str | None]],
+    start: str,
+    end: str,
+    account: str | None,
+    *,
+    verbose: bool,
+    use_cache: bool = True,
+) -> dict[str, list[JobStats]]:
+    """Fetch job data for all partitions in a date range, grouped by partition/QoS name.
+
+    Issues one sacct call with comma-separated filters, then groups jobs by the
+    partition (or QoS) they ran under.
+    """
+    part_filter = [part for part, _ in partitions if part]
+    qos_filter = [q for _, q in partitions if q]
+    names = {part or q or "unknown" for part, q in partitions}
+    if verbose:
+        console.print(f"[dim]  -> {', '.join(part or q or 'unknown' for part, q in partitions)}[/dim]")
+
+    groups: dict[str, list[JobStats]] = {}
+    for job in fetch_partition_data(part_filter or None, qos_filter or None, start, end, account, use_cache=use_cache):
+        name = job.partition if part_filter else job.qos
+        if name in names:
+            groups.setdefault(name, []).append(job)
+    return groups
 
 
 def stats(
@@ -245,6 +402,7 @@ def stats(
     partition: list[str] | None = _PARTITION_OPTION,
     qos: list[str] | None = _QOS_OPTION,
     small_threshold: float = typer.Option(50, "--small-threshold", help="GPU-hours threshold for small vs large jobs"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Query sacct even if cached results exist"),
 ) -> None:
     """Show cluster statistics and analytics.
 
@@ -264,46 +422,56 @@ def stats(
     previous_start = (now - timedelta(days=days * 2)).strftime("%Y-%m-%d")
     previous_end = (now - timedelta(days=days)).strftime("%Y-%m-%d")
 
-    verbose = not cli_ctx.json_output
+    verbose = not (cli_ctx.json_output or cli_ctx.quiet)
     if verbose:
         console.print(f"[dim]Fetching data for the last {days} days...[/dim]")
 
-    all_current_jobs = _fetch_jobs_for_period(
-        partitions_to_check, current_start, current_end, account, verbose=verbose
-    )
-
-    all_previous_jobs = (
-        _fetch_jobs_for_period(partitions_to_check, previous_start, previous_end, account, verbose=False)
-        if compare
-        else []
-    )
+    # sacct calls are I/O bound: fetch the comparison period in the background meanwhile
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        previous_future = (
+            pool.submit(
+                _fetch_jobs_for_period,
+                partitions_to_check,
+                previous_start,
+                previous_end,
+                account,
+                verbose=False,
+                use_cache=not no_cache,
+            )
+            if compare
+            else None
+        )
+        current_groups = _fetch_jobs_for_period(
+            partitions_to_check, current_start, current_end, account, verbose=verbose, use_cache=not no_cache
+        )
+        previous_groups = previous_future.result() if previous_future else {}
 
-    if not all_current_jobs:
+    if not current_groups:
         if cli_ctx.json_output:
             sys.stdout.write('{"error": "No jobs found in the specified period"}\n')
-        else:
+        elif not cli_ctx.quiet:
             console.print("[yellow]No jobs found in the specified period.[/yellow]")
         raise typer.Exit(0)
 
     if cli_ctx.json_output:
-        _output_json(all_current_jobs, all_previous_jobs, days, small_threshold)
+        _output_json(current_groups, previous_groups, days, small_threshold)
+        return
+
+    rows = _stats_rows(current_groups, previous_groups, small_threshold, partitions_to_check)
+    if cli_ctx.quiet:
+        _output_tsv(rows)
     else:
-        _output_rich(all_current_jobs, all_previous_jobs, days, small_threshold, partitions_to_check, compare=compare)
+        _output_rich(rows, days, small_threshold, compare=compare)
 
 
-def _output_json(current_jobs: list[JobStats], previous_jobs: list[JobStats], days: int, threshold: float) -> None:
+def _output_json(
+    current_groups: dict[str, list[JobStats]], previous_groups: dict[str, list[JobStats]], days: int, threshold: float
+) -> None:
     """Output stats as JSON."""
 
-    def jobs_to_stats(jobs: list[JobStats]) -> dict:
-        groups: dict[str, list[JobStats]] = {}
-        for job in jobs:
-            groups.setdefault(job.group or "unknown", []).append(job)
-
+    def jobs_to_stats(groups: dict[str, list[JobStats]]) -> dict:
         result = {}
-        for name, group_jobs in groups.items():
-            small = [job for job in group_jobs if job.gpu_hours <= threshold]
-            large = [job for job in group_jobs if job.gpu_hours > threshold]
-
+        for name, (group_jobs, small, large) in split_by_size(groups, threshold).items():
             result[name] = {
                 "all": _stats_dict(calculate_partition_stats(group_jobs, name)),
                 "small": _stats_dict(calculate_partition_stats(small, name)),
@@ -319,48 +487,78 @@ def _output_json(current_jobs: list[JobStats], previous_jobs: list[JobStats], da
             "long_wait_pct": round(s.long_wait_pct, 2),
         }
 
-    output = {"period_days": days, "current": jobs_to_stats(current_jobs)}
-    if previous_jobs:
-        output["previous"] = jobs_to_stats(previous_jobs)
+    output = {"period_days": days, "current": jobs_to_stats(current_groups)}
+    if previous_groups:
+        output["previous"] = jobs_to_stats(previous_groups)
 
     sys.stdout.write(json.dumps(output, indent=2) + "\n")
 
 
-def _output_rich(
-    current_jobs: list[JobStats],
-    previous_jobs: list[JobStats],
-    days: int,
-    threshold: float,
-    partitions: list[tuple[str | None, str | None]],
-    *,
-    compare: bool,
-) -> None:
-    """Output stats with Rich formatting."""
+# Per partition/QoS: (name, current stats, previous stats), each indexed (all, small, large)
+_StatsRow = tuple[str, list[PartitionStats], list[PartitionStats | None]]
 
-    # Group jobs by partition/QoS
-    def group_jobs(jobs: list[JobStats]) -> dict[str, list[JobStats]]:
-        groups: dict[str, list[JobStats]] = {}
-        for job in jobs:
-            groups.setdefault(job.group or "unknown", []).append(job)
-        return groups
 
-    current_groups = group_jobs(current_jobs)
-    previous_groups = group_jobs(previous_jobs) if previous_jobs else {}
+def _group_stats(groups: SizeGroups, name: str) -> list[PartitionStats]:
+    """Stats for a group's (all, small, large) job lists; empty stats if the group is absent."""
+    return [calculate_partition_stats(jobs, name) for jobs in groups.get(name, ([], [], []))]
 
-    # Build utilization table
-    util_table = Table(title=f"GPU Utilization (Last {days} Days)", show_header=True, header_style="bold")
-    util_table.add_column("Partition/QoS")
-    util_table.add_column("GPU Hours", justify="right")
-    util_table.add_column("Jobs", justify="right")
 
+def _stats_rows(
+    current_jobs: dict[str, list[JobStats]],
+    previous_jobs: dict[str, list[JobStats]],
+    threshold: float,
+    partitions: list[tuple[str | None, str | None]],
+) -> list[_StatsRow]:
+    """Compute every table's stats in one pass over the partitions."""
+    current_groups = split_by_size(current_jobs, threshold)
+    previous_groups = split_by_size(previous_jobs, threshold)
+    rows: list[_StatsRow] = []
     for part, q in partitions:
         name = part or q or "unknown"
-        current = current_groups.get(name, [])
-        previous = previous_groups.get(name, [])
+        previous = [stats if stats.job_count else None for stats in _group_stats(previous_groups, name)]
+        rows.append((name, _group_stats(current_groups, name), previous))
+    return rows
+
+
+def _output_tsv(rows: list[_StatsRow]) -> None:
+    """Output stats as plain tab-separated lines, one per partition/QoS and job size."""
+    lines = ["partition_qos\tsize\tjob_count\tgpu_hours\tmedian_wait_hours\tlong_wait_pct"]
+    for name, current, _ in rows:
+        for size, s in zip(("all", "small", "large"), current, strict=True):
+            lines.append(
+                f"{name}\t{size}\t{s.job_count}\t{s.gpu_hours:.2f}\t{s.median_wait_hours:.2f}\t{s.long_wait_pct:.2f}"
+            )
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
-        current_stats = calculate_partition_stats(current, name)
-        previous_stats = calculate_partition_stats(previous, name) if previous else None
+def _build_util_table(days: int) -> Table:
+    """Empty GPU utilization table."""
+    from rich.table import Table
 
+    table = Table(title=f"GPU Utilization (Last {days} Days)", show_header=True, header_style="bold")
+    table.add_column("Partition/QoS")
+    table.add_column("GPU Hours", justify="right")
+    table.add_column("Jobs", justify="right")
+    return table
+
+
+def _build_wait_table(size_label: str) -> Table:
+    """Empty wait time table for one job size."""
+    from rich.table import Table
+
+    table = Table(title=f"Wait Times: {size_label}", show_header=True, header_style="bold")
+    table.add_column("Partition/QoS")
+    table.add_column("Median Wait", justify="right")
+    table.add_column("Wait > 6h", justify="right")
+    table.add_column("Jobs", justify="right")
+    return table
+
+
+def _output_rich(rows: list[_StatsRow], days: int, threshold: float, *, compare: bool) -> None:
+    """Output stats with Rich formatting."""
+    util_table = _build_util_table(days)
+    add_row = util_table.add_row
+    for name, (current_stats, *_), (previous_stats, *_) in rows:
         gpu_str = f"{current_stats.gpu_hours / 1000:,.1f}k"
         jobs_str = f"{current_stats.job_count:,}"
 
@@ -368,62 +566,40 @@ def _output_rich(
             gpu_str += format_pct_change(current_stats.gpu_hours, previous_stats.gpu_hours)
             jobs_str += format_pct_change(current_stats.job_count, previous_stats.job_count)
 
-        util_table.add_row(name, gpu_str, jobs_str)
+        add_row(name, gpu_str, jobs_str)
 
     console.print(util_table)
     console.print()
 
     # Wait times - small jobs
-    _print_wait_table(current_groups, previous_groups, partitions, threshold, compare=compare, is_small=True)
+    _print_wait_table(rows, threshold, compare=compare, is_small=True)
     console.print()
 
     # Wait times - large jobs
-    _print_wait_table(current_groups, previous_groups, partitions, threshold, compare=compare, is_small=False)
+    _print_wait_table(rows, threshold, compare=compare, is_small=False)
 
 
-def _print_wait_table(
-    current_groups: dict[str, list[JobStats]],
-    previous_groups: dict[str, list[JobStats]],
-    partitions: list[tuple[str | None, str | None]],
-    threshold: float,
-    *,
-    compare: bool,
-    is_small: bool,
-) -> None:
+def _print_wait_table(rows: list[_StatsRow], threshold: float, *, compare: bool, is_small: bool) -> None:
     """Print a wait time table for small or large jobs."""
     size_label = f"Small (≤{threshold:.0f} GPU-h)" if is_small else f"Large (>{threshold:.0f} GPU-h)"
-    table = Table(title=f"Wait Times: {size_label}", show_header=True, header_style="bold")
-    table.add_column("Partition/QoS")
-    table.add_column("Median Wait", justify="right")
-    table.add_column("Wait > 6h", justify="right")
-    table.add_column("Jobs", justify="right")
+    table = _build_wait_table(size_label)
+    add_row = table.add_row
 
-    for part, q in partitions:
-        name = part or q or "unknown"
-
-        current_all = current_groups.get(name, [])
-        previous_all = previous_groups.get(name, [])
-
-        if is_small:
-            current = [job for job in current_all if job.gpu_hours <= threshold]
-            previous = [job for job in previous_all if job.gpu_hours <= threshold]
-        else:
-            current = [job for job in current_all if job.gpu_hours > threshold]
-            previous = [job for job in previous_all if job.gpu_hours > threshold]
-
-        current_stats = calculate_partition_stats(current, name)
-        previous_stats = calculate_partition_stats(previous, name) if previous else None
+    size_index = 1 if is_small else 2
+    for name, current, previous in rows:
+        current_stats = current[size_index]
+        previous_stats = previous[size_index]
 
         wait_str = format_time_human(current_stats.median_wait_hours)
         pct_str = f"{current_stats.long_wait_pct:.1f}%"
         jobs_str = f"{current_stats.job_count:,}"
 
-        if compare and previous_stats and previous_stats.job_count > 0:
+        if compare and previous_stats:
             wait_str += format_pct_change(current_stats.median_wait_hours, previous_stats.median_wait_hours)
             pct_str += format_pct_change(current_stats.long_wait_pct, previous_stats.long_wait_pct)
             jobs_str += format_pct_change(current_stats.job_count, previous_stats.job_count)
 
-        table.add_row(name, wait_str, pct_str, jobs_str)
+        add_row(name, wait_str, pct_str, jobs_str)
 
     console.print(table)
 
@@ -6,10 +6,10 @@
 from __future__ import annotations
 
 from pathlib import Path
+import sys
 from typing import TYPE_CHECKING
 
 from rich.console import Console
-from rich.traceback import install as rich_traceback
 import typer
 
 from slurmq.cli.commands import (
@@ -24,11 +24,21 @@ from slurmq.core.config import SlurmqConfig, load_config
 
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
     from slurmq.core.config import ClusterConfig
 
 
-# Install rich tracebacks for better error messages
-rich_traceback(show_locals=False)
+def _rich_excepthook(exc_type: type[BaseException], exc_value: BaseException, traceback: TracebackType | None) -> None:
+    """Install rich tracebacks on the first uncaught exception, keeping rich.traceback off the startup path."""
+    from rich.traceback import install
+
+    install(show_locals=False)
+    sys.excepthook(exc_type, exc_value, traceback)
+
+
+# Rich tracebacks for better error messages
+sys.excepthook = _rich_excepthook
 
 app = typer.Typer(
     name="slurmq",
@@ -5,7 +5,17 @@
 
 from .config import SlurmqConfig
 from .models import JobRecord, JobState, QuotaStatus, UsageReport
-from .quota import QuotaChecker, cancel_job, fetch_user_jobs
+from .quota import (
+    QuotaChecker,
+    cancel_job,
+    cancel_jobs,
+    clear_fetch_cache,
+    fetch_all_clusters,
+    fetch_all_jobs,
+    fetch_jobs_by_ids,
+    fetch_user_jobs,
+    fetch_user_jobs_async,
+)
 
 
 __all__ = [
@@ -16,5 +26,11 @@ __all__ = [
     "SlurmqConfig",
     "UsageReport",
     "cancel_job",
+    "cancel_jobs",
+    "clear_fetch_cache",
+    "fetch_all_clusters",
+    "fetch_all_jobs",
+    "fetch_jobs_by_ids",
     "fetch_user_jobs",
+    "fetch_user_jobs_async",
 ]
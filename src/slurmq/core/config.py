@@ -12,6 +12,7 @@ Supports:
 
 from __future__ import annotations
 
+import copy
 import os
 from pathlib import Path
 import tomllib
@@ -19,7 +20,6 @@ from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, PydanticBaseSettingsSource, SettingsConfigDict
-import tomli_w
 
 
 if TYPE_CHECKING:
@@ -28,6 +28,13 @@ if TYPE_CHECKING:
 # Module-level variable to hold the config file path for settings source
 _config_file_path: Path | None = None
 
+# Parsed TOML per path, with the (mtime_ns, size) it was parsed at; a changed file replaces its entry
+_toml_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
+# Loaded config per path, with the (mtime_ns, size) or None if missing, and SLURMQ_* env vars it was
+# loaded under; a change to either replaces the entry, so the cache holds one config per file
+_config_cache: dict[Path, tuple[tuple[tuple[int, int] | None, tuple[tuple[str, str], ...]], SlurmqConfig]] = {}
+
 # System-wide config path (for HPC deployments)
 SYSTEM_CONFIG_PATH = Path("/etc/slurmq/config.toml")
 
@@ -58,16 +65,68 @@ class TomlFileSettingsSource(PydanticBaseSettingsSource):
 def _load_toml_raw(path: Path) -> dict[str, Any]:
     """Load TOML file, returning empty dict if not found."""
     try:
-        with path.open("rb") as f:
-            return tomllib.load(f)
+        return load_toml(path)
     except FileNotFoundError:
         return {}
 
 
+def _load_toml_shared(path: Path) -> dict[str, Any]:
+    """Load TOML file, reusing the previous parse if the file is unchanged.
+
+    Returns the cached dict itself, so callers must not mutate it.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        tomllib.TOMLDecodeError: If the file is not valid TOML.
+    """
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _toml_cache.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with path.open("rb") as f:
+        data = tomllib.load(f)
+    _toml_cache[path] = (stamp, data)
+    return data
+
+
+def load_toml(path: Path) -> dict[str, Any]:
+    """Load a TOML config file as a dict, reusing the previous parse if the file is unchanged.
+
+    Returns a deep copy, so callers may mutate the result freely.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        tomllib.TOMLDecodeError: If the file is not valid TOML.
+    """
+    return copy.deepcopy(_load_toml_shared(path))
+
+
+def save_toml(path: Path, data: dict[str, Any]) -> None:
+    """Write a dict to a TOML config file, dropping any cached parse of it.
+
+    Args:
+        path: Path to write (replaced if it exists).
+        data: Config data, e.g. as returned by load_toml and then edited.
+    """
+    import tomli_w  # noqa: PLC0415 - the writer is only needed when saving
+
+    path.write_bytes(tomli_w.dumps(data).encode())
+    _invalidate_toml_cache(path)
+
+
+def _invalidate_toml_cache(path: Path) -> None:
+    """Drop cached parses (and configs loaded from them) of a file after it has been rewritten."""
+    _toml_cache.pop(path, None)
+    _config_cache.pop(path, None)
+
+
 class ClusterConfig(BaseModel):
     """Configuration for a single Slurm cluster."""
 
     name: str
+    # Slurm's name for the cluster (sacct -M); empty queries the cluster this host belongs to
+    slurm_cluster: str = ""
     account: str = ""
     qos: list[str] = Field(default_factory=lambda: ["normal"])
     partitions: list[str] = Field(default_factory=list)
@@ -200,6 +259,8 @@ class SlurmqConfig(BaseSettings):
         Args:
             path: Path to save the config file.
         """
+        import tomli_w  # noqa: PLC0415 - the writer is only needed when saving
+
         path.parent.mkdir(parents=True, exist_ok=True)
         data = self.model_dump(mode="json", exclude_defaults=False)
         with path.open("wb") as f:
@@ -219,6 +280,17 @@ def get_default_config_path() -> Path:
     return Path.home() / ".config" / "slurmq" / "config.toml"
 
 
+def get_cache_dir() -> Path:
+    """Get the cache directory (XDG compliant).
+
+    Returns:
+        Path to ~/.cache/slurmq or $XDG_CACHE_HOME/slurmq
+    """
+    if xdg_cache := os.environ.get("XDG_CACHE_HOME"):
+        return Path(xdg_cache) / "slurmq"
+    return Path.home() / ".cache" / "slurmq"
+
+
 def get_config_path() -> Path:
     """Get the config file path with fallback chain.
 
@@ -235,16 +307,22 @@ def get_config_path() -> Path:
     if env_path := os.environ.get("SLURMQ_CONFIG"):
         return Path(env_path)
 
-    # 2. User config if exists
-    user_config = get_default_config_path()
-    if user_config.exists():
-        return user_config
+    return _resolve_config_path(get_default_config_path(), SYSTEM_CONFIG_PATH)
+
 
-    # 3. System config if exists
-    if SYSTEM_CONFIG_PATH.exists():
-        return SYSTEM_CONFIG_PATH
+def _resolve_config_path(user_config: Path, system_config: Path) -> Path:
+    """Pick the user config if it exists, else the system config if it exists, else the user path.
 
-    # 4. Fall back to user path (for creation)
+    Not cached: either file may be created or removed while a long-running process (e.g. monitor) is up.
+    """
+    for candidate in (user_config, system_config):
+        try:
+            candidate.stat()
+        except OSError:
+            continue
+        return candidate
+
+    # Fall back to user path (for creation)
     return user_config
 
 
@@ -256,6 +334,9 @@ def load_config(path: Path | None = None) -> SlurmqConfig:
     2. Config file (specified path or default)
     3. Built-in defaults
 
+    Repeated loads of an unchanged file under the same SLURMQ_* environment reuse
+    the validated config; each caller still gets its own copy.
+
     Args:
         path: Optional path to config file. If None, uses get_config_path().
 
@@ -265,9 +346,21 @@ def load_config(path: Path | None = None) -> SlurmqConfig:
     global _config_file_path  # noqa: PLW0603 - required for pydantic-settings file source
     _config_file_path = path if path is not None else get_config_path()
 
-    # SlurmqConfig.settings_customize_sources will use _config_file_path
-    # to load the TOML file, and env vars will override
-    return SlurmqConfig()
+    try:
+        stat = _config_file_path.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        file_key = None
+    env_key = tuple(sorted((key, value) for key, value in os.environ.items() if key.upper().startswith("SLURMQ_")))
+    stamp = (file_key, env_key)
+
+    cached = _config_cache.get(_config_file_path)
+    if cached is None or cached[0] != stamp:
+        # SlurmqConfig.settings_customize_sources will use _config_file_path
+        # to load the TOML file, and env vars will override
+        cached = (stamp, SlurmqConfig())
+        _config_cache[_config_file_path] = cached
+    return cached[1].model_copy(deep=True)
 
 
 def validate_config(path: Path) -> list[str]:
@@ -281,14 +374,12 @@ def validate_config(path: Path) -> list[str]:
     """
     errors: list[str] = []
 
-    # Check file exists
-    if not path.exists():
-        return [f"Config file not found: {path}"]
-
-    # Check TOML syntax
+    # Check file exists and TOML syntax (sharing the parse with other cached readers of the file;
+    # validation only reads it, so no copy is made)
     try:
-        with path.open("rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml_shared(path)
+    except FileNotFoundError:
+        return [f"Config file not found: {path}"]
     except tomllib.TOMLDecodeError as e:
         return [f"TOML parse error: {e}"]
 
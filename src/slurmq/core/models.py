@@ -16,9 +16,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import StrEnum, auto
-from typing import Any
+from functools import lru_cache
+import json
+import re
+from typing import Any, NotRequired
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from typing_extensions import TypedDict  # pydantic needs this TypedDict before Python 3.12
 
 
 # --- Sacct JSON Models (Pydantic) ---
@@ -111,6 +115,72 @@ class SacctOutput(BaseModel):
     jobs: list[SacctJob] = Field(default_factory=list)
 
 
+# --- Sacct JSON as plain dicts (bulk parsing) ---
+# Mirrors of the models above, validated into dicts rather than ~10 model instances per job,
+# which dominates parse time on large histories. Defaults are applied by the reader.
+
+
+class _SacctTresEntryDict(TypedDict):
+    type: str
+    name: NotRequired[str]
+    count: NotRequired[int]
+
+
+class _SacctTimeDict(TypedDict, total=False):
+    elapsed: int
+    start: int
+    submission: int
+
+
+class _SacctStateDict(TypedDict, total=False):
+    current: list[str]
+
+
+class _SacctTresDict(TypedDict, total=False):
+    allocated: list[_SacctTresEntryDict]
+
+
+class _SacctRssMaxDict(TypedDict, total=False):
+    value: int
+
+
+class _SacctRssDict(TypedDict, total=False):
+    max: _SacctRssMaxDict
+
+
+class _SacctStatisticsDict(TypedDict, total=False):
+    RSS: _SacctRssDict
+
+
+class _SacctStepDict(TypedDict, total=False):
+    statistics: _SacctStatisticsDict
+
+
+class _SacctRequiredDict(TypedDict, total=False):
+    memory: str
+
+
+class _SacctJobDict(TypedDict):
+    job_id: int
+    name: NotRequired[str]
+    user: NotRequired[str]
+    account: NotRequired[str]
+    qos: NotRequired[str]
+    state: NotRequired[_SacctStateDict]
+    time: NotRequired[_SacctTimeDict]
+    tres: NotRequired[_SacctTresDict]
+    allocation_nodes: NotRequired[int]
+    required: NotRequired[_SacctRequiredDict]
+    steps: NotRequired[list[_SacctStepDict]]
+
+
+class _SacctOutputDict(TypedDict, total=False):
+    jobs: list[_SacctJobDict]
+
+
+_SACCT_OUTPUT_ADAPTER: TypeAdapter[_SacctOutputDict] = TypeAdapter(_SacctOutputDict)
+
+
 # --- Domain Enums ---
 
 
@@ -143,81 +213,93 @@ class JobState(StrEnum):
     @classmethod
     def from_slurm(cls, state_str: str) -> JobState:
         """Parse Slurm state string (handles abbreviations)."""
-        # Map abbreviations to full names
-        abbrevs = {
-            "BF": cls.BOOT_FAIL,
-            "CA": cls.CANCELLED,
-            "CD": cls.COMPLETED,
-            "DL": cls.DEADLINE,
-            "F": cls.FAILED,
-            "NF": cls.NODE_FAIL,
-            "OOM": cls.OUT_OF_MEMORY,
-            "PD": cls.PENDING,
-            "PR": cls.PREEMPTED,
-            "R": cls.RUNNING,
-            "RQ": cls.REQUEUED,
-            "RS": cls.RESIZING,
-            "RV": cls.REVOKED,
-            "S": cls.SUSPENDED,
-            "TO": cls.TIMEOUT,
-        }
+        # sacct --json reports bare upper-case names, so most states match without normalising
+        state = _STATE_LOOKUP.get(state_str)
+        if state is not None:
+            return state
+
         # Strip any suffix like "by 12345" from "CANCELLED by 12345"
-        base_state = state_str.split()[0].upper()
-        if base_state in abbrevs:
-            return abbrevs[base_state]
-        try:
-            return cls(base_state)
-        except ValueError:
-            return cls.UNKNOWN
+        base_state = state_str.partition(" ")[0].upper()
+        return _STATE_LOOKUP.get(base_state, cls.UNKNOWN)
 
     @property
     def is_running(self) -> bool:
         """Check if job is active."""
-        return self in (JobState.RUNNING, JobState.PENDING)
+        return self in _RUNNING_STATES
 
     @property
     def is_problematic(self) -> bool:
         """Check if this state indicates a problem."""
-        return self in (
-            JobState.FAILED,
-            JobState.TIMEOUT,
-            JobState.OUT_OF_MEMORY,
-            JobState.NODE_FAIL,
-            JobState.PREEMPTED,
-            JobState.BOOT_FAIL,
-        )
+        return self in _PROBLEMATIC_STATES
 
     @property
     def color(self) -> str:
         """Rich color for this state."""
-        colors = {
-            JobState.COMPLETED: "green",
-            JobState.RUNNING: "cyan",
-            JobState.PENDING: "yellow",
-            JobState.CANCELLED: "dim",
-            JobState.FAILED: "red bold",
-            JobState.TIMEOUT: "red",
-            JobState.OUT_OF_MEMORY: "red bold",
-            JobState.NODE_FAIL: "red",
-            JobState.PREEMPTED: "orange1",
-        }
-        return colors.get(self, "white")
+        return _STATE_COLORS.get(self, "white")
 
     @property
     def symbol(self) -> str:
         """Short symbol/indicator for this state."""
-        symbols = {
-            JobState.COMPLETED: "ok",
-            JobState.RUNNING: ">",
-            JobState.PENDING: ".",
-            JobState.CANCELLED: "x",
-            JobState.FAILED: "x",
-            JobState.TIMEOUT: "T",
-            JobState.OUT_OF_MEMORY: "OOM",
-            JobState.NODE_FAIL: "NF",
-            JobState.PREEMPTED: "PR",
-        }
-        return symbols.get(self, "?")
+        return _STATE_SYMBOLS.get(self, "?")
+
+
+# Full state names plus sacct's abbreviations, for JobState.from_slurm
+_STATE_LOOKUP: dict[str, JobState] = {
+    **{state.value: state for state in JobState},
+    "BF": JobState.BOOT_FAIL,
+    "CA": JobState.CANCELLED,
+    "CD": JobState.COMPLETED,
+    "DL": JobState.DEADLINE,
+    "F": JobState.FAILED,
+    "NF": JobState.NODE_FAIL,
+    "OOM": JobState.OUT_OF_MEMORY,
+    "PD": JobState.PENDING,
+    "PR": JobState.PREEMPTED,
+    "R": JobState.RUNNING,
+    "RQ": JobState.REQUEUED,
+    "RS": JobState.RESIZING,
+    "RV": JobState.REVOKED,
+    "S": JobState.SUSPENDED,
+    "TO": JobState.TIMEOUT,
+}
+
+# Shared fallback for unset sacct timestamps (0 means "not yet known")
+_EPOCH_MIN = datetime.min.replace(tzinfo=UTC)
+
+# JobState metadata, built once rather than on every property access
+_RUNNING_STATES = frozenset({JobState.RUNNING, JobState.PENDING})
+_PROBLEMATIC_STATES = frozenset(
+    {
+        JobState.FAILED,
+        JobState.TIMEOUT,
+        JobState.OUT_OF_MEMORY,
+        JobState.NODE_FAIL,
+        JobState.PREEMPTED,
+        JobState.BOOT_FAIL,
+    }
+)
+_STATE_COLORS: dict[JobState, str] = {
+    JobState.COMPLETED: "green",
+    JobState.RUNNING: "cyan",
+    JobState.PENDING: "yellow",
+    JobState.CANCELLED: "dim",
+    JobState.FAILED: "red bold",
+    JobState.TIMEOUT: "red",
+    JobState.OUT_OF_MEMORY: "red bold",
+    JobState.NODE_FAIL: "red",
+    JobState.PREEMPTED: "orange1",
+}
+_STATE_SYMBOLS: dict[JobState, str] = {
+    JobState.COMPLETED: "ok",
+    JobState.RUNNING: ">",
+    JobState.PENDING: ".",
+    JobState.CANCELLED: "x",
+    JobState.FAILED: "x",
+    JobState.TIMEOUT: "T",
+    JobState.OUT_OF_MEMORY: "OOM",
+    JobState.NODE_FAIL: "NF",
+    JobState.PREEMPTED: "PR",
+}
 
 
 class QuotaStatus(StrEnum):
@@ -240,14 +322,14 @@ class QuotaStatus(StrEnum):
             QuotaStatus based on thresholds
 
         """
-        if percentage >= critical:
-            return cls.EXCEEDED
-        if percentage >= warning:
-            return cls.WARNING
-        return cls.OK
+        return _STATUS_BY_THRESHOLDS[(percentage >= warning) | ((percentage >= critical) << 1)]
+
+
+# Indexed by (over warning) | (over critical) << 1; exceeding critical wins even if warning > critical
+_STATUS_BY_THRESHOLDS = (QuotaStatus.OK, QuotaStatus.WARNING, QuotaStatus.EXCEEDED, QuotaStatus.EXCEEDED)
 
 
-@dataclass
+@dataclass(slots=True)
 class JobRecord:
     """A single Slurm job record."""
 
@@ -265,6 +347,12 @@ class JobRecord:
     n_cpus: int = 0
     req_mem: str = ""  # Requested memory (e.g., "32G")
     max_rss: int = 0  # Max RSS in bytes (for efficiency calc)
+    # Allocated GPU-hours (n_gpus x elapsed time, not utilization), computed once since every report sums it
+    gpu_hours: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive allocated GPU-hours from the GPU count and elapsed time."""
+        self.gpu_hours = (self.n_gpus * self.elapsed_seconds) / 3600
 
     @property
     def is_running(self) -> bool:
@@ -276,11 +364,6 @@ class JobRecord:
         """Check if job ended with a problem."""
         return self.state.is_problematic
 
-    @property
-    def gpu_hours(self) -> float:
-        """Allocated GPU-hours (n_gpus x elapsed time, not utilization)."""
-        return (self.n_gpus * self.elapsed_seconds) / 3600
-
     @classmethod
     def from_sacct(cls, job: SacctJob) -> JobRecord:
         """Parse a job record from sacct JSON output.
@@ -292,43 +375,140 @@ class JobRecord:
             Parsed JobRecord
 
         """
-        # Extract GPU count and CPU count from TRES
-        n_gpus = 0
-        n_cpus = 0
-        for tres in job.tres.allocated:
-            if tres.type == "gres" and tres.name == "gpu":
-                n_gpus = tres.count
-            elif tres.type == "cpu":
-                n_cpus = tres.count
-
-        # Parse state (using our enum)
-        state_str = job.state.current[0] if job.state.current else "UNKNOWN"
-        state = JobState.from_slurm(state_str)
-
-        # Get max RSS from steps
-        max_rss = max((step.statistics.RSS.max.value for step in job.steps), default=0)
-
-        return cls(
-            job_id=job.job_id,
-            name=job.name,
-            user=job.user,
-            qos=job.qos,
-            account=job.account,
-            n_gpus=n_gpus,
-            n_cpus=n_cpus,
-            req_mem=job.required.memory,
-            max_rss=max_rss,
-            elapsed_seconds=job.time.elapsed,
-            start_time=datetime.fromtimestamp(job.time.start, tz=UTC)
-            if job.time.start
-            else datetime.min.replace(tzinfo=UTC),
-            submission_time=datetime.fromtimestamp(job.time.submission, tz=UTC)
-            if job.time.submission
-            else datetime.min.replace(tzinfo=UTC),
-            state=state,
-            allocation_nodes=job.allocation_nodes,
+        return _job_record_from_dict(job.model_dump())
+
+
+@lru_cache(maxsize=4096)
+def _utc_datetime(timestamp: int) -> datetime:
+    """UTC datetime for a sacct epoch timestamp (0 means unset).
+
+    Cached because timestamps repeat heavily: with -T every job older than the
+    window starts exactly at the window start, array tasks share a submit time,
+    and jobs that never queued start on submission.
+    """
+    return datetime.fromtimestamp(timestamp, tz=UTC) if timestamp else _EPOCH_MIN
+
+
+def _job_record_from_dict(job: _SacctJobDict) -> JobRecord:
+    """Build a job record from a validated sacct job dict, filling in model defaults."""
+    # Extract GPU count and CPU count from TRES; each (type, name) appears at most once,
+    # so stop scanning (past mem, node, billing, licenses...) as soon as both are found
+    n_gpus = 0
+    n_cpus = 0
+    found_gpu = found_cpu = False
+    for tres in job.get("tres", {}).get("allocated", ()):
+        tres_type = tres["type"]
+        if tres_type == "gres":
+            if tres.get("name") == "gpu":
+                n_gpus = tres.get("count", 0)
+                if found_cpu:
+                    break
+                found_gpu = True
+        elif tres_type == "cpu":
+            n_cpus = tres.get("count", 0)
+            if found_gpu:
+                break
+            found_cpu = True
+
+    # Parse state (using our enum)
+    current = job.get("state", {}).get("current")
+    state = JobState.from_slurm(current[0] if current else "UNKNOWN")
+
+    # Get max RSS from steps (allocation-only queries usually have none, so skip the generator)
+    steps = job.get("steps")
+    max_rss = (
+        max((step.get("statistics", {}).get("RSS", {}).get("max", {}).get("value", 0) for step in steps), default=0)
+        if steps
+        else 0
+    )
+
+    times = job.get("time", {})
+
+    return JobRecord(
+        job_id=job["job_id"],
+        name=job.get("name", ""),
+        user=job.get("user", ""),
+        qos=job.get("qos", ""),
+        account=job.get("account", ""),
+        n_gpus=n_gpus,
+        n_cpus=n_cpus,
+        req_mem=job.get("required", {}).get("memory", ""),
+        max_rss=max_rss,
+        elapsed_seconds=times.get("elapsed", 0),
+        start_time=_utc_datetime(times.get("start", 0)),
+        submission_time=_utc_datetime(times.get("submission", 0)),
+        state=state,
+        allocation_nodes=job.get("allocation_nodes", 1),
+    )
+
+
+# sacct --format fields read by parse_sacct_parsable, in order. JobName goes last so a
+# name containing the "|" delimiter only ever spills into its own field.
+SACCT_PARSABLE_FIELDS = (
+    "JobIDRaw",
+    "User",
+    "QOS",
+    "Account",
+    "State",
+    "ElapsedRaw",
+    "Start",
+    "Submit",
+    "AllocTRES",
+    "AllocCPUS",
+    "NNodes",
+    "ReqMem",
+    "JobName",
+)
+
+_GPU_TRES_RE = re.compile(r"(?:^|,)gres/gpu=(\d+)")
+
+
+def _parse_int(value: str, default: int = 0) -> int:
+    """Parse a sacct integer field, with a default for empty or "Unknown" values."""
+    return int(value) if value.isdigit() else default
+
+
+def parse_sacct_parsable(text: str) -> list[JobRecord]:
+    """Parse pipe-delimited sacct output into JobRecords.
+
+    Args:
+        text: Raw stdout of sacct -P --noheader --format=SACCT_PARSABLE_FIELDS,
+              run with SLURM_TIME_FORMAT=%s so times are epoch seconds
+
+    Returns:
+        List of JobRecord objects (max_rss is 0: allocation lines carry no step data)
+
+    """
+    records = []
+    last = len(SACCT_PARSABLE_FIELDS) - 1
+    for line in text.splitlines():
+        fields = line.split("|", last)
+        if len(fields) <= last or not fields[0].isdigit():
+            continue
+        job_id, user, qos, account, state, elapsed, start, submit, alloc_tres, alloc_cpus, nodes, req_mem, name = (
+            fields
         )
 
+        gpu_match = _GPU_TRES_RE.search(alloc_tres)
+        records.append(
+            JobRecord(
+                job_id=int(job_id),
+                name=name,
+                user=user,
+                qos=qos,
+                account=account,
+                n_gpus=int(gpu_match.group(1)) if gpu_match else 0,
+                n_cpus=_parse_int(alloc_cpus),
+                req_mem=req_mem,
+                elapsed_seconds=_parse_int(elapsed),
+                start_time=_utc_datetime(_parse_int(start)),
+                submission_time=_utc_datetime(_parse_int(submit)),
+                state=JobState.from_slurm(state),
+                allocation_nodes=_parse_int(nodes, default=1),
+            )
+        )
+    return records
+
 
 def parse_sacct_json(data: dict[str, Any]) -> list[JobRecord]:
     """Parse sacct JSON output into JobRecords.
@@ -340,11 +520,40 @@ def parse_sacct_json(data: dict[str, Any]) -> list[JobRecord]:
         List of JobRecord objects
 
     """
-    output = SacctOutput.model_validate(data)
-    return [JobRecord.from_sacct(job) for job in output.jobs]
+    output = _SACCT_OUTPUT_ADAPTER.validate_python(data)
+    return [_job_record_from_dict(job) for job in output.get("jobs", ())]
+
+
+def parse_sacct_json_text(text: str | bytes) -> list[JobRecord]:
+    """Parse raw sacct JSON text into JobRecords.
 
+    Validates straight from the text into plain dicts holding only the fields
+    JobRecord reads, so neither json.loads' full dict tree nor per-job Sacct*
+    model instances are built for a large history. Passing the raw stdout bytes
+    also skips decoding a str copy of the whole payload first.
 
-@dataclass
+    Args:
+        text: Raw sacct --json stdout, as str or UTF-8 bytes
+
+    Returns:
+        List of JobRecord objects
+
+    Raises:
+        json.JSONDecodeError: If text is not valid JSON
+
+    """
+    try:
+        output = _SACCT_OUTPUT_ADAPTER.validate_json(text)
+    except ValidationError as e:
+        error = e.errors()[0]
+        if error["type"] == "json_invalid":
+            doc = text if isinstance(text, str) else text.decode(errors="replace")
+            raise json.JSONDecodeError(error["msg"], doc, 0) from None
+        raise
+    return [_job_record_from_dict(job) for job in output.get("jobs", ())]
+
+
+@dataclass(slots=True)
 class UsageReport:
     """A user's quota usage report.
 
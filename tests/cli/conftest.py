@@ -0,0 +1,258 @@
+# Copyright (c) 2025 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Pytest fixtures for CLI tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import contextmanager
+from functools import lru_cache
+import inspect
+import re
+import subprocess
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import typer.models
+
+from slurmq.cli.main import CLIContext, OutputFormat
+from slurmq.core.config import load_config
+from slurmq.core.models import parse_sacct_json_text
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+    from datetime import datetime
+    from pathlib import Path
+
+
+def call_command(
+    command: Callable[..., None], *, json_output: bool = False, quiet: bool = False, **options: Any
+) -> None:
+    """Call a command's callback in-process, skipping Typer/Click argument parsing.
+
+    The CLI context is built from the config SLURMQ_CONFIG points to, as the root callback would;
+    options not given take their command-line defaults. Output goes to the real sys.stdout (use capsys).
+    """
+    for name, param in inspect.signature(command).parameters.items():
+        if name != "ctx" and name not in options:
+            default = param.default
+            options[name] = default.default if isinstance(default, typer.models.OptionInfo) else default
+    output_format = OutputFormat.JSON if json_output else OutputFormat.RICH
+    ctx = SimpleNamespace(obj=CLIContext(load_config(), output_format=output_format, quiet=quiet))
+    command(ctx, **options)
+
+
+@lru_cache(maxsize=64)
+def _needles_pattern(needles: tuple[str, ...]) -> re.Pattern[str]:
+    """Case-insensitive alternation of the literal needles, compiled once per tuple."""
+    return re.compile("|".join(map(re.escape, needles)), re.IGNORECASE)
+
+
+def assert_contains_ci(text: str, *needles: str) -> None:
+    """Assert that text contains at least one of the needles, ignoring case.
+
+    Scans once with a cached regex instead of lowercasing the whole output per needle.
+    """
+    assert _needles_pattern(needles).search(text), f"none of {needles!r} found in output:\n{text}"
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One directory for the whole session's read-only config files.
+
+    Fixtures writing there must use a file name unique to them, since the files are never cleaned up between tests.
+    """
+    return tmp_path_factory.mktemp("slurmq_cfg", numbered=False)
+
+
+# CLI test configs by variant name; modules pick one in their config_file fixture
+CONFIG_VARIANTS = {
+    "normal": b"""
+default_cluster = "test"
+
+[clusters.test]
+name = "TestCluster"
+qos = ["normal"]
+quota_limit = 500
+rolling_window_days = 30
+""",
+    "research": b"""
+default_cluster = "test"
+
+[clusters.test]
+name = "TestCluster"
+account = "research"
+qos = ["high-priority"]
+quota_limit = 500
+rolling_window_days = 30
+
+[display]
+output_format = "plain"
+""",
+    "research_enforcement": b"""
+default_cluster = "test"
+
+[clusters.test]
+name = "TestCluster"
+account = "research"
+qos = ["high-priority"]
+quota_limit = 500
+rolling_window_days = 30
+
+[enforcement]
+enabled = false
+dry_run = true
+""",
+    "gpu_partition": b"""
+default_cluster = "test"
+
+[clusters.test]
+name = "Test Cluster"
+account = "research"
+qos = ["normal"]
+partitions = ["gpu"]
+quota_limit = 500
+rolling_window_days = 30
+""",
+}
+
+
+@pytest.fixture(scope="session")
+def cli_configs(shared_tmp: Path) -> dict[str, Path]:
+    """Every CONFIG_VARIANTS entry written once per session, keyed by variant name."""
+    paths = {}
+    for name, content in CONFIG_VARIANTS.items():
+        paths[name] = shared_tmp / f"cli_{name}.toml"
+        paths[name].write_bytes(content)
+    return paths
+
+
+@pytest.fixture(autouse=True, scope="session")
+def plain_terminal() -> Generator[None, None, None]:
+    """Run every CLI invocation against a dumb, colourless terminal.
+
+    Consoles created during a test (Typer's help renderer, lazily built consoles) then skip
+    colour and terminal capability detection.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("TERM", "dumb")
+        mp.setenv("NO_COLOR", "1")
+        yield
+
+
+# Per-test handlers for subprocess.run, keyed by program name (see slurm_cmds). A plain module-level
+# stack rather than a ContextVar, so commands that run sacct on worker threads (stats --compare) see it too.
+SlurmHandler = Callable[..., subprocess.CompletedProcess[str]]
+_slurm_dispatch: list[dict[str, SlurmHandler]] = []
+_real_run = subprocess.run
+
+
+def _dispatch_run(cmd: list[str], *args: object, **kwargs: object) -> subprocess.CompletedProcess[str]:
+    """Stand-in for subprocess.run that routes to the current test's slurm_cmds handlers."""
+    if not _slurm_dispatch:
+        return _real_run(cmd, *args, **kwargs)
+    handler = _slurm_dispatch[-1].get(cmd[0])
+    if handler is None:
+        pytest.fail(f"Unexpected command: {cmd}")
+    return handler(cmd, *args, **kwargs)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def route_subprocess_run() -> Generator[None, None, None]:
+    """Install the dispatching subprocess.run once, instead of monkeypatching it in every test."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(subprocess, "run", _dispatch_run)
+        yield
+
+
+@contextmanager
+def routed_commands(handlers: dict[str, SlurmHandler]) -> Iterator[dict[str, SlurmHandler]]:
+    """Route subprocess.run calls to handlers (keyed by program name) inside the block.
+
+    For fixtures broader than a single test; tests use slurm_cmds.
+    """
+    _slurm_dispatch.append(handlers)
+    try:
+        yield handlers
+    finally:
+        _slurm_dispatch.pop()
+
+
+@pytest.fixture
+def slurm_cmds() -> Generator[dict[str, SlurmHandler], None, None]:
+    """Handlers for this test's subprocess.run calls, keyed by program name (e.g. "sacct").
+
+    Once a test requests this, any command without a handler fails the test.
+    """
+    with routed_commands({}) as handlers:
+        yield handlers
+
+
+def sacct_json_as_parsable(text: str) -> str:
+    """Render sacct --json output as the pipe-delimited rows sacct -P would print for the same jobs."""
+    return "".join(
+        "|".join(
+            str(field)
+            for field in (
+                record.job_id,
+                record.user,
+                record.qos,
+                record.account,
+                record.state,
+                record.elapsed_seconds,
+                _epoch(record.start_time),
+                _epoch(record.submission_time),
+                f"gres/gpu={record.n_gpus}" if record.n_gpus else "",
+                record.n_cpus,
+                record.allocation_nodes,
+                record.req_mem,
+                record.name,
+            )
+        )
+        + "\n"
+        for record in parse_sacct_json_text(text)
+    )
+
+
+def _epoch(value: datetime) -> int:
+    """Epoch seconds as sacct prints them with SLURM_TIME_FORMAT=%s (0 for unset times)."""
+    return int(value.timestamp()) if value.year > 1 else 0
+
+
+def sacct_handler(stdout: str) -> SlurmHandler:
+    """Answer sacct with fixed output. JSON output is also served, converted, to -P queries."""
+    sacct_done = subprocess.CompletedProcess(["sacct"], 0, stdout=stdout, stderr="")
+    if not stdout.lstrip().startswith("{"):
+        return lambda _cmd, **_: sacct_done
+
+    parsable_done = subprocess.CompletedProcess(["sacct"], 0, stdout=sacct_json_as_parsable(stdout), stderr="")
+    return lambda cmd, **_: parsable_done if "-P" in cmd else sacct_done
+
+
+# install(stdout, on_scancel=None): route sacct calls to stdout and scancel calls to on_scancel(cmd)
+SacctMock = Callable[..., None]
+
+
+@pytest.fixture
+def sacct_mock(slurm_cmds: dict[str, SlurmHandler]) -> SacctMock:
+    """Answer sacct with fixed output, and scancel through an optional hook.
+
+    Any other command fails the test, as does scancel when no on_scancel hook is given.
+    """
+    # Results are built once and shared by every call; callers only read them
+    scancel_done = subprocess.CompletedProcess(["scancel"], 0, stdout="", stderr="")
+
+    def install(stdout: str, on_scancel: Callable[[list[str]], object] | None = None) -> None:
+        slurm_cmds["sacct"] = sacct_handler(stdout)
+        if on_scancel is not None:
+
+            def scancel(cmd: list[str], **_: object) -> subprocess.CompletedProcess[str]:
+                on_scancel(cmd)
+                return scancel_done
+
+            slurm_cmds["scancel"] = scancel
+
+    return install
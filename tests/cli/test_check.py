@@ -5,26 +5,35 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 import json
+import subprocess
 from typing import TYPE_CHECKING
 
 import pytest
 from typer.testing import CliRunner
 
 from slurmq.cli.main import app
+from tests.cli.conftest import assert_contains_ci
 
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from tests.cli.conftest import SacctMock, SlurmHandler
+    from tests.conftest import SetEnv
+
 runner = CliRunner()
 
+# Jobs are placed relative to module import time; the windows under test are days wide, so the drift doesn't matter
+NOW_TS = int(datetime.now(tz=UTC).timestamp())
+HOUR = 3600
+DAY = 24 * HOUR
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_sacct_output() -> dict:
-    """Sample sacct JSON output."""
-    now = datetime.now(tz=UTC)
+    """Sample sacct JSON output, built once per module (tests must not mutate it)."""
     return {
         "jobs": [
             {
@@ -36,8 +45,8 @@ def mock_sacct_output() -> dict:
                 "state": {"current": ["COMPLETED"]},
                 "time": {
                     "elapsed": 7200,
-                    "start": int((now - timedelta(days=5)).timestamp()),
-                    "submission": int((now - timedelta(days=5)).timestamp()),
+                    "start": NOW_TS - 5 * DAY,
+                    "submission": NOW_TS - 5 * DAY,
                     "limit": {"number": 86400},
                 },
                 "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 4}]},
@@ -47,34 +56,27 @@ def mock_sacct_output() -> dict:
     }
 
 
-@pytest.fixture
-def config_file(tmp_path: Path) -> Path:
-    """Create a test config file."""
-    config = tmp_path / "config.toml"
-    config.write_text("""
-default_cluster = "test"
+@pytest.fixture(scope="module")
+def mock_sacct_json(mock_sacct_output: dict) -> str:
+    """The sample sacct output, serialized once per module."""
+    return json.dumps(mock_sacct_output)
 
-[clusters.test]
-name = "TestCluster"
-account = "research"
-qos = ["high-priority"]
-quota_limit = 500
-rolling_window_days = 30
 
-[display]
-output_format = "plain"
-""")
-    return config
+@pytest.fixture(scope="module")
+def config_file(cli_configs: dict[str, Path]) -> Path:
+    """The shared "research" test config."""
+    return cli_configs["research"]
 
 
 class TestCheckCommand:
     """Tests for the check command."""
 
+    @pytest.mark.smoke
     def test_check_help(self) -> None:
         """Check command has help text."""
         result = runner.invoke(app, ["check", "--help"])
         assert result.exit_code == 0
-        assert "quota" in result.stdout.lower() or "usage" in result.stdout.lower()
+        assert_contains_ci(result.stdout, "quota", "usage")
 
     def test_check_no_config_shows_error(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Check without config shows helpful error."""
@@ -86,53 +88,34 @@ class TestCheckCommand:
         assert result.exit_code in (0, 1)
 
     def test_check_with_config(
-        self, config_file: Path, mock_sacct_output: dict, monkeypatch: pytest.MonkeyPatch
+        self, config_file: Path, mock_sacct_json: str, sacct_mock: SacctMock, set_env: SetEnv
     ) -> None:
         """Check command works with valid config."""
-        import subprocess
-
-        # Mock subprocess.run for sacct
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_sacct_output), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
-        monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
-        monkeypatch.setenv("USER", "testuser")
+        sacct_mock(mock_sacct_json)
+        set_env(SLURMQ_CONFIG=str(config_file), USER="testuser")
 
         result = runner.invoke(app, ["check"])
         assert result.exit_code == 0
 
     def test_check_json_output(
-        self, config_file: Path, mock_sacct_output: dict, monkeypatch: pytest.MonkeyPatch
+        self, config_file: Path, mock_sacct_json: str, sacct_mock: SacctMock, set_env: SetEnv
     ) -> None:
         """Check command can output JSON."""
-        import subprocess
-
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_sacct_output), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
-        monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
-        monkeypatch.setenv("USER", "testuser")
+        sacct_mock(mock_sacct_json)
+        set_env(SLURMQ_CONFIG=str(config_file), USER="testuser")
 
         # --json is a global option, must come before subcommand
         result = runner.invoke(app, ["--json", "check"])
         assert result.exit_code == 0
         # Output should be valid JSON
-        data = json.loads(result.stdout)
+        data = json.loads(result.stdout_bytes)
         assert "user" in data
         assert "used_gpu_hours" in data
 
     def test_check_cluster_override(
-        self, tmp_path: Path, mock_sacct_output: dict, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, mock_sacct_json: str, slurm_cmds: dict[str, SlurmHandler], set_env: SetEnv
     ) -> None:
         """Check command respects --cluster flag."""
-        import subprocess
-
         config = tmp_path / "config.toml"
         config.write_text("""
 default_cluster = "cluster1"
@@ -148,52 +131,42 @@ qos = ["qos2"]
 quota_limit = 200
 """)
 
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                # Verify the right QoS is being queried
-                qos_arg = [c for c in cmd if c.startswith("--qos=")]
-                if qos_arg:
-                    assert qos_arg[0] == "--qos=qos2", f"Expected qos2, got {qos_arg[0]}"
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_sacct_output), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
+        sacct_calls: list[list[str]] = []
+        sacct_done = subprocess.CompletedProcess(["sacct"], 0, stdout=mock_sacct_json, stderr="")
+
+        def sacct(cmd: list[str], **_: object) -> subprocess.CompletedProcess[str]:
+            sacct_calls.append(cmd)
+            return sacct_done
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
-        monkeypatch.setenv("SLURMQ_CONFIG", str(config))
-        monkeypatch.setenv("USER", "testuser")
+        slurm_cmds["sacct"] = sacct
+        set_env(SLURMQ_CONFIG=str(config), USER="testuser")
 
         # --cluster is a global option, must come before subcommand
         result = runner.invoke(app, ["--cluster", "cluster2", "check"])
         assert result.exit_code == 0
+        # Verify the right QoS is being queried
+        qos_args = [arg for cmd in sacct_calls for arg in cmd if arg.startswith("--qos=")]
+        assert qos_args
+        assert set(qos_args) == {"--qos=qos2"}
 
 
 class TestCheckOutput:
     """Tests for check command output formatting."""
 
     def test_plain_output_contains_key_info(
-        self, config_file: Path, mock_sacct_output: dict, monkeypatch: pytest.MonkeyPatch
+        self, config_file: Path, mock_sacct_json: str, sacct_mock: SacctMock, set_env: SetEnv
     ) -> None:
         """Plain output contains user, usage, and remaining quota."""
-        import subprocess
-
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_sacct_output), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
-        monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
-        monkeypatch.setenv("USER", "testuser")
+        sacct_mock(mock_sacct_json)
+        set_env(SLURMQ_CONFIG=str(config_file), USER="testuser")
 
         result = runner.invoke(app, ["check"])
         assert result.exit_code == 0
-        output = result.stdout.lower()
         # Should contain key information
-        assert "testuser" in output or "gpu" in output
+        assert_contains_ci(result.stdout, "testuser", "gpu")
 
-    def test_warning_status_shown(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_warning_status_shown(self, tmp_path: Path, sacct_mock: SacctMock, set_env: SetEnv) -> None:
         """Warning status is shown when usage exceeds threshold."""
-        import subprocess
-
         config = tmp_path / "config.toml"
         config.write_text("""
 default_cluster = "test"
@@ -207,7 +180,6 @@ rolling_window_days = 30
 [monitoring]
 warning_threshold = 0.8
 """)
-        now = datetime.now(tz=UTC)
         # Job uses 9 GPU-hours (90% of 10 limit)
         mock_output = {
             "jobs": [
@@ -220,24 +192,64 @@ warning_threshold = 0.8
                     "state": {"current": ["COMPLETED"]},
                     "time": {
                         "elapsed": 3600,  # 1 hour
-                        "start": int((now - timedelta(days=1)).timestamp()),
-                        "submission": int((now - timedelta(days=1)).timestamp()),
+                        "start": NOW_TS - DAY,
+                        "submission": NOW_TS - DAY,
                     },
                     "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 9}]},
                 }
             ]
         }
+        sacct_mock(json.dumps(mock_output))
+        set_env(SLURMQ_CONFIG=str(config), USER="testuser")
 
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_output), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
+        result = runner.invoke(app, ["check"])
+        assert result.exit_code == 0
+        assert_contains_ci(result.stdout, "warning", "90", "exceeded")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
-        monkeypatch.setenv("SLURMQ_CONFIG", str(config))
-        monkeypatch.setenv("USER", "testuser")
 
-        result = runner.invoke(app, ["check"])
+class TestGlobalOptions:
+    """Global options are parsed by the root callback before the subcommand runs."""
+
+    def test_version(self) -> None:
+        """--version prints the version and exits without loading a config."""
+        result = runner.invoke(app, ["--version"])
+        assert result.exit_code == 0
+        assert "slurmq" in result.stdout
+
+    def test_config_option(
+        self, config_file: Path, mock_sacct_json: str, sacct_mock: SacctMock, set_env: SetEnv
+    ) -> None:
+        """--config points at the config file instead of SLURMQ_CONFIG."""
+        sacct_mock(mock_sacct_json)
+        set_env(USER="testuser")
+
+        result = runner.invoke(app, ["--json", "--config", str(config_file), "check"])
+        assert result.exit_code == 0
+        assert json.loads(result.stdout_bytes)["user"] == "testuser"
+
+    def test_yaml_output(
+        self, config_file: Path, mock_sacct_json: str, sacct_mock: SacctMock, set_env: SetEnv
+    ) -> None:
+        """--yaml renders the report as YAML."""
+        sacct_mock(mock_sacct_json)
+        set_env(SLURMQ_CONFIG=str(config_file), USER="testuser")
+
+        result = runner.invoke(app, ["--yaml", "check"])
+        assert result.exit_code == 0
+        assert "user: testuser" in result.stdout
+
+    def test_json_and_yaml_conflict(self, config_file: Path, set_env: SetEnv) -> None:
+        """--json and --yaml together are rejected."""
+        set_env(SLURMQ_CONFIG=str(config_file))
+
+        result = runner.invoke(app, ["--json", "--yaml", "check"])
+        assert result.exit_code == 1
+
+    def test_verbose(self, config_file: Path, mock_sacct_json: str, sacct_mock: SacctMock, set_env: SetEnv) -> None:
+        """-v is accepted before the subcommand."""
+        sacct_mock(mock_sacct_json)
+        set_env(SLURMQ_CONFIG=str(config_file), USER="testuser")
+
+        result = runner.invoke(app, ["-v", "check"])
         assert result.exit_code == 0
-        output = result.stdout.lower()
-        assert "warning" in output or "90" in output or "exceeded" in output
+        assert "testuser" in result.stdout
@@ -22,6 +22,7 @@ runner = CliRunner()
 class TestConfigShow:
     """Tests for config show command."""
 
+    @pytest.mark.smoke
     def test_config_show_help(self) -> None:
         """Config show has help text."""
         result = runner.invoke(app, ["config", "show", "--help"])
@@ -41,7 +42,7 @@ quota_limit = 750
 
         result = runner.invoke(app, ["config", "show"])
         assert result.exit_code == 0
-        assert "mytest" in result.stdout.lower()
+        assert "mytest" in result.stdout.casefold()
 
 
 class TestConfigPath:
@@ -72,7 +73,7 @@ class TestConfigInit:
         # Should create the file
         assert config_path.exists()
         content = config_path.read_text()
-        assert "stella" in content.lower()
+        assert "stella" in content.casefold()
 
     def test_config_init_does_not_overwrite_existing(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Config init warns if config already exists."""
@@ -94,7 +95,7 @@ class TestConfigInit:
         runner.invoke(app, ["config", "init"], input="y\nnewcluster\nNew Cluster\nmyaccount\nnormal\n100\n14\n")
 
         content = config_path.read_text()
-        assert "newcluster" in content.lower()
+        assert "newcluster" in content.casefold()
         assert "oldclustername" not in content  # Original cluster name should be gone
 
 
@@ -121,3 +122,32 @@ quota_limit = 500
 
         config = load_config(config_path)
         assert config.clusters["test"].quota_limit == 750
+
+    def test_parse_value_types(self) -> None:
+        """Values are coerced to int, float, bool or left as strings."""
+        from slurmq.cli.commands.config import _parse_value
+
+        assert _parse_value("750") == 750
+        assert _parse_value("-3") == -3
+        assert _parse_value("0.8") == 0.8
+        assert _parse_value("1e3") == 1000.0
+        assert _parse_value("Yes") is True
+        assert _parse_value("off") is False
+        assert _parse_value("high-priority") == "high-priority"
+        assert _parse_value("1.2.3") == "1.2.3"
+
+    def test_parse_value_matches_int_and_float(self) -> None:
+        """Anything int() or float() accepts is stored as a number, not a string."""
+        import math
+
+        from slurmq.cli.commands.config import _parse_value
+
+        assert _parse_value("1_000") == 1000
+        assert _parse_value(" 5") == 5
+        assert _parse_value("5\n") == 5
+        assert _parse_value("1_000.5") == 1000.5
+        assert _parse_value("1E5") == 100000.0
+        assert _parse_value("inf") == math.inf
+        assert _parse_value("-Infinity") == -math.inf
+        assert math.isnan(_parse_value("nan"))
+        assert _parse_value("1.5e") == "1.5e"
@@ -5,12 +5,14 @@
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
 import pytest
 from typer.testing import CliRunner
 
 from slurmq.cli.main import app
+from tests.cli.conftest import assert_contains_ci
 
 
 if TYPE_CHECKING:
@@ -22,11 +24,12 @@ runner = CliRunner()
 class TestConfigValidateCommand:
     """Tests for the config validate subcommand."""
 
+    @pytest.mark.smoke
     def test_validate_help(self) -> None:
         """Config validate has help text."""
         result = runner.invoke(app, ["config", "validate", "--help"])
         assert result.exit_code == 0
-        assert "validate" in result.stdout.lower()
+        assert "validate" in result.stdout.casefold()
 
     def test_validate_valid_config(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Valid config passes validation."""
@@ -43,7 +46,7 @@ quota_limit = 500
 
         result = runner.invoke(app, ["config", "validate"])
         assert result.exit_code == 0
-        assert "valid" in result.stdout.lower() or "ok" in result.stdout.lower()
+        assert_contains_ci(result.stdout, "valid", "ok")
 
     def test_validate_invalid_toml(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Invalid TOML fails validation."""
@@ -78,12 +81,10 @@ name = "Test"
         """Nonexistent file fails validation."""
         result = runner.invoke(app, ["config", "validate", "--file", str(tmp_path / "nope.toml")])
         assert result.exit_code != 0
-        assert "not found" in result.stdout.lower() or "exist" in result.stdout.lower()
+        assert_contains_ci(result.stdout, "not found", "exist")
 
     def test_validate_json_output(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """--json outputs validation result as JSON."""
-        import json
-
         config = tmp_path / "config.toml"
         config.write_text("""
 [clusters.test]
@@ -93,14 +94,12 @@ name = "Test"
 
         result = runner.invoke(app, ["--json", "config", "validate"])
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = json.loads(result.stdout_bytes)
         assert "valid" in data
         assert data["valid"] is True
 
     def test_validate_json_with_errors(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """--json includes errors array when validation fails."""
-        import json
-
         config = tmp_path / "config.toml"
         config.write_text('default_cluster = "missing"')
         monkeypatch.setenv("SLURMQ_CONFIG", str(config))
@@ -108,7 +107,7 @@ name = "Test"
         result = runner.invoke(app, ["--json", "config", "validate"])
         # Exit code 1 for invalid
         assert result.exit_code != 0
-        data = json.loads(result.stdout)
+        data = json.loads(result.stdout_bytes)
         assert data["valid"] is False
         assert "errors" in data
         assert len(data["errors"]) > 0
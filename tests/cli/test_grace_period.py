@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 import json
 from typing import TYPE_CHECKING
 
@@ -13,64 +13,52 @@ import pytest
 from typer.testing import CliRunner
 
 from slurmq.cli.main import app
+from tests.cli.conftest import assert_contains_ci
 
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from tests.cli.conftest import SacctMock
+
 runner = CliRunner()
 
 
+# Jobs are placed relative to module import time; grace windows are hours wide, so the drift doesn't matter
+NOW_TS = int(datetime.now(tz=UTC).timestamp())
+
+# Fields shared by every mock job
+JOB_TEMPLATE = {"account": "research", "qos": "normal", "allocation_nodes": 1}
+
+
 def make_job(
     job_id: int, user: str, gpu_count: int, elapsed_hours: float, state: str = "RUNNING", days_ago: float = 0
 ) -> dict:
     """Create a mock job record."""
-    now = datetime.now(tz=UTC)
-    start = now - timedelta(days=days_ago, hours=elapsed_hours)
+    elapsed = int(elapsed_hours * 3600)
+    start = NOW_TS - int(days_ago * 86400) - elapsed
     return {
+        **JOB_TEMPLATE,
         "job_id": job_id,
         "name": f"job_{job_id}",
         "user": user,
-        "account": "research",
-        "qos": "normal",
         "state": {"current": [state]},
-        "time": {
-            "elapsed": int(elapsed_hours * 3600),
-            "start": int(start.timestamp()),
-            "submission": int(start.timestamp()),
-            "limit": {"number": 86400},
-        },
+        "time": {"elapsed": elapsed, "start": start, "submission": start, "limit": {"number": 86400}},
         "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": gpu_count}]},
-        "allocation_nodes": 1,
     }
 
 
-@pytest.fixture
-def config_with_grace_period(tmp_path: Path) -> Path:
-    """Config with 24-hour grace period."""
-    config = tmp_path / "config.toml"
-    config.write_text("""
-default_cluster = "test"
+# (job_id, user, gpu_count, elapsed_hours, state, days_ago)
+JobRow = tuple[int, str, int, float, str, float]
 
-[clusters.test]
-name = "TestCluster"
-qos = ["normal"]
-quota_limit = 10
-rolling_window_days = 30
 
-[enforcement]
-enabled = true
-dry_run = true
-grace_period_hours = 24
-""")
-    return config
+def make_jobs(rows: list[JobRow]) -> list[dict]:
+    """Create mock job records from (job_id, user, gpu_count, elapsed_hours, state, days_ago) rows."""
+    return [make_job(*row) for row in rows]
 
 
-@pytest.fixture
-def config_no_grace_period(tmp_path: Path) -> Path:
-    """Config with no grace period."""
-    config = tmp_path / "config.toml"
-    config.write_text("""
+# Low-quota enforcement config; only the grace period differs between fixtures
+ENFORCEMENT_CONFIG = b"""
 default_cluster = "test"
 
 [clusters.test]
@@ -82,8 +70,23 @@ rolling_window_days = 30
 [enforcement]
 enabled = true
 dry_run = true
-grace_period_hours = 0
-""")
+grace_period_hours = %d
+"""
+
+
+@pytest.fixture(scope="module")
+def config_with_grace_period(shared_tmp: Path) -> Path:
+    """Config with 24-hour grace period."""
+    config = shared_tmp / "grace_24h.toml"
+    config.write_bytes(ENFORCEMENT_CONFIG % 24)
+    return config
+
+
+@pytest.fixture(scope="module")
+def config_no_grace_period(shared_tmp: Path) -> Path:
+    """Config with no grace period."""
+    config = shared_tmp / "grace_none.toml"
+    config.write_bytes(ENFORCEMENT_CONFIG % 0)
     return config
 
 
@@ -91,129 +94,133 @@ class TestGracePeriod:
     """Tests for grace period enforcement logic."""
 
     def test_job_within_grace_period_not_cancelled(
-        self, config_with_grace_period: Path, monkeypatch: pytest.MonkeyPatch
+        self, config_with_grace_period: Path, monkeypatch: pytest.MonkeyPatch, sacct_mock: SacctMock
     ) -> None:
         """Jobs from users who exceeded quota within grace period are not cancelled."""
-        import subprocess
-
         # User exceeded quota 12 hours ago (within 24h grace)
         # They have 15 GPU-hours used (over 10 limit)
         mock_output = {
-            "jobs": [
-                # Old completed job that pushed them over (started 12h ago, ran 8h with 2 GPUs = 16 GPU-h)
-                make_job(1001, "testuser", 2, 8, "COMPLETED", days_ago=0.5),
-                # Current running job
-                make_job(1002, "testuser", 1, 1, "RUNNING", days_ago=0),
-            ]
+            "jobs": make_jobs(
+                [
+                    # Old completed job that pushed them over (started 12h ago, ran 8h with 2 GPUs = 16 GPU-h)
+                    (1001, "testuser", 2, 8, "COMPLETED", 0.5),
+                    # Current running job
+                    (1002, "testuser", 1, 1, "RUNNING", 0),
+                ]
+            )
         }
 
-        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess[str]:
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_output), stderr="")
-            if cmd[0] == "scancel":
-                pytest.fail("scancel should not be called during grace period")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        # Count scancel calls rather than failing inside the mock, which would unwind through Click
+        scancel_calls: list[list[str]] = []
+        sacct_mock(json.dumps(mock_output), on_scancel=scancel_calls.append)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_with_grace_period))
 
         result = runner.invoke(app, ["monitor", "--once", "--enforce"])
         assert result.exit_code == 0
+        assert not scancel_calls, "scancel should not be called during grace period"
         # Should mention grace period
-        output = result.stdout.lower()
+        output = result.stdout.casefold()
         assert "grace" in output or "would_cancel" not in output
 
     def test_job_outside_grace_period_cancelled(
-        self, config_with_grace_period: Path, monkeypatch: pytest.MonkeyPatch
+        self, config_with_grace_period: Path, monkeypatch: pytest.MonkeyPatch, sacct_mock: SacctMock
     ) -> None:
         """Jobs from users who exceeded quota outside grace period are cancelled."""
-        import subprocess
-
         # User exceeded quota 36 hours ago (outside 24h grace)
         mock_output = {
-            "jobs": [
-                # Old completed job that pushed them over (started 36h ago)
-                make_job(1001, "testuser", 2, 8, "COMPLETED", days_ago=1.5),
-                # Current running job - should be cancelled
-                make_job(1002, "testuser", 1, 1, "RUNNING", days_ago=0),
-            ]
+            "jobs": make_jobs(
+                [
+                    # Old completed job that pushed them over (started 36h ago)
+                    (1001, "testuser", 2, 8, "COMPLETED", 1.5),
+                    # Current running job - should be cancelled
+                    (1002, "testuser", 1, 1, "RUNNING", 0),
+                ]
+            )
         }
 
-        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess[str]:
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_output), stderr="")
-            if cmd[0] == "scancel":
-                # In dry_run mode, scancel shouldn't be called
-                # But the action should be logged as "would_cancel"
-                return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        # In dry_run mode scancel shouldn't run, but the action should be logged as "would_cancel"
+        sacct_mock(json.dumps(mock_output), on_scancel=lambda _cmd: None)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_with_grace_period))
 
         result = runner.invoke(app, ["monitor", "--once", "--enforce"])
         assert result.exit_code == 0
         # Should indicate job would be cancelled
-        assert "would" in result.stdout.lower() or "cancel" in result.stdout.lower()
+        assert_contains_ci(result.stdout, "would", "cancel")
 
     def test_zero_grace_period_cancels_immediately(
-        self, config_no_grace_period: Path, monkeypatch: pytest.MonkeyPatch
+        self, config_no_grace_period: Path, monkeypatch: pytest.MonkeyPatch, sacct_mock: SacctMock
     ) -> None:
         """With grace_period_hours=0, jobs are cancelled immediately."""
-        import subprocess
-
         mock_output = {
-            "jobs": [
-                # Job that just exceeded quota
-                make_job(1001, "testuser", 2, 6, "COMPLETED", days_ago=0.1),
-                make_job(1002, "testuser", 1, 1, "RUNNING", days_ago=0),
-            ]
+            "jobs": make_jobs(
+                [
+                    # Job that just exceeded quota
+                    (1001, "testuser", 2, 6, "COMPLETED", 0.1),
+                    (1002, "testuser", 1, 1, "RUNNING", 0),
+                ]
+            )
         }
 
-        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess[str]:
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_output), stderr="")
-            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        sacct_mock(json.dumps(mock_output), on_scancel=lambda _cmd: None)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_no_grace_period))
 
         result = runner.invoke(app, ["monitor", "--once", "--enforce"])
         assert result.exit_code == 0
         # Should indicate enforcement action
-        output = result.stdout.lower()
-        assert "cancel" in output or "enforce" in output
+        assert_contains_ci(result.stdout, "cancel", "enforce")
 
 
 class TestGracePeriodJSON:
     """Tests for grace period in JSON output."""
 
     def test_json_includes_grace_period_status(
-        self, config_with_grace_period: Path, monkeypatch: pytest.MonkeyPatch
+        self, config_with_grace_period: Path, monkeypatch: pytest.MonkeyPatch, sacct_mock: SacctMock
     ) -> None:
         """JSON output includes whether user is in grace period."""
-        import subprocess
-
         mock_output = {
-            "jobs": [
-                make_job(1001, "testuser", 2, 8, "COMPLETED", days_ago=0.5),
-                make_job(1002, "testuser", 1, 1, "RUNNING", days_ago=0),
-            ]
+            "jobs": make_jobs([(1001, "testuser", 2, 8, "COMPLETED", 0.5), (1002, "testuser", 1, 1, "RUNNING", 0)])
         }
 
-        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess[str]:
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_output), stderr="")
-            return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        sacct_mock(json.dumps(mock_output), on_scancel=lambda _cmd: None)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_with_grace_period))
 
         result = runner.invoke(app, ["--json", "monitor", "--once"])
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = json.loads(result.stdout_bytes)
         # Should have user data with grace period info
         assert "users" in data
         if data["users"]:
             user = data["users"][0]
             assert "in_grace_period" in user or "exceeded_at" in user
+
+
+class TestFindExceededTimestamp:
+    """Tests for locating the moment a user first exceeded quota."""
+
+    def test_returns_start_of_job_that_crossed_quota(self) -> None:
+        """The crossing job is the first whose running total is strictly above the quota."""
+        from slurmq.cli.commands.monitor import _find_exceeded_timestamp
+        from slurmq.core.models import parse_sacct_json
+
+        jobs = make_jobs(
+            [
+                (1, "testuser", 1, 5, "COMPLETED", 3),  # 5 GPU-h
+                (2, "testuser", 1, 5, "COMPLETED", 2),  # 10 GPU-h total, not above
+                (3, "testuser", 1, 1, "COMPLETED", 1),  # 11 GPU-h total, crosses
+            ]
+        )
+        records = parse_sacct_json({"jobs": jobs})
+
+        exceeded_at = records[2].start_time.timestamp()
+        assert _find_exceeded_timestamp(records, quota_limit=10) == exceeded_at
+        assert _find_exceeded_timestamp(list(reversed(records)), quota_limit=10) == exceeded_at
+
+    def test_returns_none_when_never_exceeded(self) -> None:
+        """Users whose running total stays within quota have no exceeded timestamp."""
+        from slurmq.cli.commands.monitor import _find_exceeded_timestamp
+        from slurmq.core.models import parse_sacct_json
+
+        records = parse_sacct_json({"jobs": [make_job(1, "testuser", 1, 5, "COMPLETED", days_ago=1)]})
+
+        assert _find_exceeded_timestamp(records, quota_limit=10) is None
+        assert _find_exceeded_timestamp([], quota_limit=10) is None
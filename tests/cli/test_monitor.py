@@ -5,26 +5,33 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 import json
+import subprocess
 from typing import TYPE_CHECKING
 
 import pytest
 from typer.testing import CliRunner
 
 from slurmq.cli.main import app
+from tests.cli.conftest import assert_contains_ci, sacct_handler
 
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from tests.cli.conftest import SacctMock
+
 runner = CliRunner()
 
+# Jobs are placed relative to module import time; the windows under test are days wide, so the drift doesn't matter
+NOW_TS = int(datetime.now(tz=UTC).timestamp())
+HOUR = 3600
+DAY = 24 * HOUR
 
-@pytest.fixture
-def mock_all_users_sacct() -> dict:
-    """Sample sacct output with multiple users."""
-    now = datetime.now(tz=UTC)
+
+def _all_users_sacct() -> dict:
+    """Build sample sacct output with multiple users."""
     return {
         "jobs": [
             {
@@ -34,11 +41,7 @@ def mock_all_users_sacct() -> dict:
                 "account": "research",
                 "qos": "high-priority",
                 "state": {"current": ["RUNNING"]},
-                "time": {
-                    "elapsed": 7200,
-                    "start": int((now - timedelta(hours=2)).timestamp()),
-                    "submission": int((now - timedelta(hours=2)).timestamp()),
-                },
+                "time": {"elapsed": 7200, "start": NOW_TS - 2 * HOUR, "submission": NOW_TS - 2 * HOUR},
                 "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 4}]},
             },
             {
@@ -48,11 +51,7 @@ def mock_all_users_sacct() -> dict:
                 "account": "research",
                 "qos": "high-priority",
                 "state": {"current": ["RUNNING"]},
-                "time": {
-                    "elapsed": 3600,
-                    "start": int((now - timedelta(hours=1)).timestamp()),
-                    "submission": int((now - timedelta(hours=1)).timestamp()),
-                },
+                "time": {"elapsed": 3600, "start": NOW_TS - HOUR, "submission": NOW_TS - HOUR},
                 "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 2}]},
             },
         ]
@@ -60,150 +59,148 @@ def mock_all_users_sacct() -> dict:
 
 
 @pytest.fixture
-def config_file(tmp_path: Path) -> Path:
-    """Create a test config file."""
-    config = tmp_path / "config.toml"
-    config.write_text("""
+def mock_all_users_sacct() -> dict:
+    """Sample sacct output with multiple users (a fresh dict per test)."""
+    return _all_users_sacct()
+
+
+@pytest.fixture(scope="session")
+def mock_all_users_sacct_json() -> str:
+    """Sample sacct output with multiple users, serialized once per session."""
+    return json.dumps(_all_users_sacct())
+
+
+@pytest.fixture(scope="module")
+def config_file(cli_configs: dict[str, Path]) -> Path:
+    """The shared "research_enforcement" test config."""
+    return cli_configs["research_enforcement"]
+
+
+# Low-quota enforcement config; variants differ only in the [enforcement] options
+ENFORCEMENT_CONFIG = b"""
 default_cluster = "test"
 
 [clusters.test]
 name = "TestCluster"
-account = "research"
 qos = ["high-priority"]
-quota_limit = 500
-rolling_window_days = 30
+quota_limit = 1  # Very low to trigger enforcement
 
 [enforcement]
-enabled = false
-dry_run = true
-""")
-    return config
+enabled = true
+%s
+"""
+
+ENFORCEMENT_VARIANTS = {
+    "dry_run": b"dry_run = true",
+    "exempt_alice": b'dry_run = false\nexempt_users = ["alice"]  # Alice is exempt',
+}
+
+
+@pytest.fixture(scope="session")
+def enforcement_configs(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Enforcement config files, written once per session and keyed by variant name."""
+    config_dir = tmp_path_factory.mktemp("enforcement")
+    configs = {}
+    for name, options in ENFORCEMENT_VARIANTS.items():
+        configs[name] = config_dir / f"{name}.toml"
+        configs[name].write_bytes(ENFORCEMENT_CONFIG % options)
+    return configs
 
 
 class TestMonitorCommand:
     """Tests for the monitor command."""
 
+    @pytest.mark.smoke
     def test_monitor_help(self) -> None:
         """Monitor command has help text."""
         result = runner.invoke(app, ["monitor", "--help"])
         assert result.exit_code == 0
-        assert "monitor" in result.stdout.lower()
+        assert "monitor" in result.stdout.casefold()
 
     def test_monitor_once_mode(
-        self, config_file: Path, mock_all_users_sacct: dict, monkeypatch: pytest.MonkeyPatch
+        self, config_file: Path, mock_all_users_sacct_json: str, sacct_mock: SacctMock, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Monitor --once shows status and exits."""
-        import subprocess
-
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_all_users_sacct), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        sacct_mock(mock_all_users_sacct_json)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
 
         result = runner.invoke(app, ["monitor", "--once"])
         assert result.exit_code == 0
         # Should show user info
-        assert "alice" in result.stdout.lower() or "bob" in result.stdout.lower()
+        assert_contains_ci(result.stdout, "alice", "bob")
 
     def test_monitor_json_output(
-        self, config_file: Path, mock_all_users_sacct: dict, monkeypatch: pytest.MonkeyPatch
+        self, config_file: Path, mock_all_users_sacct_json: str, sacct_mock: SacctMock, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Monitor --once --json outputs JSON."""
-        import subprocess
-
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_all_users_sacct), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        sacct_mock(mock_all_users_sacct_json)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
 
         result = runner.invoke(app, ["--json", "monitor", "--once"])
         assert result.exit_code == 0
-        data = json.loads(result.stdout)
+        data = json.loads(result.stdout_bytes)
         assert "users" in data
 
+    def test_monitor_fetches_pipe_delimited_output(
+        self, config_file: Path, mock_all_users_sacct_json: str, slurm_cmds, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The all-users query asks sacct for -P output rather than --json."""
+        calls: list[list[str]] = []
+        answer = sacct_handler(mock_all_users_sacct_json)
+
+        def sacct(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+            calls.append(cmd)
+            return answer(cmd, **kwargs)
+
+        slurm_cmds["sacct"] = sacct
+        monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
+
+        result = runner.invoke(app, ["monitor", "--once"])
+        assert result.exit_code == 0
+        assert_contains_ci(result.stdout, "alice", "bob")
+        assert [("-P" in cmd, "--json" in cmd) for cmd in calls] == [(True, False)]
+
 
 class TestMonitorEnforcement:
     """Tests for monitor enforcement behavior."""
 
     def test_enforce_dry_run_does_not_cancel(
-        self, config_file: Path, mock_all_users_sacct: dict, monkeypatch: pytest.MonkeyPatch
+        self,
+        enforcement_configs: dict[str, Path],
+        mock_all_users_sacct_json: str,
+        sacct_mock: SacctMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Enforce with dry_run=true logs but doesn't cancel."""
-        import subprocess
-
         cancelled_jobs: list[int] = []
-
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_all_users_sacct), stderr="")
-            if cmd[0] == "scancel":
-                cancelled_jobs.append(int(cmd[1]))
-                return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        sacct_mock(
+            mock_all_users_sacct_json,
+            on_scancel=lambda cmd: cancelled_jobs.extend(int(arg) for arg in cmd[1:] if arg.isdigit()),
+        )
 
         # Config with enforcement enabled but dry_run
-        config = config_file.parent / "enforce_config.toml"
-        config.write_text("""
-default_cluster = "test"
-
-[clusters.test]
-name = "TestCluster"
-qos = ["high-priority"]
-quota_limit = 1  # Very low to trigger enforcement
-
-[enforcement]
-enabled = true
-dry_run = true
-""")
-        monkeypatch.setenv("SLURMQ_CONFIG", str(config))
+        monkeypatch.setenv("SLURMQ_CONFIG", str(enforcement_configs["dry_run"]))
 
         runner.invoke(app, ["monitor", "--once", "--enforce"])
         # Should NOT actually cancel jobs in dry run mode
         assert len(cancelled_jobs) == 0
 
     def test_enforce_respects_exempt_users(
-        self, tmp_path: Path, mock_all_users_sacct: dict, monkeypatch: pytest.MonkeyPatch
+        self,
+        enforcement_configs: dict[str, Path],
+        mock_all_users_sacct_json: str,
+        sacct_mock: SacctMock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Enforcement skips exempt users."""
-        import subprocess
-
         cancelled_jobs: list[int] = []
+        sacct_mock(
+            mock_all_users_sacct_json,
+            # scancel may have a -Q flag before the job IDs
+            on_scancel=lambda cmd: cancelled_jobs.extend(int(arg) for arg in cmd[1:] if arg.isdigit()),
+        )
 
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_all_users_sacct), stderr="")
-            if cmd[0] == "scancel":
-                # scancel may have -Q flag, job_id is last argument
-                job_id = int(cmd[-1])
-                cancelled_jobs.append(job_id)
-                return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
-
-        config = tmp_path / "config.toml"
-        config.write_text("""
-default_cluster = "test"
-
-[clusters.test]
-name = "TestCluster"
-qos = ["high-priority"]
-quota_limit = 1
-
-[enforcement]
-enabled = true
-dry_run = false
-exempt_users = ["alice"]  # Alice is exempt
-""")
-        monkeypatch.setenv("SLURMQ_CONFIG", str(config))
+        monkeypatch.setenv("SLURMQ_CONFIG", str(enforcement_configs["exempt_alice"]))
 
         result = runner.invoke(app, ["monitor", "--once", "--enforce"])
         assert result.exit_code == 0
@@ -215,21 +212,54 @@ class TestMonitorActiveJobs:
     """Tests for active job display."""
 
     def test_shows_active_jobs(
-        self, config_file: Path, mock_all_users_sacct: dict, monkeypatch: pytest.MonkeyPatch
+        self, config_file: Path, mock_all_users_sacct_json: str, sacct_mock: SacctMock, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Monitor shows active jobs."""
-        import subprocess
-
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_all_users_sacct), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        sacct_mock(mock_all_users_sacct_json)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
 
         result = runner.invoke(app, ["monitor", "--once"])
         assert result.exit_code == 0
         # All jobs in fixture are RUNNING
-        output = result.stdout.lower()
-        assert "running" in output or "active" in output or "alice" in output
+        assert_contains_ci(result.stdout, "running", "active", "alice")
+
+
+class TestCheckEnforcement:
+    """Tests for enforcement decisions on exceeded users."""
+
+    def test_exempt_prefixes_and_users(self, mock_all_users_sacct: dict) -> None:
+        """Jobs matching an exempt prefix and jobs of exempt users are skipped."""
+        from slurmq.cli.commands.monitor import EnforcementAction, UserStatus, check_enforcement
+        from slurmq.core.config import EnforcementConfig
+        from slurmq.core.models import QuotaStatus, parse_sacct_json
+
+        alice_job, bob_job = parse_sacct_json(mock_all_users_sacct)
+        statuses = [
+            UserStatus("alice", 10, -5, 2.0, QuotaStatus.EXCEEDED, [alice_job]),
+            UserStatus("bob", 10, -5, 2.0, QuotaStatus.EXCEEDED, [bob_job]),
+        ]
+
+        by_prefix = check_enforcement(statuses, EnforcementConfig(exempt_job_prefixes=["alice_"]), dry_run=True)
+        assert by_prefix == [("alice", 1, EnforcementAction.EXEMPT_PREFIX), ("bob", 2, EnforcementAction.WOULD_CANCEL)]
+
+        by_user = check_enforcement(statuses, EnforcementConfig(exempt_users=["bob"]), dry_run=True)
+        assert by_user == [("alice", 1, EnforcementAction.WOULD_CANCEL), ("bob", 2, EnforcementAction.EXEMPT_USER)]
+
+    def test_cancellations_are_batched(self, mock_all_users_sacct: dict, sacct_mock: SacctMock) -> None:
+        """All cancellable jobs go to one scancel invocation."""
+        from slurmq.cli.commands.monitor import EnforcementAction, UserStatus, check_enforcement
+        from slurmq.core.config import EnforcementConfig
+        from slurmq.core.models import QuotaStatus, parse_sacct_json
+
+        calls: list[list[str]] = []
+        sacct_mock("", on_scancel=calls.append)
+
+        alice_job, bob_job = parse_sacct_json(mock_all_users_sacct)
+        statuses = [
+            UserStatus("alice", 10, -5, 2.0, QuotaStatus.EXCEEDED, [alice_job]),
+            UserStatus("bob", 10, -5, 2.0, QuotaStatus.EXCEEDED, [bob_job]),
+        ]
+
+        actions = check_enforcement(statuses, EnforcementConfig(), dry_run=False)
+        assert [action for _, _, action in actions] == [EnforcementAction.CANCELLED] * 2
+        assert calls == [["scancel", "-Q", "1", "2"]]
@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 import json
 from typing import TYPE_CHECKING
 
@@ -18,29 +18,26 @@ from slurmq.cli.main import app
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from tests.cli.conftest import SacctMock
+    from tests.conftest import SetEnv
+
 runner = CliRunner()
 
+# Jobs are placed relative to module import time; the windows under test are days wide, so the drift doesn't matter
+NOW_TS = int(datetime.now(tz=UTC).timestamp())
+HOUR = 3600
+DAY = 24 * HOUR
 
-@pytest.fixture
-def config_file(tmp_path: Path) -> Path:
-    """Create a test config file."""
-    config = tmp_path / "config.toml"
-    config.write_text("""
-default_cluster = "test"
 
-[clusters.test]
-name = "TestCluster"
-qos = ["normal"]
-quota_limit = 500
-rolling_window_days = 30
-""")
-    return config
+@pytest.fixture(scope="module")
+def config_file(cli_configs: dict[str, Path]) -> Path:
+    """The shared "normal" test config."""
+    return cli_configs["normal"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_sacct_output() -> dict:
-    """Sample sacct JSON output."""
-    now = datetime.now(tz=UTC)
+    """Sample sacct JSON output, built once per module (tests must not mutate it)."""
     return {
         "jobs": [
             {
@@ -52,8 +49,8 @@ def mock_sacct_output() -> dict:
                 "state": {"current": ["COMPLETED"]},
                 "time": {
                     "elapsed": 3600,
-                    "start": int((now - timedelta(days=1)).timestamp()),
-                    "submission": int((now - timedelta(days=1)).timestamp()),
+                    "start": NOW_TS - DAY,
+                    "submission": NOW_TS - DAY,
                     "limit": {"number": 86400},
                 },
                 "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 2}]},
@@ -63,9 +60,16 @@ def mock_sacct_output() -> dict:
     }
 
 
+@pytest.fixture(scope="module")
+def mock_sacct_json(mock_sacct_output: dict) -> str:
+    """The sample sacct output, serialized once per module."""
+    return json.dumps(mock_sacct_output)
+
+
 class TestQuietMode:
     """Tests for the --quiet flag."""
 
+    @pytest.mark.smoke
     def test_quiet_flag_exists(self) -> None:
         """--quiet flag is recognized."""
         result = runner.invoke(app, ["--help"])
@@ -73,19 +77,11 @@ class TestQuietMode:
         assert "--quiet" in result.stdout or "-q" in result.stdout
 
     def test_check_quiet_suppresses_output(
-        self, config_file: Path, mock_sacct_output: dict, monkeypatch: pytest.MonkeyPatch
+        self, config_file: Path, mock_sacct_json: str, sacct_mock: SacctMock, set_env: SetEnv
     ) -> None:
         """Check --quiet produces no output on success."""
-        import subprocess
-
-        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess[str]:
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_sacct_output), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
-        monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
-        monkeypatch.setenv("USER", "testuser")
+        sacct_mock(mock_sacct_json)
+        set_env(SLURMQ_CONFIG=str(config_file), USER="testuser")
 
         result = runner.invoke(app, ["--quiet", "check"])
         assert result.exit_code == 0
@@ -101,42 +97,28 @@ class TestQuietMode:
         assert result.exit_code != 0
 
     def test_monitor_quiet_suppresses_table(
-        self, config_file: Path, mock_sacct_output: dict, monkeypatch: pytest.MonkeyPatch
+        self, config_file: Path, mock_sacct_json: str, sacct_mock: SacctMock, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Monitor --once --quiet produces no output on success."""
-        import subprocess
-
-        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess[str]:
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_sacct_output), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        sacct_mock(mock_sacct_json)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
 
-        result = runner.invoke(app, ["--quiet", "monitor", "--once"])
+        result = runner.invoke(app, ["-q", "monitor", "--once"])
         assert result.exit_code == 0
         # Should have no table output
-        assert "User" not in result.stdout
-        assert "GPU" not in result.stdout
+        stdout = result.stdout
+        assert "User" not in stdout
+        assert "GPU" not in stdout
 
     def test_quiet_with_json_still_outputs_json(
-        self, config_file: Path, mock_sacct_output: dict, monkeypatch: pytest.MonkeyPatch
+        self, config_file: Path, mock_sacct_json: str, sacct_mock: SacctMock, set_env: SetEnv
     ) -> None:
         """--quiet --json still outputs JSON (quiet only affects rich output)."""
-        import subprocess
-
-        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess[str]:
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_sacct_output), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
-        monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
-        monkeypatch.setenv("USER", "testuser")
+        sacct_mock(mock_sacct_json)
+        set_env(SLURMQ_CONFIG=str(config_file), USER="testuser")
 
         result = runner.invoke(app, ["--quiet", "--json", "check"])
         assert result.exit_code == 0
         # Should still have JSON output
-        data = json.loads(result.stdout)
+        data = json.loads(result.stdout_bytes)
         assert "user" in data
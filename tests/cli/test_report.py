@@ -5,28 +5,38 @@
 
 from __future__ import annotations
 
-import csv
-from datetime import UTC, datetime, timedelta
-import io
+from datetime import UTC, datetime
 import json
+import subprocess
 from typing import TYPE_CHECKING
 
 import pytest
 from typer.testing import CliRunner
 
+from slurmq.cli.commands.report import aggregate_by_user, report
 from slurmq.cli.main import app
+from slurmq.core.config import ClusterConfig
+from slurmq.core.models import parse_sacct_json
+from slurmq.core.quota import QuotaChecker, clear_fetch_cache
+from tests.cli.conftest import assert_contains_ci, call_command, routed_commands, sacct_handler
 
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from tests.cli.conftest import SacctMock
+
 runner = CliRunner()
 
+# Jobs are placed relative to module import time; the windows under test are days wide, so the drift doesn't matter
+NOW_TS = int(datetime.now(tz=UTC).timestamp())
+HOUR = 3600
+DAY = 24 * HOUR
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_all_users_sacct() -> dict:
-    """Sample sacct output with multiple users."""
-    now = datetime.now(tz=UTC)
+    """Sample sacct output with multiple users, built once per module (tests must not mutate it)."""
     return {
         "jobs": [
             {
@@ -38,8 +48,8 @@ def mock_all_users_sacct() -> dict:
                 "state": {"current": ["COMPLETED"]},
                 "time": {
                     "elapsed": 7200,  # 2h -> 8 GPU-hrs with 4 GPUs
-                    "start": int((now - timedelta(days=5)).timestamp()),
-                    "submission": int((now - timedelta(days=5)).timestamp()),
+                    "start": NOW_TS - 5 * DAY,
+                    "submission": NOW_TS - 5 * DAY,
                 },
                 "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 4}]},
             },
@@ -52,8 +62,8 @@ def mock_all_users_sacct() -> dict:
                 "state": {"current": ["COMPLETED"]},
                 "time": {
                     "elapsed": 3600,  # 1h -> 2 GPU-hrs with 2 GPUs
-                    "start": int((now - timedelta(days=2)).timestamp()),
-                    "submission": int((now - timedelta(days=2)).timestamp()),
+                    "start": NOW_TS - 2 * DAY,
+                    "submission": NOW_TS - 2 * DAY,
                 },
                 "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 2}]},
             },
@@ -66,8 +76,8 @@ def mock_all_users_sacct() -> dict:
                 "state": {"current": ["RUNNING"]},
                 "time": {
                     "elapsed": 1800,  # 0.5h -> 4 GPU-hrs with 8 GPUs
-                    "start": int((now - timedelta(hours=1)).timestamp()),
-                    "submission": int((now - timedelta(hours=1)).timestamp()),
+                    "start": NOW_TS - HOUR,
+                    "submission": NOW_TS - HOUR,
                 },
                 "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 8}]},
             },
@@ -75,141 +85,145 @@ def mock_all_users_sacct() -> dict:
     }
 
 
-@pytest.fixture
-def config_file(tmp_path: Path) -> Path:
-    """Create a test config file."""
-    config = tmp_path / "config.toml"
-    config.write_text("""
-default_cluster = "test"
+@pytest.fixture(scope="module")
+def mock_all_users_sacct_json(mock_all_users_sacct: dict) -> str:
+    """The sample sacct output, serialized once per module."""
+    return json.dumps(mock_all_users_sacct)
+
 
-[clusters.test]
-name = "TestCluster"
-account = "research"
-qos = ["high-priority"]
-quota_limit = 500
-rolling_window_days = 30
+@pytest.fixture(scope="module")
+def config_file(cli_configs: dict[str, Path]) -> Path:
+    """The shared "research" test config."""
+    return cli_configs["research"]
 
-[display]
-output_format = "plain"
-""")
-    return config
+
+@pytest.fixture(scope="module")
+def report_json_data(config_file: Path, mock_all_users_sacct_json: str) -> dict:
+    """Parsed `report --format json` output for the sample data, invoked once per module."""
+    # Module setup runs before the per-test clean_env, so isolate the fetch cache here
+    clear_fetch_cache()
+    with pytest.MonkeyPatch.context() as mp, routed_commands({"sacct": sacct_handler(mock_all_users_sacct_json)}):
+        mp.setenv("SLURMQ_CONFIG", str(config_file))
+        result = runner.invoke(app, ["report", "--format", "json"])
+    clear_fetch_cache()
+    assert result.exit_code == 0, result.stdout
+    return json.loads(result.stdout_bytes)
 
 
 class TestReportCommand:
     """Tests for the report command."""
 
+    @pytest.mark.smoke
     def test_report_help(self) -> None:
         """Report command has help text."""
         result = runner.invoke(app, ["report", "--help"])
         assert result.exit_code == 0
-        assert "report" in result.stdout.lower()
+        assert "report" in result.stdout.casefold()
 
-    def test_report_json_output(
-        self, config_file: Path, mock_all_users_sacct: dict, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_report_json_output(self, report_json_data: dict) -> None:
         """Report command can output JSON."""
-        import subprocess
-
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_all_users_sacct), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
+        assert "users" in report_json_data
+        assert len(report_json_data["users"]) >= 2  # alice and bob
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+    def test_report_csv_output(
+        self,
+        config_file: Path,
+        mock_all_users_sacct_json: str,
+        sacct_mock: SacctMock,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Report command can output CSV."""
+        sacct_mock(mock_all_users_sacct_json)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
 
-        result = runner.invoke(app, ["report", "--format", "json"])
-        assert result.exit_code == 0
+        call_command(report, output_format="csv")
 
-        data = json.loads(result.stdout)
-        assert "users" in data
-        assert len(data["users"]) >= 2  # alice and bob
+        # The schema is fixed, so checking the header line and row count is enough
+        lines = capsys.readouterr().out.splitlines()
+        header = lines[0].split(",")
+        assert "user" in header
+        assert "used_gpu_hours" in header
+        assert len(lines) >= 3  # header plus alice and bob
 
-    def test_report_csv_output(
-        self, config_file: Path, mock_all_users_sacct: dict, monkeypatch: pytest.MonkeyPatch
+    def test_report_fetches_pipe_delimited_output(
+        self, config_file: Path, mock_all_users_sacct_json: str, slurm_cmds, monkeypatch: pytest.MonkeyPatch
     ) -> None:
-        """Report command can output CSV."""
-        import subprocess
+        """The all-users query asks sacct for -P output rather than --json."""
+        calls: list[list[str]] = []
+        answer = sacct_handler(mock_all_users_sacct_json)
 
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_all_users_sacct), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
+        def sacct(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+            calls.append(cmd)
+            return answer(cmd, **kwargs)
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        slurm_cmds["sacct"] = sacct
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
 
-        result = runner.invoke(app, ["report", "--format", "csv"])
+        result = runner.invoke(app, ["report", "--format", "json"])
         assert result.exit_code == 0
-
-        # Parse CSV
-        reader = csv.DictReader(io.StringIO(result.stdout))
-        rows = list(reader)
-        assert len(rows) >= 2
-        assert reader.fieldnames is not None
-        assert "user" in reader.fieldnames
-        assert "used_gpu_hours" in reader.fieldnames
+        assert {user["user"] for user in json.loads(result.stdout_bytes)["users"]} == {"alice", "bob"}
+        assert [("-P" in cmd, "--json" in cmd) for cmd in calls] == [(True, False)]
 
     def test_report_rich_output(
-        self, config_file: Path, mock_all_users_sacct: dict, monkeypatch: pytest.MonkeyPatch
+        self,
+        config_file: Path,
+        mock_all_users_sacct_json: str,
+        sacct_mock: SacctMock,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Report command shows rich table by default."""
-        import subprocess
-
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_all_users_sacct), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        sacct_mock(mock_all_users_sacct_json)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
 
-        result = runner.invoke(app, ["report"])
-        assert result.exit_code == 0
+        call_command(report)
         # Should contain user names
-        assert "alice" in result.stdout.lower() or "bob" in result.stdout.lower()
+        assert_contains_ci(capsys.readouterr().out, "alice", "bob")
 
     def test_report_to_file(
-        self, config_file: Path, mock_all_users_sacct: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        config_file: Path,
+        mock_all_users_sacct_json: str,
+        sacct_mock: SacctMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Report command can write to file."""
-        import subprocess
-
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_all_users_sacct), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        """Report command can write to file (-f/-o short options)."""
+        sacct_mock(mock_all_users_sacct_json)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
 
         output_file = tmp_path / "report.csv"
-        result = runner.invoke(app, ["report", "--format", "csv", "--output", str(output_file)])
+        result = runner.invoke(app, ["report", "-f", "csv", "-o", str(output_file)])
         assert result.exit_code == 0
         assert output_file.exists()
 
         content = output_file.read_text()
-        assert "alice" in content.lower() or "bob" in content.lower()
-
-    def test_report_aggregates_by_user(
-        self, config_file: Path, mock_all_users_sacct: dict, monkeypatch: pytest.MonkeyPatch
+        assert_contains_ci(content, "alice", "bob")
+
+    def test_report_json_to_file(
+        self,
+        config_file: Path,
+        mock_all_users_sacct_json: str,
+        sacct_mock: SacctMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
-        """Report aggregates GPU-hours by user."""
-        import subprocess
-
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_all_users_sacct), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
-
-        monkeypatch.setattr(subprocess, "run", mock_run)
+        """Report command can write JSON to file."""
+        sacct_mock(mock_all_users_sacct_json)
         monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
 
-        result = runner.invoke(app, ["report", "--format", "json"])
+        output_file = tmp_path / "report.json"
+        result = runner.invoke(app, ["report", "--format", "json", "--output", str(output_file)])
         assert result.exit_code == 0
 
-        data = json.loads(result.stdout)
-        users = {u["user"]: u for u in data["users"]}
+        data = json.loads(output_file.read_text())
+        assert data["cluster"] == "TestCluster"
+        assert {u["user"] for u in data["users"]} == {"alice", "bob"}
+
+    def test_report_aggregates_by_user(self, report_json_data: dict) -> None:
+        """Report aggregates GPU-hours by user."""
+        users = {u["user"]: u for u in report_json_data["users"]}
 
         # alice: 8 (job1) + 4 (job3) = 12 GPU-hours
         assert users["alice"]["used_gpu_hours"] == pytest.approx(12.0, rel=0.1)
@@ -220,23 +234,36 @@ class TestReportCommand:
 class TestReportSorting:
     """Tests for report sorting options."""
 
-    def test_report_sorted_by_usage(
-        self, config_file: Path, mock_all_users_sacct: dict, monkeypatch: pytest.MonkeyPatch
-    ) -> None:
+    def test_report_sorted_by_usage(self, report_json_data: dict) -> None:
         """Report is sorted by usage descending by default."""
-        import subprocess
+        # Should be sorted by usage descending
+        usages = [u["used_gpu_hours"] for u in report_json_data["users"]]
+        assert usages == sorted(usages, reverse=True)
 
-        def mock_run(cmd, **kwargs):
-            if cmd[0] == "sacct":
-                return subprocess.CompletedProcess(cmd, 0, stdout=json.dumps(mock_all_users_sacct), stderr="")
-            raise ValueError(f"Unexpected command: {cmd}")
 
-        monkeypatch.setattr(subprocess, "run", mock_run)
-        monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
+class TestAggregateByUser:
+    """Tests for the single-pass user aggregation."""
 
-        result = runner.invoke(app, ["report", "--format", "json"])
-        data = json.loads(result.stdout)
+    def test_matches_per_user_reports(self, mock_all_users_sacct: dict) -> None:
+        """Aggregation agrees with QuotaChecker.generate_report for every user."""
+        records = parse_sacct_json(mock_all_users_sacct)
+        checker = QuotaChecker(ClusterConfig(name="Test", qos=["high-priority"], quota_limit=10))
 
-        # Should be sorted by usage descending
-        usages = [u["used_gpu_hours"] for u in data["users"]]
-        assert usages == sorted(usages, reverse=True)
+        for usage in aggregate_by_user(records, checker):
+            report = checker.generate_report(usage.user, records)
+            assert usage.used_gpu_hours == pytest.approx(report.used_gpu_hours)
+            assert usage.status == report.status
+            assert usage.active_jobs == len(report.active_jobs)
+
+    def test_uses_given_qos(self, mock_all_users_sacct: dict) -> None:
+        """A --qos override is what the reports are built for, not the cluster's first QoS."""
+        records = parse_sacct_json(mock_all_users_sacct)
+        checker = QuotaChecker(ClusterConfig(name="Test", qos=["other"], quota_limit=10))
+
+        usages = aggregate_by_user(records, checker, "high-priority")
+        assert sum(usage.used_gpu_hours for usage in usages) > 0
+
+    def test_no_records_needs_no_qos(self) -> None:
+        """A cluster without a configured QoS still reports no users when there are no jobs."""
+        checker = QuotaChecker(ClusterConfig(name="Test", qos=[], quota_limit=10))
+        assert aggregate_by_user([], checker) == []
@@ -6,114 +6,78 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import patch
+import os
+from statistics import median
+import subprocess
+from typing import TYPE_CHECKING
 
 import pytest
 from typer.testing import CliRunner
 
+from slurmq.cli.commands.stats import (
+    JobStats,
+    _median,
+    _sacct_env,
+    calculate_partition_stats,
+    format_pct_change,
+    format_time_human,
+    parse_jobs,
+    stats,
+)
 from slurmq.cli.main import app
+from tests.cli.conftest import call_command
 
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 runner = CliRunner()
 
 
-# Sample sacct output for testing
-SAMPLE_SACCT_OUTPUT = {
-    "jobs": [
-        {
-            "job_id": 1001,
-            "name": "small_job",
-            "user": "alice",
-            "account": "research",
-            "qos": "normal",
-            "partition": "gpu",
-            "state": {"current": ["COMPLETED"]},
-            "time": {
-                "elapsed": 7200,  # 2 hours
-                "start": 1700000000,
-                "end": 1700007200,
-                "submission": 1699996400,  # 1 hour wait
-            },
-            "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 2}]},
-        },
-        {
-            "job_id": 1002,
-            "name": "large_job",
-            "user": "bob",
-            "account": "research",
-            "qos": "normal",
-            "partition": "gpu",
-            "state": {"current": ["COMPLETED"]},
-            "time": {
-                "elapsed": 36000,  # 10 hours
-                "start": 1700100000,
-                "end": 1700136000,
-                "submission": 1700071600,  # ~8 hour wait
-            },
-            "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 8}]},
-        },
-        {
-            "job_id": 1003,
-            "name": "medium_job",
-            "user": "alice",
-            "account": "research",
-            "qos": "normal",
-            "partition": "gpu",
-            "state": {"current": ["COMPLETED"]},
-            "time": {
-                "elapsed": 3600,  # 1 hour
-                "start": 1700200000,
-                "end": 1700203600,
-                "submission": 1700199000,  # ~17 min wait
-            },
-            "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 4}]},
-        },
-    ]
-}
+# Sample sacct output for testing (JobID,Partition,QoS,AllocTRES,Submit,Start,ElapsedRaw)
+SAMPLE_SACCT_OUTPUT = (
+    "1001|gpu|normal|cpu=8,gres/gpu=2,mem=64G,node=1|1699996400|1700000000|7200\n"  # 2h, 1h wait
+    "1002|gpu|normal|cpu=32,gres/gpu=8,mem=256G,node=1|1700071600|1700100000|36000\n"  # 10h, ~8h wait
+    "1003|gpu|normal|cpu=16,gres/gpu=4,mem=128G,node=1|1700199000|1700200000|3600\n"  # 1h, ~17min wait
+)
 
 
 @pytest.fixture
-def mock_sacct():
-    """Mock sacct subprocess calls."""
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = json.dumps(SAMPLE_SACCT_OUTPUT)
-        yield mock_run
+def mock_sacct(slurm_cmds):
+    """Answer sacct with SAMPLE_SACCT_OUTPUT; returns the list of sacct commands run."""
+    calls: list[list[str]] = []
+    sacct_done = subprocess.CompletedProcess(["sacct"], 0, stdout=SAMPLE_SACCT_OUTPUT, stderr="")
 
+    def sacct(cmd, **_):
+        calls.append(cmd)
+        return sacct_done
 
-@pytest.fixture
-def mock_config(tmp_path, monkeypatch):
-    """Create a test config file."""
-    config_file = tmp_path / "config.toml"
-    config_file.write_text("""
-default_cluster = "test"
-
-[clusters.test]
-name = "Test Cluster"
-account = "research"
-qos = ["normal"]
-partitions = ["gpu"]
-quota_limit = 500
-rolling_window_days = 30
-""")
-    monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
+    slurm_cmds["sacct"] = sacct
+    return calls
 
-    # Reset config module state
-    import slurmq.core.config as config_module
 
-    config_module._config_file_path = None
+@pytest.fixture(scope="module")
+def config_file(cli_configs: dict[str, Path]) -> Path:
+    """The shared "gpu_partition" test config."""
+    return cli_configs["gpu_partition"]
 
+
+@pytest.fixture
+def mock_config(config_file, monkeypatch):
+    """Point SLURMQ_CONFIG at the test config file."""
+    monkeypatch.setenv("SLURMQ_CONFIG", str(config_file))
     return config_file
 
 
 class TestStatsCommand:
     """Tests for slurmq stats command."""
 
+    @pytest.mark.smoke
     def test_stats_help(self):
         """Test stats help message."""
         result = runner.invoke(app, ["stats", "--help"])
         assert result.exit_code == 0
-        assert "cluster statistics" in result.stdout.lower()
+        assert "cluster statistics" in result.stdout.casefold()
 
     def test_stats_json_output(self, mock_sacct, mock_config):
         """Test stats with JSON output."""
@@ -123,51 +87,89 @@ class TestStatsCommand:
         assert result.exit_code == 0, f"Exit code: {result.exit_code}, Output: {result.stdout}"
 
         # Should be valid JSON
-        output = json.loads(result.stdout)
+        output = json.loads(result.stdout_bytes)
         assert "period_days" in output
         assert "current" in output
 
     def test_stats_with_partition_flag(self, mock_sacct, mock_config):
         """Test stats with explicit partition flag."""
-        result = runner.invoke(app, ["stats", "-p", "gpu", "--no-compare"])
+        call_command(stats, partition=["gpu"], compare=False)
 
-        assert result.exit_code == 0
         # Check that sacct was called with the partition
-        call_args = mock_sacct.call_args
-        assert "--partition=gpu" in call_args[0][0]
+        assert "--partition=gpu" in mock_sacct[-1]
+
+    def test_stats_batches_partitions_into_one_call(self, mock_sacct, mock_config, capsys):
+        """Multiple partitions are fetched with one sacct call and grouped by job partition."""
+        call_command(stats, json_output=True, partition=["gpu", "gpu-large"], compare=False)
+
+        assert len(mock_sacct) == 1
+        assert "--partition=gpu,gpu-large" in mock_sacct[-1]
+        output = json.loads(capsys.readouterr().out)
+        assert output["current"]["gpu"]["all"]["job_count"] == 3
+
+    def test_stats_reuses_cached_sacct_output(self, mock_sacct, mock_config):
+        """A repeated run is served from the sacct cache unless --no-cache is given."""
+        call_command(stats, compare=False)
+        call_command(stats, compare=False)
+        assert len(mock_sacct) == 1
+
+        call_command(stats, compare=False, no_cache=True)
+        assert len(mock_sacct) == 2
+
+    def test_stats_sacct_cache_keyed_on_cluster_and_pruned(self, mock_sacct, mock_config, monkeypatch, tmp_path):
+        """Another SLURM_CLUSTERS misses the cache, and expired entries are deleted on write."""
+        stale = tmp_path / "cache" / "slurmq" / "sacct" / "stale.txt"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("old dump")
+        os.utime(stale, (0, 0))
+
+        call_command(stats, compare=False)
+        assert not stale.exists()
+
+        monkeypatch.setenv("SLURM_CLUSTERS", "other")
+        _sacct_env.cache_clear()
+        call_command(stats, compare=False)
+        assert len(mock_sacct) == 2
+        _sacct_env.cache_clear()
+
+    def test_stats_quiet_outputs_tsv(self, mock_sacct, mock_config, capsys):
+        """--quiet skips the progress message and tables, writing plain tab-separated rows."""
+        call_command(stats, quiet=True, partition=["gpu"], compare=False)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0].split("\t")[:3] == ["partition_qos", "size", "job_count"]
+        assert [line.split("\t")[:3] for line in lines[1:]] == [
+            ["gpu", "all", "3"],
+            ["gpu", "small", "2"],
+            ["gpu", "large", "1"],
+        ]
 
     def test_stats_with_qos_flag(self, mock_sacct, mock_config):
         """Test stats with explicit QoS flag."""
-        result = runner.invoke(app, ["stats", "-q", "normal", "--no-compare"])
+        call_command(stats, qos=["normal"], compare=False)
 
-        assert result.exit_code == 0
-        call_args = mock_sacct.call_args
-        assert "--qos=normal" in call_args[0][0]
+        assert "--qos=normal" in mock_sacct[-1]
 
-    def test_stats_custom_days(self, mock_sacct, mock_config):
+    def test_stats_custom_days(self, mock_sacct, mock_config, capsys):
         """Test stats with custom day range."""
-        result = runner.invoke(app, ["stats", "--days", "14", "--no-compare"])
+        call_command(stats, days=14, compare=False)
 
-        assert result.exit_code == 0
         # Verify the output mentions the period
-        assert "14" in result.stdout or result.exit_code == 0
+        assert "14" in capsys.readouterr().out
 
     def test_stats_with_comparison(self, mock_sacct, mock_config):
         """Test stats with month-over-month comparison."""
-        result = runner.invoke(app, ["stats", "--compare"])
+        call_command(stats, compare=True)
 
-        # Should make two sets of calls (current + previous period)
-        assert result.exit_code == 0
-        # With comparison enabled, should call sacct twice per partition
-        assert mock_sacct.call_count >= 2
+        # With comparison enabled, should call sacct twice per partition (current + previous period)
+        assert len(mock_sacct) >= 2
 
-    def test_stats_custom_threshold(self, mock_sacct, mock_config):
+    def test_stats_custom_threshold(self, mock_sacct, mock_config, capsys):
         """Test stats with custom small/large job threshold."""
-        result = runner.invoke(app, ["stats", "--small-threshold", "25", "--no-compare"])
+        call_command(stats, small_threshold=25, compare=False)
 
-        assert result.exit_code == 0
         # Should show tables with the custom threshold
-        assert "25" in result.stdout
+        assert "25" in capsys.readouterr().out
 
 
 class TestStatsCalculations:
@@ -175,45 +177,65 @@ class TestStatsCalculations:
 
     def test_calculate_partition_stats_empty(self):
         """Test stats calculation with empty job list."""
-        from slurmq.cli.commands.stats import calculate_partition_stats
-
-        stats = calculate_partition_stats([], "test")
-        assert stats.job_count == 0
-        assert stats.gpu_hours == 0
-        assert stats.median_wait_hours == 0
+        partition_stats = calculate_partition_stats([], "test")
+        assert partition_stats.job_count == 0
+        assert partition_stats.gpu_hours == 0
+        assert partition_stats.median_wait_hours == 0
 
     def test_calculate_partition_stats_single_job(self):
         """Test stats calculation with single job."""
-        from slurmq.cli.commands.stats import JobStats, calculate_partition_stats
-
         jobs = [
             JobStats(n_gpus=2, elapsed_h=5, gpu_hours=10, wait_hours=2, start_time=0, partition="gpu", qos="normal")
         ]
-        stats = calculate_partition_stats(jobs, "test")
+        partition_stats = calculate_partition_stats(jobs, "test")
 
-        assert stats.job_count == 1
-        assert stats.gpu_hours == 10
-        assert stats.median_wait_hours == 2
-        assert stats.long_wait_count == 0
+        assert partition_stats.job_count == 1
+        assert partition_stats.gpu_hours == 10
+        assert partition_stats.median_wait_hours == 2
+        assert partition_stats.long_wait_count == 0
 
     def test_calculate_partition_stats_long_wait(self):
         """Test long wait detection (> 6 hours)."""
-        from slurmq.cli.commands.stats import JobStats, calculate_partition_stats
-
         jobs = [
             JobStats(n_gpus=2, elapsed_h=5, gpu_hours=10, wait_hours=2, start_time=0, partition="gpu", qos="normal"),
             JobStats(n_gpus=4, elapsed_h=5, gpu_hours=20, wait_hours=8, start_time=0, partition="gpu", qos="normal"),
             JobStats(n_gpus=3, elapsed_h=5, gpu_hours=15, wait_hours=10, start_time=0, partition="gpu", qos="normal"),
         ]
-        stats = calculate_partition_stats(jobs, "test")
+        partition_stats = calculate_partition_stats(jobs, "test")
 
-        assert stats.long_wait_count == 2
-        assert abs(stats.long_wait_pct - 66.67) < 1  # ~66.67%
+        assert partition_stats.long_wait_count == 2
+        assert abs(partition_stats.long_wait_pct - 66.67) < 1  # ~66.67%
+
+    def test_calculate_partition_stats_even_count_median(self):
+        """Median of an even number of jobs averages the two middle waits."""
+        jobs = [
+            JobStats(n_gpus=1, elapsed_h=1, gpu_hours=1, wait_hours=wait, start_time=0, partition="gpu", qos="normal")
+            for wait in (9, 1, 3, 7)
+        ]
+        partition_stats = calculate_partition_stats(jobs, "gpu")
+        assert partition_stats.median_wait_hours == 5
+        assert partition_stats.long_wait_count == 2
+
+    def test_median_matches_statistics_median(self):
+        """Quickselect median agrees with statistics.median, including repeated values."""
+        for values in (
+            [3.0],
+            [2.0, 2.0],
+            [5.0, 1.0, 5.0, 1.0],
+            [0.0, 0.0, 0.0, 4.0, 4.0],
+            [7.0, 3.0, 3.0, 9.0, 1.0, 3.0],
+        ):
+            assert _median(values) == median(values)
+
+    def test_median_matches_statistics_median_on_wait_hours(self):
+        """Quickselect median agrees with statistics.median on wait-hour-like values."""
+        for n in (1, 2, 5, 6, 101, 200):
+            values = [i * 7919 % 50_000 / 3600 for i in range(n)]
+            values += values[: n // 3]  # repeated waits
+            assert _median(values) == median(values)
 
     def test_format_time_human(self):
         """Test human-readable time formatting."""
-        from slurmq.cli.commands.stats import format_time_human
-
         assert format_time_human(0) == "< 1min"
         assert format_time_human(0.25) == "15min"
         assert format_time_human(1) == "1h"
@@ -222,8 +244,6 @@ class TestStatsCalculations:
 
     def test_format_pct_change(self):
         """Test percentage change formatting."""
-        from slurmq.cli.commands.stats import format_pct_change
-
         # Positive change
         result = format_pct_change(120, 100)
         assert "+20%" in result
@@ -244,57 +264,25 @@ class TestParseJobs:
 
     def test_parse_jobs_filters_no_gpu(self):
         """Test that jobs with no GPUs are filtered out."""
-        from slurmq.cli.commands.stats import parse_jobs
-
-        data = {
-            "jobs": [
-                {
-                    "job_id": 1,
-                    "time": {"elapsed": 3600, "start": 1000, "submission": 900},
-                    "tres": {"allocated": []},  # No GPUs
-                    "partition": "cpu",
-                    "qos": "normal",
-                }
-            ]
-        }
-        jobs = parse_jobs(data)
+        jobs = parse_jobs("1|cpu|normal|cpu=8,mem=32G,node=1|900|1000|3600\n")
         assert len(jobs) == 0
 
     def test_parse_jobs_filters_short_runtime(self):
         """Test that jobs < 10 min are filtered out."""
-        from slurmq.cli.commands.stats import parse_jobs
-
-        data = {
-            "jobs": [
-                {
-                    "job_id": 1,
-                    "time": {"elapsed": 300, "start": 1000, "submission": 900},  # 5 min
-                    "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 1}]},
-                    "partition": "gpu",
-                    "qos": "normal",
-                }
-            ]
-        }
-        jobs = parse_jobs(data)
+        jobs = parse_jobs("1|gpu|normal|cpu=8,gres/gpu=1|900|1000|300\n")  # 5 min
         assert len(jobs) == 0
 
     def test_parse_jobs_valid(self):
         """Test parsing valid job data."""
-        from slurmq.cli.commands.stats import parse_jobs
-
-        data = {
-            "jobs": [
-                {
-                    "job_id": 1,
-                    "time": {"elapsed": 3600, "start": 1000, "submission": 900},
-                    "tres": {"allocated": [{"type": "gres", "name": "gpu", "count": 4}]},
-                    "partition": "gpu",
-                    "qos": "normal",
-                }
-            ]
-        }
-        jobs = parse_jobs(data)
+        jobs = parse_jobs("1|gpu|normal|cpu=8,gres/gpu=4,gres/gpu:a100=4|900|1000|3600\n")
         assert len(jobs) == 1
         assert jobs[0].n_gpus == 4
         assert jobs[0].gpu_hours == 4.0  # 4 GPUs * 1 hour
         assert jobs[0].wait_hours == 100 / 3600  # 100 seconds
+
+    def test_parse_jobs_unknown_start(self):
+        """Jobs without a start time get no wait time."""
+        jobs = parse_jobs("1|gpu|normal|gres/gpu=2|900|Unknown|3600\n")
+        assert len(jobs) == 1
+        assert jobs[0].start_time == 0
+        assert jobs[0].wait_hours == 0
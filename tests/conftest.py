@@ -5,30 +5,69 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import pytest
 
+import slurmq.core.config as config_module
+from slurmq.core.quota import clear_fetch_cache
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture(scope="session")
+def slurmq_env_keys() -> tuple[str, ...]:
+    """SLURMQ_* variables inherited from the outer environment, collected once per session.
+
+    Tests only set SLURMQ_* variables through monkeypatch, which undoes them, so the set never grows.
+    """
+    return tuple(key for key in os.environ if key.startswith("SLURMQ_"))
+
 
 @pytest.fixture(autouse=True)
-def clean_env(monkeypatch: pytest.MonkeyPatch) -> None:
+def clean_env(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, slurmq_env_keys: tuple[str, ...]) -> None:
     """Clear SLURMQ_* env vars and reset config module state before each test."""
     # Clear env vars
-    for key in list(os.environ.keys()):
-        if key.startswith("SLURMQ_"):
-            monkeypatch.delenv(key, raising=False)
+    for key in slurmq_env_keys:
+        monkeypatch.delenv(key, raising=False)
 
-    # Reset config module state
-    import slurmq.core.config as config_module
+    # Keep cached sacct output out of the real cache dir and isolated per test
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
 
+    # Reset config module state
     monkeypatch.setattr(config_module, "_config_file_path", None)
 
+    # Don't let one test's mocked sacct results answer another's query
+    clear_fetch_cache()
+
+
+# set_env(**variables): set several environment variables for the rest of the test
+SetEnv = Callable[..., None]
+
 
 @pytest.fixture
-def sample_config_toml() -> str:
-    """Sample TOML config content."""
-    return """
+def set_env() -> Generator[SetEnv, None, None]:
+    """Set environment variables in one os.environ update, undone after the test."""
+    env_patches = []
+
+    def set_vars(**variables: str) -> None:
+        env_patch = patch.dict(os.environ, variables)
+        env_patch.start()
+        env_patches.append(env_patch)
+
+    yield set_vars
+    for env_patch in reversed(env_patches):
+        env_patch.stop()
+
+
+# Sample TOML config content, encoded once for the config_file fixture
+SAMPLE_CONFIG_TOML = """
 default_cluster = "stella"
 
 [clusters.stella]
@@ -74,12 +113,20 @@ enabled = true
 ttl_minutes = 60
 """
 
+_SAMPLE_CONFIG_BYTES = SAMPLE_CONFIG_TOML.encode()
+
+
+@pytest.fixture
+def sample_config_toml() -> str:
+    """Sample TOML config content."""
+    return SAMPLE_CONFIG_TOML
+
 
 @pytest.fixture
-def config_file(tmp_path: Path, sample_config_toml: str) -> Path:
+def config_file(tmp_path: Path) -> Path:
     """Create a temporary config file with sample content."""
     config_path = tmp_path / "config.toml"
-    config_path.write_text(sample_config_toml)
+    config_path.write_bytes(_SAMPLE_CONFIG_BYTES)
     return config_path
 
 
@@ -0,0 +1,38 @@
+# Copyright (c) 2025 Dedalus Labs, Inc. and its contributors
+# SPDX-License-Identifier: MIT
+
+"""Pytest fixtures for core tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import NamedTuple
+
+import pytest
+
+import slurmq.core.config as config_module
+
+
+class ConfigLocations(NamedTuple):
+    """Where get_config_path looks for user and system configs during a test."""
+
+    user_home: Path
+    user_config: Path
+    system_config: Path
+
+
+@pytest.fixture
+def config_locations(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ConfigLocations:
+    """Point config path resolution at an empty home and system dir under tmp_path.
+
+    Neither config file exists yet; tests create the ones they need (parents included).
+    """
+    user_home = tmp_path / "user"
+    user_home.mkdir()
+    system_config = tmp_path / "etc" / "slurmq" / "config.toml"
+
+    monkeypatch.delenv("SLURMQ_CONFIG", raising=False)
+    monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", lambda: user_home)
+    monkeypatch.setattr(config_module, "SYSTEM_CONFIG_PATH", system_config)
+    return ConfigLocations(user_home, user_home / ".config" / "slurmq" / "config.toml", system_config)
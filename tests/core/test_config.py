@@ -236,3 +236,54 @@ class TestConfigPaths:
         monkeypatch.setenv("SLURMQ_CONFIG", str(custom_path))
         path = get_config_path()
         assert path == custom_path
+
+
+class TestTomlCache:
+    """Tests for the mtime-keyed TOML parse cache."""
+
+    def test_cached_load_returns_independent_copies(self, tmp_path: Path) -> None:
+        """Mutating a cached result does not leak into later loads."""
+        from slurmq.core.config import load_toml
+
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('default_cluster = "stella"\n')
+
+        first = load_toml(config_file)
+        first["default_cluster"] = "mutated"
+        assert load_toml(config_file)["default_cluster"] == "stella"
+
+    def test_cached_load_sees_rewritten_file(self, tmp_path: Path) -> None:
+        """Saving the file invalidates the cached parse."""
+        from slurmq.core.config import load_toml, save_toml
+
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('default_cluster = "stella"\n')
+        assert load_toml(config_file)["default_cluster"] == "stella"
+
+        save_toml(config_file, {"default_cluster": "other"})
+        assert load_toml(config_file)["default_cluster"] == "other"
+
+    def test_cached_config_respects_env_and_copies(self, config_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Reloading an unchanged file reuses the config, but env changes and caller mutations don't leak."""
+        first = load_config(config_file)
+        first.clusters["stella"].quota_limit = 1
+        assert load_config(config_file).clusters["stella"].quota_limit == 500
+
+        monkeypatch.setenv("SLURMQ_DEFAULT_CLUSTER", "other")
+        assert load_config(config_file).default_cluster == "other"
+        monkeypatch.delenv("SLURMQ_DEFAULT_CLUSTER")
+        assert load_config(config_file).default_cluster == "stella"
+
+    def test_caches_keep_one_entry_per_file(self, config_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Edits and env changes replace a file's cached entries rather than adding more."""
+        from slurmq.core import config as config_module
+
+        monkeypatch.setattr(config_module, "_config_cache", {})
+        monkeypatch.setattr(config_module, "_toml_cache", {})
+        for cluster in ("a", "bb", "ccc"):
+            monkeypatch.setenv("SLURMQ_DEFAULT_CLUSTER", cluster)
+            config_file.write_text(f'default_cluster = "{cluster}"\n')
+            assert load_config(config_file).default_cluster == cluster
+
+        assert list(config_module._config_cache) == [config_file]
+        assert list(config_module._toml_cache) == [config_file]
@@ -5,13 +5,19 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
 from slurmq.core.config import get_config_path, validate_config
 
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from tests.core.conftest import ConfigLocations
+
+
 class TestSystemWideConfig:
     """Tests for system-wide config fallback."""
 
@@ -24,62 +30,38 @@ class TestSystemWideConfig:
         path = get_config_path()
         assert path == env_config
 
-    def test_user_config_before_system(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_user_config_before_system(self, config_locations: ConfigLocations) -> None:
         """User config (~/.config/slurmq) takes priority over system config."""
-        # Create user config
-        user_config_dir = tmp_path / "user" / ".config" / "slurmq"
-        user_config_dir.mkdir(parents=True)
-        user_config = user_config_dir / "config.toml"
-        user_config.write_text('default_cluster = "from_user"')
-
-        # Create system config
-        system_config_dir = tmp_path / "etc" / "slurmq"
-        system_config_dir.mkdir(parents=True)
-        system_config = system_config_dir / "config.toml"
-        system_config.write_text('default_cluster = "from_system"')
+        for config, source in ((config_locations.user_config, "user"), (config_locations.system_config, "system")):
+            config.parent.mkdir(parents=True)
+            config.write_text(f'default_cluster = "from_{source}"')
 
-        # Mock paths
-        monkeypatch.delenv("SLURMQ_CONFIG", raising=False)
-        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
-        monkeypatch.setattr(Path, "home", lambda: tmp_path / "user")
-        monkeypatch.setattr("slurmq.core.config.SYSTEM_CONFIG_PATH", system_config)
+        assert get_config_path() == config_locations.user_config
 
-        path = get_config_path()
-        assert path == user_config
-
-    def test_system_config_fallback(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_system_config_fallback(self, config_locations: ConfigLocations) -> None:
         """Falls back to system config when user config doesn't exist."""
-        # No user config
-        user_home = tmp_path / "user"
-        user_home.mkdir()
-
-        # Create system config
-        system_config_dir = tmp_path / "etc" / "slurmq"
-        system_config_dir.mkdir(parents=True)
-        system_config = system_config_dir / "config.toml"
+        system_config = config_locations.system_config
+        system_config.parent.mkdir(parents=True)
         system_config.write_text('default_cluster = "from_system"')
 
-        monkeypatch.delenv("SLURMQ_CONFIG", raising=False)
-        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
-        monkeypatch.setattr(Path, "home", lambda: user_home)
-        monkeypatch.setattr("slurmq.core.config.SYSTEM_CONFIG_PATH", system_config)
+        assert get_config_path() == system_config
 
-        path = get_config_path()
-        assert path == system_config
-
-    def test_returns_user_path_when_neither_exists(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def test_returns_user_path_when_neither_exists(self, config_locations: ConfigLocations) -> None:
         """Returns user config path (for creation) when no config exists."""
-        user_home = tmp_path / "user"
-        user_home.mkdir()
+        # Should return user path even though it doesn't exist
+        assert get_config_path() == config_locations.user_home / ".config" / "slurmq" / "config.toml"
 
-        monkeypatch.delenv("SLURMQ_CONFIG", raising=False)
-        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
-        monkeypatch.setattr(Path, "home", lambda: user_home)
-        monkeypatch.setattr("slurmq.core.config.SYSTEM_CONFIG_PATH", tmp_path / "nonexistent" / "config.toml")
+    def test_resolution_follows_files_created_and_removed(self, config_locations: ConfigLocations) -> None:
+        """Configs created or removed by another process are picked up on the next lookup."""
+        user_config, system_config = config_locations.user_config, config_locations.system_config
 
-        path = get_config_path()
-        # Should return user path even though it doesn't exist
-        assert path == user_home / ".config" / "slurmq" / "config.toml"
+        assert get_config_path() == user_config
+        system_config.parent.mkdir(parents=True)
+        system_config.write_text('default_cluster = "from_system"')
+        assert get_config_path() == system_config
+
+        system_config.unlink()
+        assert get_config_path() == user_config
 
 
 class TestConfigValidate:
@@ -106,7 +88,7 @@ quota_limit = 500
 
         errors = validate_config(config)
         assert len(errors) == 1
-        assert "TOML" in errors[0] or "parse" in errors[0].lower()
+        assert "TOML" in errors[0] or "parse" in errors[0].casefold()
 
     def test_missing_cluster_definition(self, tmp_path: Path) -> None:
         """Referencing non-existent cluster returns error."""
@@ -115,7 +97,7 @@ quota_limit = 500
 
         errors = validate_config(config)
         assert len(errors) >= 1
-        assert any("nonexistent" in e or "cluster" in e.lower() for e in errors)
+        assert any("nonexistent" in e or "cluster" in e.casefold() for e in errors)
 
     def test_invalid_threshold_values(self, tmp_path: Path) -> None:
         """Invalid threshold values return errors."""
@@ -136,7 +118,8 @@ critical_threshold = -0.1
         config = tmp_path / "nonexistent.toml"
         errors = validate_config(config)
         assert len(errors) == 1
-        assert "not found" in errors[0].lower() or "exist" in errors[0].lower()
+        error = errors[0].casefold()
+        assert "not found" in error or "exist" in error
 
     def test_empty_config_is_valid(self, tmp_path: Path) -> None:
         """Empty config (uses defaults) is valid."""
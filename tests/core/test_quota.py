@@ -5,7 +5,10 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime, timedelta
+import json
+import subprocess
 
 import pytest
 
@@ -23,6 +26,8 @@ from slurmq.core.models import (
     SacctTresEntry,
     UsageReport,
     parse_sacct_json,
+    parse_sacct_json_text,
+    parse_sacct_parsable,
 )
 from slurmq.core.quota import QuotaChecker
 
@@ -71,12 +76,18 @@ SAMPLE_SACCT_OUTPUT = SacctOutput(
 )
 
 
+@pytest.fixture(scope="module")
+def sample_records() -> tuple[JobRecord, ...]:
+    """SAMPLE_SACCT_OUTPUT parsed once per module (read-only: tests must not modify the records)."""
+    return tuple(parse_sacct_json(SAMPLE_SACCT_OUTPUT.model_dump()))
+
+
 class TestJobRecord:
     """Tests for JobRecord parsing."""
 
-    def test_parse_job_with_gpus(self) -> None:
+    def test_parse_job_with_gpus(self, sample_records: tuple[JobRecord, ...]) -> None:
         """Can parse a job with GPU allocation."""
-        record = JobRecord.from_sacct(SAMPLE_SACCT_OUTPUT.jobs[0])
+        record = sample_records[0]
 
         assert record.job_id == 12345
         assert record.name == "train_model"
@@ -86,16 +97,16 @@ class TestJobRecord:
         assert record.elapsed_seconds == 7200
         assert record.is_running is False
 
-    def test_parse_running_job(self) -> None:
+    def test_parse_running_job(self, sample_records: tuple[JobRecord, ...]) -> None:
         """Can identify a running job."""
-        record = JobRecord.from_sacct(SAMPLE_SACCT_OUTPUT.jobs[1])
+        record = sample_records[1]
 
         assert record.job_id == 12346
         assert record.is_running is True
 
-    def test_gpu_hours_calculation(self) -> None:
+    def test_gpu_hours_calculation(self, sample_records: tuple[JobRecord, ...]) -> None:
         """GPU-hours calculated correctly."""
-        record = JobRecord.from_sacct(SAMPLE_SACCT_OUTPUT.jobs[0])
+        record = sample_records[0]
 
         # 4 GPUs * 2 hours = 8 GPU-hours
         assert record.gpu_hours == 8.0
@@ -116,6 +127,21 @@ class TestJobRecord:
         assert record.n_gpus == 0
         assert record.gpu_hours == 0.0
 
+    def test_timestamps(self) -> None:
+        """Epoch timestamps become UTC datetimes; unset ones fall back to datetime.min."""
+        record = JobRecord.from_sacct(SAMPLE_SACCT_OUTPUT.jobs[0])
+        assert record.start_time == datetime.fromtimestamp(1700000000, tz=UTC)
+        assert record.submission_time == datetime.fromtimestamp(1699999000, tz=UTC)
+
+        pending = SAMPLE_SACCT_OUTPUT.jobs[1].model_copy(update={"time": SacctTime(start=0, submission=1700003500)})
+        record = JobRecord.from_sacct(pending)
+        assert record.start_time == datetime.min.replace(tzinfo=UTC)
+        assert record.submission_time == datetime.fromtimestamp(1700003500, tz=UTC)
+
+        # Unset times share one constant rather than allocating a datetime per job
+        other = JobRecord.from_sacct(pending.model_copy(update={"job_id": 99}))
+        assert other.start_time is record.start_time
+
 
 class TestParseSacctJson:
     """Tests for parsing sacct JSON output."""
@@ -134,6 +160,56 @@ class TestParseSacctJson:
         records = parse_sacct_json({"jobs": []})
         assert records == []
 
+    def test_parse_json_text(self) -> None:
+        """Raw JSON text parses to the same records as the decoded dict."""
+        text = SAMPLE_SACCT_OUTPUT.model_dump_json()
+        assert parse_sacct_json_text(text) == parse_sacct_json(SAMPLE_SACCT_OUTPUT.model_dump())
+
+    def test_bulk_parse_matches_from_sacct(self) -> None:
+        """Bulk parsing fills in the same defaults as the per-job Sacct models."""
+        raw = {
+            "jobs": [
+                *SAMPLE_SACCT_OUTPUT.model_dump()["jobs"],
+                {"job_id": 1, "tres": {"allocated": [{"type": "cpu"}]}},
+            ]
+        }
+        expected = [JobRecord.from_sacct(job) for job in SacctOutput.model_validate(raw).jobs]
+        assert parse_sacct_json(raw) == expected
+
+    def test_parse_invalid_json_text(self) -> None:
+        """Malformed text raises JSONDecodeError like json.loads."""
+        with pytest.raises(json.JSONDecodeError):
+            parse_sacct_json_text("sacct: error: not json")
+        with pytest.raises(json.JSONDecodeError):
+            parse_sacct_json_text(b"sacct: error: not json")
+
+    def test_parse_json_bytes(self) -> None:
+        """Raw stdout bytes parse the same as decoded text."""
+        text = SAMPLE_SACCT_OUTPUT.model_dump_json()
+        assert parse_sacct_json_text(text.encode()) == parse_sacct_json_text(text)
+
+    def test_parse_parsable(self) -> None:
+        """Pipe-delimited sacct output parses GPUs, epoch times and names containing the delimiter."""
+        text = (
+            "12345|alice|high-priority|research|COMPLETED|3600|1705312800|1705309200|"
+            "billing=8,cpu=8,gres/gpu=4,mem=64G,node=1|8|1|64G|train|eval\n"
+            "12346|alice|high-priority|research|CANCELLED by 1001|0|Unknown|1705309200|cpu=2|2|1|4G|idle\n"
+            "\n"
+        )
+        first, second = parse_sacct_parsable(text)
+
+        assert first.job_id == 12345
+        assert first.name == "train|eval"
+        assert first.n_gpus == 4
+        assert first.n_cpus == 8
+        assert first.start_time == datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+        assert first.gpu_hours == 4.0
+        assert first.max_rss == 0
+
+        assert second.state == JobState.CANCELLED
+        assert second.n_gpus == 0
+        assert second.start_time == datetime.min.replace(tzinfo=UTC)
+
 
 class TestJobState:
     """Tests for JobState enum."""
@@ -162,6 +238,11 @@ class TestJobState:
         """Can parse states with 'by UID' suffix."""
         assert JobState.from_slurm("CANCELLED by 12345") == JobState.CANCELLED
 
+    def test_parse_unrecognised_state(self) -> None:
+        """Unknown or empty state strings map to UNKNOWN."""
+        assert JobState.from_slurm("SOMETHING_NEW") == JobState.UNKNOWN
+        assert JobState.from_slurm("") == JobState.UNKNOWN
+
     def test_problematic_states(self) -> None:
         """Correctly identifies problematic states."""
         assert JobState.FAILED.is_problematic
@@ -189,6 +270,10 @@ class TestQuotaStatus:
         assert QuotaStatus.from_usage(1.0, warning=0.8, critical=1.0) == QuotaStatus.EXCEEDED
         assert QuotaStatus.from_usage(1.5, warning=0.8, critical=1.0) == QuotaStatus.EXCEEDED
 
+    def test_critical_wins_over_higher_warning(self) -> None:
+        """Usage over critical is exceeded even when the warning threshold is set higher."""
+        assert QuotaStatus.from_usage(1.1, warning=1.2, critical=1.0) == QuotaStatus.EXCEEDED
+
 
 class TestUsageReport:
     """Tests for UsageReport dataclass."""
@@ -227,16 +312,26 @@ class TestQuotaChecker:
         """QuotaChecker with sample config."""
         return QuotaChecker(cluster_config)
 
-    def test_calculate_usage_from_records(self, checker: QuotaChecker) -> None:
+    def test_report_without_any_qos_raises(self) -> None:
+        """A cluster with no QoS configured needs an explicit qos."""
+        checker = QuotaChecker(ClusterConfig(name="Bare", qos=[]))
+        with pytest.raises(ValueError, match="No QoS"):
+            checker.generate_report("alice", [])
+        assert checker.generate_report("alice", [], qos="normal").qos == "normal"
+
+    def test_calculate_usage_from_records(self, checker: QuotaChecker, sample_records: tuple[JobRecord, ...]) -> None:
         """Can calculate total GPU-hours from job records."""
-        records = parse_sacct_json(SAMPLE_SACCT_OUTPUT.model_dump())
-        total = checker.calculate_gpu_hours(records)
+        total = checker.calculate_gpu_hours(list(sample_records))
 
         # Job 1: 4 GPUs * 2h = 8 GPU-hours
         # Job 2: 2 GPUs * 1h = 2 GPU-hours
         # Total: 10 GPU-hours
         assert total == pytest.approx(10.0)
 
+        empty_total = checker.calculate_gpu_hours([])
+        assert empty_total == 0.0
+        assert isinstance(empty_total, float)
+
     def test_filter_records_by_time(self, checker: QuotaChecker) -> None:
         """Can filter records within time window."""
         now = datetime.now(tz=UTC)
@@ -270,6 +365,14 @@ class TestQuotaChecker:
         assert len(filtered) == 1
         assert filtered[0].job_id == 2
 
+        # An explicit "now" 40 days back puts the old job inside the window instead
+        past = now - timedelta(days=40)
+        assert [record.job_id for record in checker.filter_by_window(records, now=past)] == [1, 2]
+        assert checker.generate_report("alice", records, now=past).used_gpu_hours == pytest.approx(8.0)
+
+        # Records sorted by start time can be cut at the boundary directly
+        assert checker.filter_by_window(records, presorted=True) == filtered
+
     def test_generate_report(self, checker: QuotaChecker) -> None:
         """Can generate a usage report."""
         now = datetime.now(tz=UTC)
@@ -307,6 +410,42 @@ class TestQuotaChecker:
         assert report.remaining_gpu_hours == pytest.approx(490.0)
         assert report.status == QuotaStatus.OK
 
+    def test_generate_report_filters_user_qos_and_window(self, checker: QuotaChecker) -> None:
+        """Only the user's jobs in the target QoS and rolling window count towards usage."""
+        now = datetime.now(tz=UTC)
+
+        def job(job_id: int, user: str, qos: str, days_ago: int, state: JobState) -> JobRecord:
+            start = now - timedelta(days=days_ago)
+            return JobRecord(
+                job_id=job_id,
+                name="job",
+                user=user,
+                qos=qos,
+                n_gpus=1,
+                elapsed_seconds=3600,
+                start_time=start,
+                submission_time=start,
+                state=state,
+            )
+
+        records = [
+            job(1, "alice", "high-priority", 1, JobState.RUNNING),
+            job(2, "alice", "high-priority", 3, JobState.COMPLETED),
+            job(3, "bob", "high-priority", 1, JobState.RUNNING),
+            job(4, "alice", "normal", 1, JobState.RUNNING),
+            job(5, "alice", "high-priority", 45, JobState.COMPLETED),
+        ]
+        report = checker.generate_report("alice", records)
+
+        assert report.used_gpu_hours == pytest.approx(2.0)
+        assert [record.job_id for record in report.active_jobs] == [1]
+
+        reports = checker.generate_reports(records)
+        assert set(reports) == {"alice", "bob"}
+        assert reports["alice"] == report
+        assert reports["bob"] == checker.generate_report("bob", records)
+        assert checker.generate_reports(records, users=["carol"])["carol"].used_gpu_hours == 0
+
     def test_forecast_quota(self, checker: QuotaChecker) -> None:
         """Can forecast quota availability at future times."""
         now = datetime.now(tz=UTC)
@@ -334,21 +473,48 @@ class TestQuotaChecker:
         # After 24h, the job should be outside the 30-day window
         assert forecast[24] >= forecast[48]  # Usage should decrease or stay same
 
+    def test_forecast_quota_per_horizon(self, checker: QuotaChecker) -> None:
+        """Each horizon only drops the jobs that will have left the window by then."""
+        now = datetime.now(tz=UTC)
+
+        def job(job_id: int, days_ago: float, n_gpus: int, qos: str = "high-priority") -> JobRecord:
+            start = now - timedelta(days=days_ago)
+            return JobRecord(
+                job_id=job_id,
+                name="job",
+                user="alice",
+                qos=qos,
+                n_gpus=n_gpus,
+                elapsed_seconds=3600,
+                start_time=start,
+                submission_time=start,
+                state=JobState.COMPLETED,
+            )
+
+        # Unsorted on purpose; the normal-QoS job never counts
+        records = [job(1, 10, 1), job(2, 29.8, 100), job(3, 28.5, 10), job(4, 29.8, 1000, qos="normal")]
+        forecast = checker.forecast_quota("alice", records, hours_ahead=[1, 12, 48, 24 * 25])
+
+        assert forecast[1] == pytest.approx(500 - 111)
+        assert forecast[12] == pytest.approx(500 - 11)
+        assert forecast[48] == pytest.approx(500 - 1)
+        assert forecast[24 * 25] == pytest.approx(500)
+
 
 class TestQuotaCheckerWithMockedSlurm:
     """Tests that mock Slurm commands."""
 
     @pytest.fixture
     def mock_sacct(self, monkeypatch: pytest.MonkeyPatch) -> None:
-        """Mock subprocess.run for sacct command."""
-        import subprocess
+        """Mock subprocess.run for sacct command; any other command raises KeyError."""
+        # Bytes, as the real --json query returns (it runs without text=True)
+        sacct_done = subprocess.CompletedProcess(
+            ["sacct"], 0, stdout=SAMPLE_SACCT_OUTPUT.model_dump_json().encode(), stderr=b""
+        )
+        handlers = {"sacct": lambda _cmd, **_: sacct_done}
 
         def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
-            if cmd[0] == "sacct":
-                output = SAMPLE_SACCT_OUTPUT.model_dump_json()
-                return subprocess.CompletedProcess(cmd, returncode=0, stdout=output, stderr="")
-            msg = f"Unexpected command: {cmd}"
-            raise ValueError(msg)
+            return handlers[cmd[0]](cmd, **kwargs)
 
         monkeypatch.setattr(subprocess, "run", mock_run)
 
@@ -369,3 +535,225 @@ class TestQuotaCheckerWithMockedSlurm:
         return ClusterConfig(
             name="Stella", account="research", qos=["high-priority"], quota_limit=500, rolling_window_days=30
         )
+
+    def test_fetch_reuses_recent_identical_query(
+        self, monkeypatch: pytest.MonkeyPatch, cluster_config: ClusterConfig
+    ) -> None:
+        """With use_cache, an identical query on the same cluster within the TTL is served from the cache."""
+        from slurmq.core.quota import fetch_all_jobs, fetch_user_jobs
+
+        calls: list[list[str]] = []
+
+        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+            calls.append(cmd)
+            if "-P" in cmd:
+                stdout = "".join(
+                    f"{job_id}|alice|high-priority|research|COMPLETED|3600|1705312800|1705309200|gres/gpu=4|8|1|64G|x\n"
+                    for job_id in (12345, 12346)
+                )
+            else:
+                stdout = SAMPLE_SACCT_OUTPUT.model_dump_json()
+            return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+
+        first = fetch_user_jobs("alice", cluster_config, use_cache=True)
+        first.clear()  # callers get their own list
+        assert len(fetch_user_jobs("alice", cluster_config, use_cache=True)) == 2
+        assert len(calls) == 1
+
+        fetch_user_jobs("alice", cluster_config)  # caching is opt-in
+        fetch_user_jobs("bob", cluster_config, use_cache=True)
+        assert len(calls) == 3
+
+        # Same sacct command line, but another configured cluster: not served from the cache
+        renamed = cluster_config.model_copy(update={"name": "Other"})
+        fetch_user_jobs("alice", renamed, use_cache=True)
+        assert len(calls) == 4
+
+        by_user = fetch_all_jobs(["alice", "carol"], cluster_config, use_cache=True)
+        assert [record.job_id for record in by_user["alice"]] == [12345, 12346]
+        assert by_user["carol"] == []
+        assert "--allusers" in calls[-1]
+
+    def test_fetch_cache_is_bounded_and_skipped_without_use_cache(
+        self, monkeypatch: pytest.MonkeyPatch, cluster_config: ClusterConfig
+    ) -> None:
+        """Uncached fetches store nothing, and the cache keeps at most FETCH_CACHE_MAX_ENTRIES queries."""
+        from slurmq.core import quota
+
+        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+            return subprocess.CompletedProcess(cmd, 0, stdout=SAMPLE_SACCT_OUTPUT.model_dump_json(), stderr="")
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr(quota, "FETCH_CACHE_MAX_ENTRIES", 2)
+
+        quota.fetch_user_jobs("alice", cluster_config)
+        assert not quota._fetch_cache
+
+        for user in ("alice", "bob", "carol"):
+            quota.fetch_user_jobs(user, cluster_config, use_cache=True)
+        assert [key[-1] for key in quota._fetch_cache] == ["bob", "carol"]
+
+    def test_fetch_all_clusters_runs_queries_concurrently(
+        self, monkeypatch: pytest.MonkeyPatch, cluster_config: ClusterConfig
+    ) -> None:
+        """Each cluster gets its own sacct query, and all are started before any finishes."""
+        from slurmq.core.quota import fetch_all_clusters
+
+        started: list[tuple[str, ...]] = []
+        all_started = asyncio.Event()
+
+        class FakeProcess:
+            returncode = 0
+
+            async def communicate(self) -> tuple[bytes, bytes]:
+                await all_started.wait()
+                return SAMPLE_SACCT_OUTPUT.model_dump_json().encode(), b""
+
+        async def mock_exec(*cmd: str, **kwargs) -> FakeProcess:
+            started.append(cmd)
+            if len(started) == 2:
+                all_started.set()
+            return FakeProcess()
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", mock_exec)
+
+        other = cluster_config.model_copy(update={"name": "Other", "slurm_cluster": "other"})
+        by_cluster = fetch_all_clusters("alice", {"stella": cluster_config, "other": other})
+
+        assert list(by_cluster) == ["stella", "other"]
+        assert [record.job_id for record in by_cluster["other"]] == [12345, 12346]
+        assert not any(arg.startswith("--clusters") for arg in started[0])
+        assert "--clusters=other" in started[1]
+
+    def test_fetch_falls_back_when_sacct_lacks_json(
+        self, monkeypatch: pytest.MonkeyPatch, cluster_config: ClusterConfig
+    ) -> None:
+        """A sacct without --json is detected once; later fetches go straight to -P output."""
+        from slurmq.core.quota import fetch_user_jobs
+
+        calls: list[list[str]] = []
+
+        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+            calls.append(cmd)
+            if "--json" in cmd:
+                raise subprocess.CalledProcessError(1, cmd, b"", b"sacct: unrecognized option '--json'")
+            stdout = "12345|alice|high-priority|research|COMPLETED|3600|1705312800|1705309200|gres/gpu=4|8|1|64G|x\n"
+            return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+
+        assert [record.job_id for record in fetch_user_jobs("alice", cluster_config)] == [12345]
+        assert [record.job_id for record in fetch_user_jobs("bob", cluster_config)] == [12345]
+        assert ["--json" in cmd for cmd in calls] == [True, False, False]
+
+        with pytest.raises(subprocess.CalledProcessError):
+            fetch_user_jobs("alice", cluster_config, parsable=False, use_cache=False)
+
+    def test_fetch_all_clusters_falls_back_when_sacct_lacks_json(
+        self, monkeypatch: pytest.MonkeyPatch, cluster_config: ClusterConfig
+    ) -> None:
+        """The async fetch retries with -P output, like fetch_user_jobs, when sacct rejects --json."""
+        from slurmq.core.quota import fetch_all_clusters
+
+        started: list[tuple[str, ...]] = []
+
+        class FakeProcess:
+            def __init__(self, cmd: tuple[str, ...]) -> None:
+                self.returncode = 1 if "--json" in cmd else 0
+
+            async def communicate(self) -> tuple[bytes, bytes]:
+                if self.returncode:
+                    return b"", b"sacct: unrecognized option '--json'"
+                return (
+                    b"12345|alice|high-priority|research|COMPLETED|3600|1705312800|1705309200|gres/gpu=4|8|1|64G|x\n",
+                    b"",
+                )
+
+        async def mock_exec(*cmd: str, **kwargs) -> FakeProcess:
+            started.append(cmd)
+            return FakeProcess(cmd)
+
+        monkeypatch.setattr(asyncio, "create_subprocess_exec", mock_exec)
+
+        by_cluster = fetch_all_clusters("alice", {"stella": cluster_config})
+
+        assert [record.job_id for record in by_cluster["stella"]] == [12345]
+        assert ["--json" in cmd for cmd in started] == [True, False]
+
+    def test_fetch_jobs_by_ids_batches_sacct_calls(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Job IDs are looked up in batches, with duplicates removed."""
+        from slurmq.core import quota
+
+        calls: list[list[str]] = []
+
+        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+            calls.append(cmd)
+            return subprocess.CompletedProcess(
+                cmd, 0, stdout=SAMPLE_SACCT_OUTPUT.model_dump_json().encode(), stderr=b""
+            )
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr(quota, "JOB_ID_BATCH_SIZE", 2)
+
+        records = quota.fetch_jobs_by_ids([12345, 12346, 12345, 7])
+        assert [call[-1] for call in calls] == ["12345,12346", "7"]
+        assert [record.job_id for record in records] == [12345, 12346]
+        assert quota.fetch_jobs_by_ids([]) == []
+        assert len(calls) == 2
+
+    def test_fetch_jobs_by_ids_falls_back_when_sacct_lacks_json(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Job ID lookups retry with -P output, like fetch_user_jobs, when sacct rejects --json."""
+        from slurmq.core import quota
+
+        calls: list[list[str]] = []
+
+        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+            calls.append(cmd)
+            if "--json" in cmd:
+                raise subprocess.CalledProcessError(1, cmd, b"", b"sacct: unrecognized option '--json'")
+            stdout = "12345|alice|high-priority|research|COMPLETED|3600|1705312800|1705309200|gres/gpu=4|8|1|64G|x\n"
+            return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr="")
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+
+        assert [record.job_id for record in quota.fetch_jobs_by_ids([12345])] == [12345]
+        assert [("--json" in cmd, cmd[-1]) for cmd in calls] == [(True, "12345"), (False, "12345")]
+
+    def test_cancel_jobs_batches_scancel_calls(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Jobs are cancelled in batches; a failing batch doesn't stop the rest."""
+        from slurmq.core import quota
+
+        calls: list[list[str]] = []
+
+        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+            calls.append(cmd)
+            if "1" in cmd:
+                raise subprocess.CalledProcessError(1, cmd)
+            return subprocess.CompletedProcess(cmd, 0)
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        monkeypatch.setattr(quota, "JOB_ID_BATCH_SIZE", 2)
+
+        assert quota.cancel_jobs([1, 2, 3]) is False
+        assert calls == [["scancel", "-Q", "1", "2"], ["scancel", "-Q", "3"]]
+        assert quota.cancel_job(3, quiet=False) is True
+        assert calls[-1] == ["scancel", "3"]
+        assert quota.cancel_jobs([]) is True
+        assert len(calls) == 3
+
+    def test_fetch_reads_sacct_output_as_bytes(
+        self, monkeypatch: pytest.MonkeyPatch, cluster_config: ClusterConfig
+    ) -> None:
+        """The parser receives sacct stdout as undecoded bytes."""
+        from slurmq.core.quota import fetch_user_jobs
+
+        def mock_run(cmd: list[str], **kwargs) -> subprocess.CompletedProcess:
+            assert not kwargs.get("text")
+            return subprocess.CompletedProcess(
+                cmd, 0, stdout=SAMPLE_SACCT_OUTPUT.model_dump_json().encode(), stderr=b""
+            )
+
+        monkeypatch.setattr(subprocess, "run", mock_run)
+        assert [record.job_id for record in fetch_user_jobs("alice", cluster_config)] == [12345, 12346]
@@ -13,19 +13,25 @@ NOT `-S=value`. The `=` syntax only works with GNU long options (--starttime=val
 
 from __future__ import annotations
 
-from collections.abc import Generator
-import re
-from unittest.mock import MagicMock, patch
+from collections.abc import Callable
+from contextlib import suppress
+import subprocess
+from unittest.mock import MagicMock
 
 import pytest
 
+from slurmq.cli.commands.stats import fetch_partition_data
 from slurmq.core.config import ClusterConfig
+from slurmq.core.quota import fetch_user_jobs
 
 
-# Regex pattern to detect invalid short option syntax: -X=value where X is a single letter
-# Valid: -S, --starttime=value, -Svalue, -S value
-# Invalid: -S=value, -E=now, -u=alice
-INVALID_SHORT_OPT_PATTERN = re.compile(r"^-[a-zA-Z]=")
+def is_short_opt_with_equals(arg: str) -> bool:
+    """Whether arg is the invalid short option syntax -X=value, where X is a single ASCII letter.
+
+    Valid: -S, --starttime=value, -Svalue, -S value
+    Invalid: -S=value, -E=now, -u=alice
+    """
+    return arg[2:3] == "=" and arg[0] == "-" and arg[1].isascii() and arg[1].isalpha()
 
 
 def assert_no_short_opt_equals(cmd: list[str], context: str = "") -> None:
@@ -36,164 +42,147 @@ def assert_no_short_opt_equals(cmd: list[str], context: str = "") -> None:
         context: Optional context for error message
     """
     for arg in cmd:
-        if INVALID_SHORT_OPT_PATTERN.match(arg):
-            pytest.fail(f"Invalid short option syntax '{arg}' - use '-X value' not '-X=value'. Context: {context}")
+        # Most tokens are option values (dates, users, formats); skip them without a call
+        if arg[:1] != "-":
+            continue
+        assert not is_short_opt_with_equals(arg), (
+            f"Invalid short option syntax '{arg}' - use '-X value' not '-X=value'. Context: {context}"
+        )
 
 
-class TestFetchUserJobsCommand:
-    """Tests for fetch_user_jobs command construction."""
+def parse_flags(cmd: list[str]) -> dict[str, str | None]:
+    """Map each option in cmd to its value, in a single pass.
 
-    @pytest.fixture
-    def mock_subprocess(self) -> Generator[MagicMock, None, None]:
-        """Mock subprocess.run to capture commands."""
-        with patch("subprocess.run") as mock:
-            mock.return_value.stdout = '{"jobs": []}'
-            mock.return_value.returncode = 0
-            yield mock
+    `--long=value` maps to value, a short option followed by a non-option token
+    (`-S value`) maps to that token, and any other flag maps to None.
+    """
+    flags: dict[str, str | None] = {}
+    pending: str | None = None  # short option still waiting for its value
+    for arg in cmd[1:]:
+        if arg[:1] != "-":
+            if pending is not None:
+                flags[pending] = arg
+                pending = None
+            continue
+        pending = None
+        if arg[:2] == "--":
+            name, sep, value = arg.partition("=")
+            flags[name] = value if sep else None
+        else:
+            flags[arg] = None
+            pending = arg
+    return flags
+
+
+# sacct output with no jobs; a str, since fetch_partition_data runs sacct with text=True
+EMPTY_JOBS_JSON = '{"jobs": []}'
+
+
+@pytest.fixture
+def mock_subprocess(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Mock subprocess.run to capture commands (a fresh mock per test)."""
+    mock = MagicMock()
+    mock.return_value.stdout = EMPTY_JOBS_JSON
+    mock.return_value.returncode = 0
+    monkeypatch.setattr(subprocess, "run", mock)
+    return mock
+
+
+# Read-only: the sacct command builders never modify the cluster config
+CLUSTER_CONFIG = ClusterConfig(
+    name="Test Cluster",
+    account="research",
+    qos=["normal"],
+    partitions=["gpu"],
+    quota_limit=500,
+    rolling_window_days=30,
+)
+
+
+# (fetcher, args) for every sacct command the package builds
+SACCT_CALLS: list[tuple[Callable[..., object], tuple]] = [
+    (fetch_user_jobs, ("testuser", CLUSTER_CONFIG)),
+    (fetch_partition_data, (["gpu"], ["normal"], "2025-01-01", "2025-01-31")),
+    (fetch_partition_data, (["gpu"], ["normal"], "2025-01-01", "2025-01-31", "research")),
+]
+
+
+def test_all_sacct_commands_posix_compliant(mock_subprocess: MagicMock) -> None:
+    """No sacct command uses -X=value syntax for short options (all checked under one mock)."""
+    for fetch, args in SACCT_CALLS:
+        with suppress(Exception):  # We only care about the command construction
+            fetch(*args)
+
+    assert mock_subprocess.call_count == len(SACCT_CALLS)
+    for (fetch, _), call in zip(SACCT_CALLS, mock_subprocess.call_args_list, strict=True):
+        assert_no_short_opt_equals(call[0][0], fetch.__name__)
 
-    @pytest.fixture
-    def cluster_config(self) -> ClusterConfig:
-        """Create a cluster config for testing."""
-        return ClusterConfig(
-            name="Test Cluster",
-            account="research",
-            qos=["normal"],
-            partitions=["gpu"],
-            quota_limit=500,
-            rolling_window_days=30,
-        )
 
-    def test_fetch_user_jobs_no_equals_in_short_opts(
-        self, mock_subprocess: MagicMock, cluster_config: ClusterConfig
-    ) -> None:
-        """fetch_user_jobs must not use -X=value syntax for short options."""
-        from slurmq.core.quota import fetch_user_jobs
-
-        try:
-            fetch_user_jobs("testuser", cluster_config)
-        except Exception:
-            pass  # We only care about the command construction
+class TestFetchUserJobsCommand:
+    """Tests for fetch_user_jobs command construction."""
 
-        assert mock_subprocess.called
-        cmd = mock_subprocess.call_args[0][0]
-        assert_no_short_opt_equals(cmd, "fetch_user_jobs")
+    @pytest.fixture(scope="module")
+    def cluster_config(self) -> ClusterConfig:
+        """The shared test cluster config."""
+        return CLUSTER_CONFIG
 
     def test_fetch_user_jobs_s_and_e_are_separate_args(
         self, mock_subprocess: MagicMock, cluster_config: ClusterConfig
     ) -> None:
         """Verify -S and -E have their values as separate list elements."""
-        from slurmq.core.quota import fetch_user_jobs
-
-        try:
+        with suppress(Exception):
             fetch_user_jobs("testuser", cluster_config)
-        except Exception:
-            pass
 
         cmd = mock_subprocess.call_args[0][0]
+        flags = parse_flags(cmd)
 
-        # Find -S and verify next arg is the value (not attached with =)
-        if "-S" in cmd:
-            s_idx = cmd.index("-S")
-            assert s_idx + 1 < len(cmd), "-S must have a following argument"
-            assert not cmd[s_idx].startswith("-S="), "-S must not use = syntax"
-            assert "now-" in cmd[s_idx + 1] or "days" in cmd[s_idx + 1], "-S value should be time spec"
-
-        # Find -E and verify next arg is the value
-        if "-E" in cmd:
-            e_idx = cmd.index("-E")
-            assert e_idx + 1 < len(cmd), "-E must have a following argument"
-            assert not cmd[e_idx].startswith("-E="), "-E must not use = syntax"
+        # -S and -E must not use = syntax, so their values are the following args
+        assert_no_short_opt_equals(cmd, "fetch_user_jobs")
+        if "-S" in flags:
+            start = flags["-S"]
+            assert start is not None, "-S must have a following argument"
+            assert start.startswith("now-"), "-S value should be a relative time spec (now-Ndays)"
+        if "-E" in flags:
+            assert flags["-E"] is not None, "-E must have a following argument"
 
     def test_fetch_user_jobs_user_flag_format(self, mock_subprocess: MagicMock, cluster_config: ClusterConfig) -> None:
         """Verify -u flag uses proper format."""
-        from slurmq.core.quota import fetch_user_jobs
-
-        try:
+        with suppress(Exception):
             fetch_user_jobs("alice", cluster_config)
-        except Exception:
-            pass
 
-        cmd = mock_subprocess.call_args[0][0]
+        flags = parse_flags(mock_subprocess.call_args[0][0])
 
         # -u should be followed by username as separate arg
-        if "-u" in cmd:
-            u_idx = cmd.index("-u")
-            assert u_idx + 1 < len(cmd), "-u must have a following argument"
-            assert cmd[u_idx + 1] == "alice", "-u should be followed by username"
+        if "-u" in flags:
+            assert flags["-u"] == "alice", "-u should be followed by username"
 
 
 class TestFetchPartitionDataCommand:
     """Tests for stats.py fetch_partition_data command construction."""
 
-    @pytest.fixture
-    def mock_subprocess(self) -> Generator[MagicMock, None, None]:
-        """Mock subprocess.run to capture commands."""
-        with patch("subprocess.run") as mock:
-            mock.return_value.stdout = '{"jobs": []}'
-            mock.return_value.returncode = 0
-            yield mock
-
-    def test_fetch_partition_data_no_equals_in_short_opts(self, mock_subprocess: MagicMock) -> None:
-        """fetch_partition_data must not use -X=value syntax."""
-        from slurmq.cli.commands.stats import fetch_partition_data
-
-        try:
-            fetch_partition_data("gpu", "normal", "2025-01-01", "2025-01-31")
-        except Exception:
-            pass
-
-        assert mock_subprocess.called
-        cmd = mock_subprocess.call_args[0][0]
-        assert_no_short_opt_equals(cmd, "fetch_partition_data")
-
     def test_fetch_partition_data_s_and_e_are_separate_args(self, mock_subprocess: MagicMock) -> None:
         """Verify -S and -E have their values as separate list elements."""
-        from slurmq.cli.commands.stats import fetch_partition_data
-
-        try:
-            fetch_partition_data("gpu", "normal", "2025-01-01", "2025-01-31")
-        except Exception:
-            pass
-
-        cmd = mock_subprocess.call_args[0][0]
+        with suppress(Exception):
+            fetch_partition_data(["gpu"], ["normal"], "2025-01-01", "2025-01-31")
 
-        # -S should be separate from its value
-        assert "-S" in cmd, "Command should have -S flag"
-        s_idx = cmd.index("-S")
-        assert cmd[s_idx + 1] == "2025-01-01", "-S should be followed by start_date"
+        flags = parse_flags(mock_subprocess.call_args[0][0])
 
-        # -E should be separate from its value
-        assert "-E" in cmd, "Command should have -E flag"
-        e_idx = cmd.index("-E")
-        assert cmd[e_idx + 1] == "2025-01-31", "-E should be followed by end_date"
+        # -S and -E should be separate from their values
+        assert flags.get("-S") == "2025-01-01", "-S should be followed by start_date"
+        assert flags.get("-E") == "2025-01-31", "-E should be followed by end_date"
 
 
 class TestLongOptionsCanUseEquals:
     """Verify that long options (--flag=value) ARE allowed."""
 
-    @pytest.fixture
-    def mock_subprocess(self) -> Generator[MagicMock, None, None]:
-        """Mock subprocess.run."""
-        with patch("subprocess.run") as mock:
-            mock.return_value.stdout = '{"jobs": []}'
-            mock.return_value.returncode = 0
-            yield mock
-
     def test_long_options_with_equals_are_valid(self, mock_subprocess: MagicMock) -> None:
         """Long options like --qos=value, --partition=value are valid."""
-        from slurmq.cli.commands.stats import fetch_partition_data
-
-        try:
-            fetch_partition_data("gpu", "normal", "2025-01-01", "2025-01-31", "research")
-        except Exception:
-            pass
-
-        cmd = mock_subprocess.call_args[0][0]
+        with suppress(Exception):
+            fetch_partition_data(["gpu"], ["normal"], "2025-01-01", "2025-01-31", "research")
 
-        # These long options with = ARE valid
-        long_opts_with_equals = [arg for arg in cmd if arg.startswith("--") and "=" in arg]
-        assert len(long_opts_with_equals) > 0, "Long options should use --flag=value syntax"
+        flags = parse_flags(mock_subprocess.call_args[0][0])
 
-        # Verify the pattern: --partition=gpu, --qos=normal, --account=research
-        for opt in long_opts_with_equals:
-            assert opt.startswith("--"), f"Long option {opt} should start with --"
+        # These long options with = ARE valid: --partition=gpu, --qos=normal, --account=research
+        assert flags.get("--partition") == "gpu", "Long options should use --flag=value syntax"
+        assert flags.get("--qos") == "normal"
+        assert flags.get("--account") == "research"